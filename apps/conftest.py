@@ -4,6 +4,11 @@ from rest_framework.test import APIClient
 from users.tests.factories import UserFactory
 
 
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    settings.QUERY_BUDGETS_STRICT = True
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -0,0 +1,87 @@
+from django.db.models import Case, Count, DateField, F, FloatField, Sum, Value, When
+from django.db.models.functions import Cast, Lower, Trim, TruncWeek
+
+from workouts.models import ExercisePlan
+
+KILOGRAMS = "kg"
+POUNDS = "lb"
+
+# Kilograms per unit of the spellings accepted in `weight_measure_unit`,
+# which is free text. Plans without a unit are taken as kilograms.
+KILOGRAMS_PER_UNIT = {
+    "": 1.0,
+    "kg": 1.0,
+    "kgs": 1.0,
+    "kilogram": 1.0,
+    "kilograms": 1.0,
+    "lb": 0.45359237,
+    "lbs": 0.45359237,
+    "pound": 0.45359237,
+    "pounds": 0.45359237,
+}
+
+
+def get_unit_factor(target_unit):
+    """
+    Expression of the factor that converts the weight of a plan from its
+    own unit, normalized in the `stored_unit` alias, to `target_unit`.
+    Spellings of the same unit share a single branch.
+    """
+    spellings = {}
+    for spelling, kilograms in KILOGRAMS_PER_UNIT.items():
+        spellings.setdefault(kilograms, []).append(spelling)
+
+    return Case(
+        *[
+            When(
+                stored_unit__in=names,
+                then=Value(kilograms / KILOGRAMS_PER_UNIT[target_unit]),
+            )
+            for kilograms, names in spellings.items()
+        ],
+        output_field=FloatField(),
+    )
+
+
+def get_volume_by_week(user, unit=KILOGRAMS, start=None, end=None):
+    """
+    Total volume, sets × reps × weight in `unit`, of the exercise plans of
+    `user` per week, exercise and category, in one grouped query. Plans
+    missing any of those or with an unknown unit are left out, and weeks
+    start on Monday and are the ones the plans were created in.
+    """
+    plans = ExercisePlan.objects.filter(
+        workout__user=user,
+        sets__isnull=False,
+        reps__isnull=False,
+        weight__isnull=False,
+    )
+    if start:
+        plans = plans.filter(created_at__gte=start)
+    if end:
+        plans = plans.filter(created_at__lt=end)
+
+    return (
+        plans.alias(stored_unit=Lower(Trim("weight_measure_unit")))
+        .filter(stored_unit__in=KILOGRAMS_PER_UNIT)
+        .values(
+            "exercise",
+            week=TruncWeek("created_at", output_field=DateField()),
+            exercise_name=F("exercise__name"),
+            category=F("exercise__category"),
+            category_name=F("exercise__category__name"),
+        )
+        .annotate(
+            plans=Count("pk"),
+            volume=Sum(
+                # Cast first, as the product of the integer columns could
+                # overflow them.
+                Cast("sets", FloatField())
+                * Cast("reps", FloatField())
+                * Cast("weight", FloatField())
+                * get_unit_factor(unit),
+                output_field=FloatField(),
+            ),
+        )
+        .order_by("-week", "category_name", "exercise_name")
+    )
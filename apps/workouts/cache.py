@@ -0,0 +1,99 @@
+import time
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class CatalogCache:
+    """
+    Versioned cache for the read-only exercise catalog.
+
+    Entries live in a process-local LRU in front of a shared Django cache
+    backend. Every entry is keyed by the current catalog version, so bumping
+    the version invalidates all of them at once in every process.
+    """
+
+    version_key = "workouts:catalog:version"
+    key_prefix = "workouts:catalog"
+
+    def __init__(self, alias=None, timeout=None, maxsize=None):
+        self.alias = alias or getattr(settings, "CATALOG_CACHE_ALIAS", "default")
+        self.timeout = timeout or getattr(settings, "CATALOG_CACHE_TIMEOUT", 60 * 60)
+        self.maxsize = maxsize or getattr(settings, "CATALOG_CACHE_MAXSIZE", 256)
+
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get_version(self):
+        version = self.backend.get(self.version_key)
+        if version is None:
+            # A time based seed avoids reusing the version of entries that
+            # may still be stored when the counter itself has been evicted.
+            self.backend.add(self.version_key, time.time_ns(), timeout=None)
+            version = self.backend.get(self.version_key)
+
+        return version
+
+    def bump_version(self):
+        try:
+            version = self.backend.incr(self.version_key)
+        except ValueError:
+            version = time.time_ns()
+            self.backend.set(self.version_key, version, timeout=None)
+
+        with self._lock:
+            self._local.clear()
+
+        return version
+
+    def get_or_set(self, key, default):
+        version = self.get_version()
+        cache_key = f"{self.key_prefix}:{version}:{key}"
+
+        with self._lock:
+            if cache_key in self._local:
+                self._local.move_to_end(cache_key)
+                self._stats["local_hits"] += 1
+                return self._local[cache_key]
+
+        value = self.backend.get(cache_key)
+        if value is not None:
+            self._set_local(cache_key, value, "shared_hits")
+            return value
+
+        value = default()
+        self.backend.set(cache_key, value, timeout=self.timeout)
+        self._set_local(cache_key, value, "misses")
+        return value
+
+    def _set_local(self, cache_key, value, stat):
+        with self._lock:
+            self._stats[stat] += 1
+            self._local[cache_key] = value
+            self._local.move_to_end(cache_key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def clear(self):
+        self.bump_version()
+        with self._lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "local_size": len(self._local),
+                "version": self.get_version(),
+            }
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,82 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Lookup
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.translation import gettext_lazy as _
+
+
+def week_days_to_mask(week_days):
+    return sum(1 << day for day in set(week_days))
+
+
+def mask_to_week_days(mask):
+    return [day for day in range(7) if mask & (1 << day)]
+
+
+class WeekDaysAttribute(DeferredAttribute):
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = self.field.to_python(value)
+
+
+class WeekDaysField(models.PositiveSmallIntegerField):
+    """
+    Days of the week, 0 being Monday, stored as a bitmask with the bit of
+    each day set. In Python values are sorted lists of days, whatever the
+    order and repetitions they are assigned with, as the mask has neither.
+    """
+
+    description = _("Days of the week")
+    descriptor_class = WeekDaysAttribute
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return mask_to_week_days(value)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        if isinstance(value, (list, tuple, set)):
+            return sorted(set(value))
+        return mask_to_week_days(super().to_python(value))
+
+    def get_prep_value(self, value):
+        if isinstance(value, (list, tuple, set)):
+            return week_days_to_mask(value)
+        return super().get_prep_value(value)
+
+    def value_to_string(self, obj):
+        return str(self.get_prep_value(self.value_from_object(obj)))
+
+    def validate(self, value, model_instance):
+        super().validate(value, model_instance)
+        if value and any(day not in range(7) for day in value):
+            raise ValidationError(
+                _("Week days must be between 0 and 6."), code="invalid"
+            )
+
+    def run_validators(self, value):
+        super().run_validators(self.get_prep_value(value))
+
+
+@WeekDaysField.register_lookup
+class HasDay(Lookup):
+    """
+    `week_days__has_day=day` matches the rows whose mask has the bit of `day`
+    set. A bitwise test can't narrow an index scan, so it is applied as a
+    filter on the rows found by the other conditions, e.g. `minute_of_day`
+    on the `(minute_of_day, week_days)` index, which can still check it
+    without reading the table.
+    """
+
+    lookup_name = "has_day"
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        return 1 << self.rhs
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        sql = connection.ops.combine_expression("&", [lhs, rhs])
+        return f"{sql} <> 0", [*lhs_params, *rhs_params]
@@ -0,0 +1,115 @@
+import random
+import statistics
+import time
+import datetime
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import User
+from workouts.models import RecurringWorkoutAlert, ScheduledWorkoutDate, Workout
+from workouts.occurrences import get_window_end, get_window_start, materialize_window
+from workouts.views.calendar_views import CalendarViews
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the calendar endpoint for a synthetic user. The data is created "
+        "in a transaction that is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workouts", type=int, default=300)
+        parser.add_argument("--alerts-per-workout", type=int, default=2)
+        parser.add_argument("--dates-per-workout", type=int, default=5)
+        parser.add_argument(
+            "--days",
+            type=int,
+            nargs="+",
+            default=[7, 31, 90],
+            help="Widths of the requested ranges, in days.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def create_data(self, options):
+        now = timezone.now()
+        user = User.objects.create_user(
+            email=f"calendar-benchmark-{now.timestamp()}@example.com",
+            first_name="Calendar",
+            last_name="Benchmark",
+            password="benchmark",
+        )
+        workouts = Workout.objects.bulk_create(
+            Workout(name=f"Workout {index}", user=user)
+            for index in range(options["workouts"])
+        )
+
+        alerts = []
+        for workout in workouts:
+            for _ in range(options["alerts_per_workout"]):
+                alert_time = datetime.time(random.randrange(24), random.randrange(60))
+                week_days = random.sample(range(7), random.randint(1, 7))
+                # bulk_create skips save(), which keeps minute_of_day in sync.
+                alerts.append(
+                    RecurringWorkoutAlert(
+                        time=alert_time,
+                        week_days=week_days,
+                        minute_of_day=alert_time.hour * 60 + alert_time.minute,
+                        workout=workout,
+                    )
+                )
+        RecurringWorkoutAlert.objects.bulk_create(alerts)
+
+        ScheduledWorkoutDate.objects.bulk_create(
+            ScheduledWorkoutDate(
+                datetime=now + timedelta(minutes=random.randrange(-30, 120) * 1440),
+                workout=workout,
+            )
+            for workout in workouts
+            for _ in range(options["dates_per_workout"])
+        )
+        materialize_window(get_window_start(), get_window_end())
+
+        return user
+
+    def time_request(self, user, start, end):
+        request = APIRequestFactory().get(
+            "/api/calendar/", {"from": start.isoformat(), "to": end.isoformat()}
+        )
+        force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            started_at = time.perf_counter()
+            response = CalendarViews.as_view({"get": "list"})(request)
+            if response.streaming:
+                size = sum(len(chunk) for chunk in response.streaming_content)
+            else:
+                size = len(response.render().content)
+            duration = time.perf_counter() - started_at
+
+        return duration, len(queries), size
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        user = self.create_data(options)
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        for days in options["days"]:
+            timings = [
+                self.time_request(user, start, start + timedelta(days=days))
+                for _ in range(options["repeat"])
+            ]
+            durations = [duration for duration, _, _ in timings]
+            _, queries, size = timings[-1]
+
+            self.stdout.write(
+                f"{days} days: median {statistics.median(durations) * 1000:.1f}ms, "
+                f"min {min(durations) * 1000:.1f}ms, {queries} queries, "
+                f"{size / 1024:.1f}KiB"
+            )
+
+        transaction.set_rollback(True)
@@ -0,0 +1,351 @@
+import json
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import User
+from workout_tracker.celery import app as celery_app
+from workouts import tasks
+from workouts.models import (
+    Exercise,
+    ExercisePlan,
+    RecurringWorkoutAlert,
+    ScheduledWorkoutDate,
+    Workout,
+    WorkoutComment,
+)
+from workouts.notifications import InMemoryBackend
+from workouts.occurrences import (
+    materialize_recurring_alerts,
+    materialize_scheduled_dates,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time every endpoint of the workouts app and the notification tasks "
+        "against the existing data, e.g. the one of generate_load_data. "
+        "Changes are rolled back, and results can be saved as a baseline or "
+        "compared with one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Email of the user making the requests. Defaults to the user "
+            "with the most workouts.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--bulk-items",
+            type=int,
+            default=20,
+            help="Items sent to each request of the bulk endpoints.",
+        )
+        parser.add_argument(
+            "--task-items",
+            type=int,
+            default=500,
+            help="Scheduled dates and recurring alerts made due for the tasks.",
+        )
+        parser.add_argument("--save-baseline", help="Write the results to a file.")
+        parser.add_argument(
+            "--compare", help="Fail if the results regress from this baseline."
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Accepted slowdown over the baseline median, 0.25 being 25%%.",
+        )
+
+    def get_user(self, email):
+        users = User.objects.all()
+        if email:
+            users = users.filter(email=email)
+
+        user = (
+            users.annotate(workout_count=Count("workouts"))
+            .order_by("-workout_count")
+            .first()
+        )
+        if user is None:
+            raise CommandError("No user found, run generate_load_data first.")
+
+        return user
+
+    def get_sample(self, model, **filters):
+        sample = model.objects.filter(**filters).first()
+        if sample is None:
+            raise CommandError(
+                f"The user has no {model._meta.verbose_name}, pick another one "
+                "with --user."
+            )
+
+        return sample
+
+    def get_cases(self, user, bulk_items):
+        """Return `(method, url name, url kwargs, data)` for every endpoint."""
+        now = timezone.now()
+        workouts = user.workouts.all()
+
+        workout = self.get_sample(Workout, user=user)
+        plan = self.get_sample(ExercisePlan, workout__in=workouts)
+        comment = self.get_sample(WorkoutComment, workout__in=workouts)
+        date = self.get_sample(ScheduledWorkoutDate, workout__in=workouts)
+        alert = self.get_sample(RecurringWorkoutAlert, workout__in=workouts)
+        exercise = self.get_sample(Exercise)
+
+        workout_data = {"name": "Benchmark", "description": "Benchmark workout"}
+        cases = [
+            ("GET", "exercise-categories-list", {}, None),
+            ("GET", "exercise-categories-cache-stats", {}, None),
+            (
+                "GET",
+                "exercise-categories-exercises",
+                {"pk": exercise.category_id},
+                None,
+            ),
+            ("GET", "workouts-list", {}, None),
+            ("POST", "workouts-list", {}, workout_data),
+            ("GET", "workouts-stats", {}, None),
+            ("GET", "workouts-detail", {"pk": workout.pk}, None),
+            ("PUT", "workouts-detail", {"pk": workout.pk}, workout_data),
+            ("PATCH", "workouts-detail", {"pk": workout.pk}, {"name": "Benchmark"}),
+            ("DELETE", "workouts-detail", {"pk": workout.pk}, None),
+            (
+                "GET",
+                "calendar-list",
+                {},
+                {
+                    "from": now.isoformat(),
+                    "to": (now + timedelta(days=31)).isoformat(),
+                },
+            ),
+            ("GET", "analytics-volume", {}, None),
+        ]
+
+        nested = [
+            (
+                "exercise-plans",
+                plan,
+                {
+                    "name": "Benchmark",
+                    "exercise": str(exercise.pk),
+                    "sets": 4,
+                    "reps": 10,
+                    "weight": 40,
+                    "weight_measure_unit": "kg",
+                },
+                {"sets": 5},
+            ),
+            ("comments", comment, {"comment": "Benchmark comment"}, None),
+            (
+                "scheduled-dates",
+                date,
+                {"datetime": (now + timedelta(days=1)).isoformat()},
+                {"datetime": (now + timedelta(days=2)).isoformat()},
+            ),
+            (
+                "recurring-alerts",
+                alert,
+                {"time": "07:30", "week_days": [0, 2, 4]},
+                {"time": "06:15"},
+            ),
+        ]
+        for basename, item, data, partial_data in nested:
+            list_kwargs = {"workout_pk": item.workout_id}
+            detail_kwargs = {**list_kwargs, "pk": item.pk}
+            partial_data = partial_data or data
+
+            cases += [
+                ("GET", f"{basename}-list", list_kwargs, None),
+                ("POST", f"{basename}-list", list_kwargs, data),
+                ("GET", f"{basename}-detail", detail_kwargs, None),
+                ("PUT", f"{basename}-detail", detail_kwargs, data),
+                ("PATCH", f"{basename}-detail", detail_kwargs, partial_data),
+                ("DELETE", f"{basename}-detail", detail_kwargs, None),
+            ]
+
+            if basename == "comments":
+                continue
+
+            ids = [
+                str(pk)
+                for pk in item.__class__.objects.filter(
+                    workout_id=item.workout_id
+                ).values_list("pk", flat=True)[:bulk_items]
+            ]
+            cases += [
+                ("POST", f"{basename}-bulk", list_kwargs, [data] * bulk_items),
+                (
+                    "PATCH",
+                    f"{basename}-bulk",
+                    list_kwargs,
+                    [{"id": pk, **partial_data} for pk in ids],
+                ),
+                ("DELETE", f"{basename}-bulk", list_kwargs, ids),
+            ]
+
+        return cases
+
+    def time_request(self, user, method, name, kwargs, data):
+        path = reverse(name, kwargs=kwargs)
+        request_factory = APIRequestFactory()
+        if method == "GET":
+            request = request_factory.get(path, data)
+        else:
+            request = request_factory.generic(
+                method, path, json.dumps(data), content_type="application/json"
+            )
+        force_authenticate(request, user=user)
+        match = resolve(path)
+
+        # Every run starts from the same data.
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                started_at = time.perf_counter()
+                response = match.func(request, *match.args, **match.kwargs)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                else:
+                    response.render()
+                duration = time.perf_counter() - started_at
+
+            transaction.set_rollback(True)
+
+        return duration, len(queries), response.status_code
+
+    def make_scheduled_dates_due(self, minute_start, size):
+        dates = list(ScheduledWorkoutDate.objects.select_related("workout")[:size])
+        for date in dates:
+            date.datetime = minute_start
+        ScheduledWorkoutDate.objects.bulk_update(dates, ["datetime"])
+        materialize_scheduled_dates(dates)
+
+    def make_recurring_alerts_due(self, minute_start, size):
+        alerts = list(RecurringWorkoutAlert.objects.select_related("workout")[:size])
+        for alert in alerts:
+            alert.time = minute_start.time()
+            alert.week_days = [minute_start.weekday()]
+            alert.sync_schedule_fields()
+        RecurringWorkoutAlert.objects.bulk_update(
+            alerts, ["time", "week_days", "minute_of_day"]
+        )
+        materialize_recurring_alerts(alerts)
+
+    def time_task(self, task, make_due, size):
+        with transaction.atomic():
+            minute_start = timezone.now().replace(second=0, microsecond=0)
+            make_due(minute_start, size)
+            InMemoryBackend.outbox.clear()
+
+            with CaptureQueriesContext(connection) as queries:
+                started_at = time.perf_counter()
+                task.apply()
+                duration = time.perf_counter() - started_at
+
+            transaction.set_rollback(True)
+
+        return duration, len(queries), f"{len(InMemoryBackend.outbox)} sent"
+
+    def report(self, name, timings):
+        durations = [duration for duration, _, _ in timings]
+        _, queries, status = timings[-1]
+        result = {
+            "median_ms": round(statistics.median(durations) * 1000, 2),
+            "min_ms": round(min(durations) * 1000, 2),
+            "queries": queries,
+        }
+
+        self.stdout.write(
+            f"{name:<50} median {result['median_ms']:>9.1f}ms  "
+            f"min {result['min_ms']:>9.1f}ms  {queries:>3} queries  {status}"
+        )
+        return result
+
+    def compare(self, results, path, tolerance):
+        with open(path) as file:
+            baseline = json.load(file)
+
+        regressions = []
+        for name, result in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+
+            if result["queries"] > expected["queries"]:
+                regressions.append(
+                    f"{name}: {result['queries']} queries, "
+                    f"baseline {expected['queries']}"
+                )
+            if result["median_ms"] > expected["median_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {result['median_ms']}ms, "
+                    f"baseline {expected['median_ms']}ms"
+                )
+
+        if regressions:
+            raise CommandError(
+                "Regressions from the baseline:\n" + "\n".join(regressions)
+            )
+
+        self.stdout.write(self.style.SUCCESS("No regressions from the baseline."))
+
+    @override_settings(NOTIFICATION_BACKEND="workouts.notifications.InMemoryBackend")
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        # Only kept in memory, for the admin endpoints.
+        user.is_staff = True
+
+        results = {}
+        with transaction.atomic():
+            for method, name, kwargs, data in self.get_cases(
+                user, options["bulk_items"]
+            ):
+                timings = [
+                    self.time_request(user, method, name, kwargs, data)
+                    for _ in range(options["repeat"])
+                ]
+                results[f"{method} {name}"] = self.report(f"{method} {name}", timings)
+
+            task_cases = [
+                (
+                    tasks.notify_scheduled_dates_at_the_current_minute,
+                    self.make_scheduled_dates_due,
+                ),
+                (
+                    tasks.notify_recurring_alerts_at_the_current_minute,
+                    self.make_recurring_alerts_due,
+                ),
+            ]
+            always_eager = celery_app.conf.task_always_eager
+            celery_app.conf.task_always_eager = True
+            try:
+                for task, make_due in task_cases:
+                    timings = [
+                        self.time_task(task, make_due, options["task_items"])
+                        for _ in range(options["repeat"])
+                    ]
+                    name = f"TASK {task.name.rsplit('.', 1)[-1]}"
+                    results[name] = self.report(name, timings)
+            finally:
+                celery_app.conf.task_always_eager = always_eager
+
+            transaction.set_rollback(True)
+
+        if options["save_baseline"]:
+            with open(options["save_baseline"], "w") as file:
+                json.dump(results, file, indent=2, sort_keys=True)
+            self.stdout.write(f"Baseline saved to {options['save_baseline']}.")
+
+        if options["compare"]:
+            self.compare(results, options["compare"], options["tolerance"])
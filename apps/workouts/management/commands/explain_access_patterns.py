@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from workouts.models import (
+    ExerciseCategory,
+    ExercisePlan,
+    RecurringWorkoutAlert,
+    ScheduledWorkoutDate,
+    Workout,
+    WorkoutComment,
+)
+from workouts.tasks import get_recurring_alerts_at, get_scheduled_dates_at
+
+
+def get_access_patterns(workout):
+    """Querysets issued by the list endpoints of the API."""
+    return {
+        "workouts": Workout.objects.filter(user=workout.user_id).order_by(
+            "-created_at"
+        ),
+        "exercise_plans": ExercisePlan.objects.filter(workout=workout).order_by(
+            Lower("name"), "-created_at"
+        ),
+        "comments": WorkoutComment.objects.filter(workout=workout).order_by(
+            "-created_at"
+        ),
+        "scheduled_dates": ScheduledWorkoutDate.objects.filter(
+            workout=workout
+        ).order_by("datetime"),
+        "recurring_alerts": RecurringWorkoutAlert.objects.filter(
+            workout=workout
+        ).order_by("time"),
+        "exercise_categories": ExerciseCategory.objects.order_by(Lower("name")),
+    }
+
+
+def get_task_access_patterns(minute_start):
+    """
+    Querysets issued every minute by the notification tasks, inside the
+    materialized window and past its end.
+    """
+    materialized_end = minute_start + timedelta(minutes=1)
+    return {
+        "due_scheduled_dates": get_scheduled_dates_at(minute_start, materialized_end),
+        "due_recurring_alerts": get_recurring_alerts_at(minute_start, materialized_end),
+        "due_scheduled_dates_past_window": get_scheduled_dates_at(
+            minute_start, minute_start
+        ),
+        "due_recurring_alerts_past_window": get_recurring_alerts_at(
+            minute_start, minute_start
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = "Print the query plan of every list endpoint access pattern."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workout",
+            help="Workout used for the nested routes (defaults to the latest one).",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=20,
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run the queries and report real timings (PostgreSQL only).",
+        )
+
+    def get_workout(self, workout_id):
+        workouts = Workout.objects.all()
+        if workout_id:
+            workouts = workouts.filter(pk=workout_id)
+
+        workout = workouts.order_by("-created_at").first()
+        if workout is None:
+            raise CommandError("There are no workouts to explain.")
+
+        return workout
+
+    def handle(self, *args, **options):
+        workout = self.get_workout(options["workout"])
+        explain_options = {}
+        if options["analyze"]:
+            explain_options = {"analyze": True, "buffers": True}
+
+        page_size = options["page_size"]
+        minute_start = timezone.now().replace(second=0, microsecond=0)
+        access_patterns = {
+            **get_access_patterns(workout),
+            **get_task_access_patterns(minute_start),
+        }
+        for name, queryset in access_patterns.items():
+            plan = queryset[:page_size].explain(**explain_options)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(plan)
+            if "Seq Scan" in plan or "Sort" in plan:
+                self.stdout.write(
+                    self.style.WARNING(f"{name} is not served by an ordered index.")
+                )
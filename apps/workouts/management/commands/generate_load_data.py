@@ -0,0 +1,194 @@
+import random
+import time
+
+import factory.random
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from users.models import User
+from users.tests.factories import UserFactory
+from workouts.cache import catalog_cache
+from workouts.models import (
+    Exercise,
+    ExercisePlan,
+    RecurringWorkoutAlert,
+    ScheduledWorkoutDate,
+    Workout,
+    WorkoutComment,
+)
+from workouts.occurrences import get_window_end, get_window_start, materialize_window
+from workouts.tests import factories
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic dataset of users with workouts, exercise plans, "
+        "comments, scheduled dates and recurring alerts for load tests and "
+        "benchmarks. The same seed always generates the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--workouts-per-user", type=int, default=5)
+        parser.add_argument("--plans-per-workout", type=int, default=4)
+        parser.add_argument("--comments-per-workout", type=int, default=2)
+        parser.add_argument("--dates-per-workout", type=int, default=4)
+        parser.add_argument("--alerts-per-workout", type=int, default=2)
+        parser.add_argument(
+            "--exercises",
+            type=int,
+            default=100,
+            help="Exercises to create when the catalog is empty.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Users created, along with their workouts, per transaction.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--password",
+            default="load-test",
+            help="Password of every generated user.",
+        )
+
+    def seed(self, seed):
+        random.seed(seed)
+        factory.random.reseed_random(seed)
+
+    def get_email(self, seed, index):
+        return f"load-{seed}-{index}@example.com"
+
+    def get_exercises(self, size):
+        exercises = list(Exercise.objects.order_by("name", "pk"))
+        if exercises:
+            return exercises
+
+        categories = factories.ExerciseCategoryFactory.create_batch(max(size // 10, 1))
+        exercises = Exercise.objects.bulk_create(
+            factories.ExerciseFactory.build(category=random.choice(categories))
+            for _ in range(size)
+        )
+        catalog_cache.bump_version()
+
+        return exercises
+
+    def build_plans(self, workouts, exercises, size):
+        return [
+            factories.ExercisePlanFactory.build(
+                workout=workout,
+                exercise=random.choice(exercises),
+                weight=random.randrange(5, 120, 5),
+                weight_measure_unit=random.choice(["kg", "lb"]),
+            )
+            for workout in workouts
+            for _ in range(size)
+        ]
+
+    def build_comments(self, workouts, size):
+        return [
+            factories.WorkoutCommentFactory.build(workout=workout)
+            for workout in workouts
+            for _ in range(size)
+        ]
+
+    def build_dates(self, workouts, size):
+        return [
+            factories.ScheduledDateFactory.build(workout=workout)
+            for workout in workouts
+            if workout.is_scheduled()
+            for _ in range(size)
+        ]
+
+    def build_alerts(self, workouts, size):
+        alerts = [
+            factories.RecurringAlertFactory.build(
+                workout=workout,
+                week_days=sorted(random.sample(range(7), random.randint(1, 7))),
+            )
+            for workout in workouts
+            if workout.is_recurrent()
+            for _ in range(size)
+        ]
+        # bulk_create skips save(), which keeps the schedule fields in sync.
+        for alert in alerts:
+            alert.sync_schedule_fields()
+
+        return alerts
+
+    @transaction.atomic
+    def create_batch(self, indexes, password, exercises, options):
+        users = User.objects.bulk_create(
+            UserFactory.build(
+                email=self.get_email(options["seed"], index), password=password
+            )
+            for index in indexes
+        )
+        workouts = Workout.objects.bulk_create(
+            factories.WorkoutFactory.build(
+                user=user, type=random.choice(Workout.WORKOUT_TYPE)[0]
+            )
+            for user in users
+            for _ in range(options["workouts_per_user"])
+        )
+
+        rows = {"users": len(users), "workouts": len(workouts)}
+        for key, model, objs in [
+            (
+                "exercise plans",
+                ExercisePlan,
+                self.build_plans(workouts, exercises, options["plans_per_workout"]),
+            ),
+            (
+                "comments",
+                WorkoutComment,
+                self.build_comments(workouts, options["comments_per_workout"]),
+            ),
+            (
+                "scheduled dates",
+                ScheduledWorkoutDate,
+                self.build_dates(workouts, options["dates_per_workout"]),
+            ),
+            (
+                "recurring alerts",
+                RecurringWorkoutAlert,
+                self.build_alerts(workouts, options["alerts_per_workout"]),
+            ),
+        ]:
+            rows[key] = len(model.objects.bulk_create(objs))
+
+        return rows
+
+    def handle(self, *args, **options):
+        if User.objects.filter(email=self.get_email(options["seed"], 0)).exists():
+            raise CommandError(
+                f"Data for seed {options['seed']} already exists, use another seed."
+            )
+
+        started_at = time.perf_counter()
+        self.seed(options["seed"])
+        exercises = self.get_exercises(options["exercises"])
+        # The users get the same data whether the catalog existed or not.
+        self.seed(options["seed"])
+
+        # Hashing is slow on purpose, so every user shares the same hash.
+        password = make_password(options["password"])
+
+        totals = {}
+        batch_size = options["batch_size"]
+        for start in range(0, options["users"], batch_size):
+            indexes = range(start, min(start + batch_size, options["users"]))
+            rows = self.create_batch(indexes, password, exercises, options)
+
+            for key, count in rows.items():
+                totals[key] = totals.get(key, 0) + count
+            self.stdout.write(f"{totals['users']}/{options['users']} users created")
+
+        # Bulk writes skip the signals that keep the occurrences up to date.
+        totals["occurrences"] = materialize_window(get_window_start(), get_window_end())
+
+        duration = time.perf_counter() - started_at
+        summary = ", ".join(f"{count} {key}" for key, count in totals.items())
+        self.stdout.write(self.style.SUCCESS(f"Created {summary} in {duration:.1f}s."))
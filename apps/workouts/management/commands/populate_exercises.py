@@ -1,10 +1,18 @@
 import os
-import json
+import time
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import transaction
 
+from workouts.cache import catalog_cache
 from workouts.models import ExerciseCategory, Exercise
+from workouts.seed_files import (
+    open_seed_file,
+    read_seed_exercises,
+    stream_seed_exercises,
+)
+from workouts.utils import chunked
 
 
 def remove_duplicate_items_by_name(data):
@@ -24,24 +32,67 @@ def remove_duplicate_items_by_name(data):
 
 
 def remove_duplicate_exercises_by_name_and_category(exercises_list):
-    seen = []
+    seen = set()
     unique_data = []
 
     for exercise in exercises_list:
-        name = exercise.name
-        category = exercise.category
-        if not (name and category):
+        key = (exercise.name, exercise.category_id)
+        if not all(key):
             continue
 
-        essential_data = {"name": name, "category": category}
-        if essential_data not in seen:
-            seen.append(essential_data)
+        if key not in seen:
+            seen.add(key)
             unique_data.append(exercise)
 
     return unique_data
 
 
+def group_by_category(items):
+    """Group `(category name, exercise)` pairs into the seed file layout."""
+    categories = {}
+    for name, exercise in items:
+        exercises = categories.setdefault(name, [])
+        if exercise is not None:
+            exercises.append(exercise)
+
+    return [
+        {"name": name, "exercises": exercises} for name, exercises in categories.items()
+    ]
+
+
+def format_counts(counts):
+    return (
+        f"{counts['inserted']} exercises inserted, {counts['updated']} updated, "
+        f"{counts['unchanged']} unchanged."
+    )
+
+
 class Command(BaseCommand):
+    help = (
+        "Add the exercise categories and exercises of a seed file, in batches, "
+        "updating the description of the exercises that already exist."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=os.path.join(
+                settings.BASE_DIR, "apps", "workouts", "data", "seed_data.json"
+            ),
+            help="Seed file to load, `-` for stdin. Gzip files are unzipped.",
+        )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Parse the file incrementally instead of loading it at once.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Exercises written per batch.",
+        )
+
     def insert_exercise_categories(self, categories):
         # remove duplicate categories
         categories = remove_duplicate_items_by_name(categories)
@@ -57,7 +108,8 @@ class Command(BaseCommand):
             if item["name"] not in existing_names
         ]
         if new_categories:
-            ExerciseCategory.objects.bulk_create(new_categories)
+            # Categories added by a concurrent run are left as they are.
+            ExerciseCategory.objects.bulk_create(new_categories, ignore_conflicts=True)
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully added {len(new_categories)} new exercise categories."
@@ -67,55 +119,97 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No new exercise categories to add."))
 
     def insert_exercises(self, exercise_categories):
-        exercises_to_add = []
+        """
+        Insert the new exercises and update the description of the existing
+        ones, returning how many were inserted, updated and left unchanged.
+        """
+        category_ids = dict(
+            ExerciseCategory.objects.filter(
+                name__in=[item["name"] for item in exercise_categories]
+            ).values_list("name", "id")
+        )
+        names = {
+            item.get("name"): None
+            for exercise_category in exercise_categories
+            for item in exercise_category["exercises"]
+        }
+        descriptions = {
+            (name, category_id): description
+            for name, category_id, description in Exercise.objects.filter(
+                category_id__in=list(category_ids.values()), name__in=list(names)
+            ).values_list("name", "category_id", "description")
+        }
+
+        exercises = []
         for exercise_category in exercise_categories:
-            try:
-                category_db = ExerciseCategory.objects.get(
-                    name=exercise_category["name"]
-                )
-            except ExerciseCategory.DoesNotExist:
+            category_id = category_ids.get(exercise_category["name"])
+            if category_id is None:
                 continue
 
-            exercises = exercise_category["exercises"]
-
-            existing_exercises = Exercise.objects.filter(
-                name__in=[item["name"] for item in exercises], category=category_db
-            )
-            existing_names = set(existing_exercises.values_list("name", flat=True))
-
-            exercises_to_add += [
-                Exercise(**item, category=category_db)
-                for item in exercises
-                if item["name"] not in existing_names
+            exercises += [
+                Exercise(**item, category_id=category_id)
+                for item in exercise_category["exercises"]
             ]
 
         # remove duplicate exercises
-        exercises_to_add = remove_duplicate_exercises_by_name_and_category(
-            exercises_to_add
-        )
+        exercises = remove_duplicate_exercises_by_name_and_category(exercises)
+
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        exercises_to_write = []
+        for exercise in exercises:
+            key = (exercise.name, exercise.category_id)
+            if key not in descriptions:
+                counts["inserted"] += 1
+            elif descriptions[key] != exercise.description:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
 
-        if exercises_to_add:
-            Exercise.objects.bulk_create(exercises_to_add)
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully added {len(exercises_to_add)} new exercises."
-                )
+            exercises_to_write.append(exercise)
+
+        if exercises_to_write:
+            Exercise.objects.bulk_create(
+                exercises_to_write,
+                update_conflicts=True,
+                unique_fields=["category", "name"],
+                update_fields=["description"],
             )
+            self.stdout.write(self.style.SUCCESS(format_counts(counts)))
         else:
-            self.stdout.write(self.style.WARNING("No new exercises to add."))
+            self.stdout.write(self.style.WARNING(format_counts(counts)))
+
+        return counts
 
     def handle(self, *args, **options):
-        seed_file_path = os.path.join(
-            settings.BASE_DIR, "apps", "workouts", "data", "seed_data.json"
+        started_at = time.perf_counter()
+        read_exercises = (
+            stream_seed_exercises if options["stream"] else read_seed_exercises
         )
-        with open(seed_file_path, "r") as f:
-            seed_data = json.load(f)
-            exercise_categories = seed_data["exercise_categories"]
 
-            self.insert_exercise_categories(
-                [{"name": item["name"]} for item in exercise_categories]
-            )
+        rows = 0
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0}
+        with open_seed_file(options["file"]) as file:
+            for batch in chunked(read_exercises(file), options["batch_size"]):
+                exercise_categories = group_by_category(batch)
+
+                with transaction.atomic():
+                    self.insert_exercise_categories(
+                        [{"name": item["name"]} for item in exercise_categories]
+                    )
+                    counts = self.insert_exercises(exercise_categories)
 
-            self.insert_exercises(exercise_categories)
+                for key, count in counts.items():
+                    totals[key] += count
 
+                rows += sum(len(item["exercises"]) for item in exercise_categories)
+
+        catalog_cache.bump_version()
+
+        duration = time.perf_counter() - started_at
+        self.stdout.write(
+            f"Processed {rows} exercises in {duration:.2f}s "
+            f"({rows / duration:.0f} rows/s)."
+        )
+        self.stdout.write(f"Total: {format_counts(totals)}")
         self.stdout.write(self.style.SUCCESS("Exercises added successfully!"))
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0008_remove_recurringworkoutalert_activated_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exerciseplan',
+            index=models.Index(fields=['workout', 'created_at', 'id'], name='plan_workout_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recurringworkoutalert',
+            index=models.Index(fields=['workout', 'time', 'id'], name='alert_workout_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledworkoutdate',
+            index=models.Index(fields=['workout', 'datetime', 'id'], name='date_workout_datetime_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workout',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='workout_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutcomment',
+            index=models.Index(fields=['workout', 'created_at', 'id'], name='comment_workout_created_idx'),
+        ),
+    ]
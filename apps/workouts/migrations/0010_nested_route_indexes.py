@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:44
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exercise',
+            index=models.Index(models.F('category'), django.db.models.functions.text.Lower('name'), name='exercise_category_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exercisecategory',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='category_lower_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exerciseplan',
+            index=models.Index(models.F('workout'), django.db.models.functions.text.Lower('name'), models.OrderBy(models.F('created_at'), descending=True), name='plan_workout_name_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workouts", "0010_nested_route_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="scheduledworkoutdate",
+            index=models.Index(fields=["datetime"], name="date_datetime_idx"),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:46
+
+from django.db import migrations, models
+
+
+def fill_minute_of_day_and_week_days_mask(apps, schema_editor):
+    RecurringWorkoutAlert = apps.get_model('workouts', 'RecurringWorkoutAlert')
+
+    alerts = RecurringWorkoutAlert.objects.all()
+    for alert in alerts.iterator(chunk_size=2000):
+        alert.minute_of_day = alert.time.hour * 60 + alert.time.minute
+        alert.week_days_mask = sum(1 << day for day in set(alert.week_days))
+        alert.save(update_fields=['minute_of_day', 'week_days_mask'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0011_scheduled_date_datetime_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recurringworkoutalert',
+            name='minute_of_day',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='recurringworkoutalert',
+            name='week_days_mask',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            fill_minute_of_day_and_week_days_mask, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='recurringworkoutalert',
+            index=models.Index(fields=['minute_of_day', 'week_days_mask'], name='alert_minute_of_day_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:50
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0012_recurring_alert_minute_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDispatch',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('source_type', models.CharField(choices=[('S', 'scheduled date'), ('R', 'recurring alert')], max_length=1)),
+                ('source_id', models.UUIDField()),
+                ('occurrence', models.DateTimeField()),
+                ('claim_token', models.UUIDField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'notification dispatch',
+                'verbose_name_plural': 'notification dispatches',
+                'indexes': [models.Index(fields=['claim_token'], name='dispatch_claim_token_idx'), models.Index(fields=['source_type', 'occurrence'], name='dispatch_type_occurrence_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source_id', 'occurrence'), name='unique_notification_dispatch')],
+            },
+        ),
+    ]
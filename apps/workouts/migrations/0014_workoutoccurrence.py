@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:54
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0013_notificationdispatch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkoutOccurrence',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('datetime', models.DateTimeField()),
+                ('recurring_alert', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='workouts.recurringworkoutalert')),
+                ('scheduled_date', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='workouts.scheduledworkoutdate')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workout_occurrences', to=settings.AUTH_USER_MODEL)),
+                ('workout', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='workouts.workout')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['datetime'], name='occurrence_datetime_idx'), models.Index(fields=['user', 'datetime'], name='occurrence_user_datetime_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scheduled_date',), name='unique_scheduled_date_occurrence'), models.UniqueConstraint(fields=('recurring_alert', 'datetime'), name='unique_recurring_alert_occurrence')],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:52
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def merge_duplicate_exercises(apps, schema_editor):
+    """
+    Keep a single category per name and a single exercise per category and
+    name, moving what points to the duplicates onto the row that is kept.
+    """
+    ExerciseCategory = apps.get_model('workouts', 'ExerciseCategory')
+    Exercise = apps.get_model('workouts', 'Exercise')
+    ExercisePlan = apps.get_model('workouts', 'ExercisePlan')
+
+    names = list(
+        ExerciseCategory.objects.values('name')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('name', flat=True)
+    )
+    for name in names:
+        kept, *duplicates = ExerciseCategory.objects.filter(name=name).order_by('pk')
+        Exercise.objects.filter(category__in=duplicates).update(category=kept)
+        ExerciseCategory.objects.filter(pk__in=[item.pk for item in duplicates]).delete()
+
+    keys = list(
+        Exercise.objects.values('category_id', 'name')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('category_id', 'name')
+    )
+    for category_id, name in keys:
+        kept, *duplicates = Exercise.objects.filter(
+            category_id=category_id, name=name
+        ).order_by('pk')
+        ExercisePlan.objects.filter(exercise__in=duplicates).update(exercise=kept)
+        Exercise.objects.filter(pk__in=[item.pk for item in duplicates]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0014_workoutoccurrence'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_exercises, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0015_merge_duplicate_exercises'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='exercise',
+            constraint=models.UniqueConstraint(fields=('category', 'name'), name='unique_exercise_category_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='exercisecategory',
+            constraint=models.UniqueConstraint(fields=('name',), name='unique_category_name'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:58
+
+from django.db import migrations
+
+
+def fill_week_days_mask(apps, schema_editor):
+    RecurringWorkoutAlert = apps.get_model('workouts', 'RecurringWorkoutAlert')
+
+    # Bulk writes could leave the mask out of sync, so it's rebuilt from the
+    # list before the list is dropped.
+    alerts = RecurringWorkoutAlert.objects.all()
+    for alert in alerts.iterator(chunk_size=2000):
+        alert.week_days_mask = sum(1 << day for day in set(alert.week_days))
+        alert.save(update_fields=['week_days_mask'])
+
+
+def fill_week_days(apps, schema_editor):
+    RecurringWorkoutAlert = apps.get_model('workouts', 'RecurringWorkoutAlert')
+
+    alerts = RecurringWorkoutAlert.objects.all()
+    for alert in alerts.iterator(chunk_size=2000):
+        alert.week_days = [
+            day for day in range(7) if alert.week_days_mask & (1 << day)
+        ]
+        alert.save(update_fields=['week_days'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0016_exercise_unique_names'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_week_days_mask, fill_week_days),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:58
+
+import workouts.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0017_recurring_alert_week_days_mask'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='recurringworkoutalert',
+            name='alert_minute_of_day_idx',
+        ),
+        migrations.RemoveField(
+            model_name='recurringworkoutalert',
+            name='week_days',
+        ),
+        migrations.RenameField(
+            model_name='recurringworkoutalert',
+            old_name='week_days_mask',
+            new_name='week_days',
+        ),
+        migrations.AlterField(
+            model_name='recurringworkoutalert',
+            name='week_days',
+            field=workouts.fields.WeekDaysField(blank=True, default=list),
+        ),
+        migrations.AddIndex(
+            model_name='recurringworkoutalert',
+            index=models.Index(fields=['minute_of_day', 'week_days'], name='alert_minute_of_day_idx'),
+        ),
+    ]
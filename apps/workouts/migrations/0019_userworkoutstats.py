@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_options'),
+        ('workouts', '0018_recurring_alert_week_days_field'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWorkoutStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='workout_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('workouts', models.IntegerField(default=0)),
+                ('active_workouts', models.IntegerField(default=0)),
+                ('completed_workouts', models.IntegerField(default=0)),
+                ('pending_workouts', models.IntegerField(default=0)),
+                ('exercise_plans', models.IntegerField(default=0)),
+                ('comments', models.IntegerField(default=0)),
+                ('refresh_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'user workout stats',
+                'verbose_name_plural': 'user workout stats',
+            },
+        ),
+    ]
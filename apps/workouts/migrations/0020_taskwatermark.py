@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0019_userworkoutstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskWatermark',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'task watermark',
+                'verbose_name_plural': 'task watermarks',
+            },
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:41
+
+import datetime
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations
+
+
+def materialize_occurrences(apps, schema_editor):
+    """
+    Materialize the whole occurrence window for the dates and alerts that
+    existed before it was kept up to date, and record where it ends so the
+    periodic task resumes from there.
+    """
+    ScheduledWorkoutDate = apps.get_model('workouts', 'ScheduledWorkoutDate')
+    RecurringWorkoutAlert = apps.get_model('workouts', 'RecurringWorkoutAlert')
+    WorkoutOccurrence = apps.get_model('workouts', 'WorkoutOccurrence')
+    TaskWatermark = apps.get_model('workouts', 'TaskWatermark')
+
+    current_minute = datetime.datetime.now(datetime.timezone.utc).replace(
+        second=0, microsecond=0
+    )
+    window_start = current_minute - timedelta(
+        minutes=settings.NOTIFICATION_CATCH_UP_MINUTES
+    )
+    window_end = current_minute + timedelta(
+        days=settings.WORKOUT_OCCURRENCE_HORIZON_DAYS
+    )
+
+    def iter_occurrences():
+        scheduled_dates = ScheduledWorkoutDate.objects.filter(
+            datetime__gte=window_start, datetime__lt=window_end
+        ).values('id', 'datetime', 'workout_id', 'workout__user_id')
+        for scheduled_date in scheduled_dates.iterator():
+            yield WorkoutOccurrence(
+                datetime=scheduled_date['datetime'],
+                workout_id=scheduled_date['workout_id'],
+                user_id=scheduled_date['workout__user_id'],
+                scheduled_date_id=scheduled_date['id'],
+            )
+
+        alerts = RecurringWorkoutAlert.objects.exclude(week_days=[]).values(
+            'id', 'time', 'week_days', 'workout_id', 'workout__user_id'
+        )
+        for alert in alerts.iterator():
+            day = window_start.date()
+            while day <= window_end.date():
+                occurrence = datetime.datetime.combine(
+                    day, alert['time'], tzinfo=datetime.timezone.utc
+                )
+                if (
+                    day.weekday() in alert['week_days']
+                    and window_start <= occurrence < window_end
+                ):
+                    yield WorkoutOccurrence(
+                        datetime=occurrence,
+                        workout_id=alert['workout_id'],
+                        user_id=alert['workout__user_id'],
+                        recurring_alert_id=alert['id'],
+                    )
+                day += timedelta(days=1)
+
+    batch = []
+    for occurrence in iter_occurrences():
+        batch.append(occurrence)
+        if len(batch) == settings.NOTIFICATION_BATCH_SIZE:
+            WorkoutOccurrence.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    WorkoutOccurrence.objects.bulk_create(batch, ignore_conflicts=True)
+
+    TaskWatermark.objects.update_or_create(
+        name='workout_occurrences', defaults={'value': window_end}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0020_taskwatermark'),
+    ]
+
+    operations = [
+        migrations.RunPython(materialize_occurrences, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,12 @@
 import uuid
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from users.models import User
+from workouts.fields import WeekDaysField
 
 
 class ExerciseCategory(models.Model):
@@ -14,6 +16,12 @@ class ExerciseCategory(models.Model):
     class Meta:
         verbose_name = _("exercise category")
         verbose_name_plural = _("exercise categories")
+        indexes = [
+            models.Index(Lower("name"), name="category_lower_name_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["name"], name="unique_category_name"),
+        ]
 
     def __str__(self):
         return self.name
@@ -27,6 +35,16 @@ class Exercise(models.Model):
         ExerciseCategory, on_delete=models.CASCADE, related_name="exercises"
     )
 
+    class Meta:
+        indexes = [
+            models.Index("category", Lower("name"), name="exercise_category_name_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "name"], name="unique_exercise_category_name"
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -55,6 +73,18 @@ class ExercisePlan(models.Model):
     class Meta:
         verbose_name = _("exercise plan")
         verbose_name_plural = _("exercise plans")
+        indexes = [
+            models.Index(
+                fields=["workout", "created_at", "id"],
+                name="plan_workout_created_idx",
+            ),
+            models.Index(
+                "workout",
+                Lower("name"),
+                models.F("created_at").desc(),
+                name="plan_workout_name_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.exercise.name} ({self.workout.name})"
@@ -80,9 +110,24 @@ class Workout(models.Model):
 
     type = models.CharField(max_length=10, choices=WORKOUT_TYPE, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="workout_user_created_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.user})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the stats signals tell whether save() changed the type.
+        instance._loaded_type = instance.__dict__.get("type")
+        return instance
+
     def is_recurrent(self):
         return self.type == self.RECURRENT
 
@@ -108,6 +153,15 @@ class ScheduledWorkoutDate(models.Model):
         Workout, on_delete=models.CASCADE, related_name="scheduled_dates"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["workout", "datetime", "id"],
+                name="date_workout_datetime_idx",
+            ),
+            models.Index(fields=["datetime"], name="date_datetime_idx"),
+        ]
+
     def __str__(self):
         return f"{self.workout.name} - {self.datetime}"
 
@@ -122,24 +176,52 @@ class RecurringWorkoutAlert(models.Model):
         (5, "Saturday"),
         (6, "Sunday"),
     ]
+    WEEK_DAY_NAMES = dict(WEEK_DAYS)
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     time = models.TimeField()
-    week_days = models.JSONField(
-        default=list, blank=True
-    )  # List of days of the week (0-6)
+    week_days = WeekDaysField(default=list, blank=True)  # Days of the week (0-6)
+
+    # Denormalized copy of time kept in sync on save, so the per-minute
+    # notification task can find due alerts with one index lookup.
+    minute_of_day = models.PositiveSmallIntegerField(default=0, editable=False)
 
     workout = models.ForeignKey(
         Workout, on_delete=models.CASCADE, related_name="recurring_alerts"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["workout", "time", "id"],
+                name="alert_workout_time_idx",
+            ),
+            models.Index(
+                fields=["minute_of_day", "week_days"],
+                name="alert_minute_of_day_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.workout.name} - {self.get_week_days_display()} {self.time}"
 
+    def save(self, *args, **kwargs):
+        self.sync_schedule_fields()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "time" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "minute_of_day"}
+
+        super().save(*args, **kwargs)
+
+    def sync_schedule_fields(self):
+        """Recompute `minute_of_day`, which bulk writes skip."""
+        self.minute_of_day = self.time.hour * 60 + self.time.minute
+
     def get_week_days_display(self):
         if not self.week_days:
             return "No set days"
-        return ", ".join([dict(self.WEEK_DAYS).get(day, "") for day in self.week_days])
+        return ", ".join([self.WEEK_DAY_NAMES.get(day, "") for day in self.week_days])
 
 
 class WorkoutComment(models.Model):
@@ -153,5 +235,200 @@ class WorkoutComment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["workout", "created_at", "id"],
+                name="comment_workout_created_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.id} ({self.workout.name})"
+
+
+class UserWorkoutStats(models.Model):
+    """
+    Summary of the workouts of a user, kept up to date by signals so it is
+    read by primary key. Statuses follow `WorkoutSerializer.get_status`.
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="workout_stats"
+    )
+    workouts = models.IntegerField(default=0)
+    active_workouts = models.IntegerField(default=0)
+    completed_workouts = models.IntegerField(default=0)
+    pending_workouts = models.IntegerField(default=0)
+    exercise_plans = models.IntegerField(default=0)
+    comments = models.IntegerField(default=0)
+
+    # Scheduled workouts complete when their last date passes, which no
+    # write signals, so the statuses are recounted once this is reached.
+    refresh_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("user workout stats")
+        verbose_name_plural = _("user workout stats")
+
+    def __str__(self):
+        return f"{self.user} - {self.workouts} workouts"
+
+
+class NotificationDispatchManager(models.Manager):
+    def claim(self, source_type, source_ids, occurrence):
+        """
+        Record the notifications of `source_ids` for `occurrence` and return
+        the claim token with the ids that were not already recorded.
+        """
+        claim_token = uuid.uuid4()
+        self.bulk_create(
+            [
+                self.model(
+                    source_type=source_type,
+                    source_id=source_id,
+                    occurrence=occurrence,
+                    claim_token=claim_token,
+                )
+                for source_id in source_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+        claimed_ids = self.filter(claim_token=claim_token).values_list(
+            "source_id", flat=True
+        )
+        return claim_token, set(claimed_ids)
+
+    def release(self, claim_token, source_ids=None):
+        """Give back the claims of `claim_token`, or only those of `source_ids`."""
+        claims = self.filter(claim_token=claim_token)
+        if source_ids is not None:
+            claims = claims.filter(source_id__in=source_ids)
+        claims.delete()
+
+
+class NotificationDispatch(models.Model):
+    SCHEDULED_DATE = "S"
+    RECURRING_ALERT = "R"
+
+    SOURCE_TYPE = [
+        (SCHEDULED_DATE, "scheduled date"),
+        (RECURRING_ALERT, "recurring alert"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    source_type = models.CharField(max_length=1, choices=SOURCE_TYPE)
+    source_id = models.UUIDField()
+    occurrence = models.DateTimeField()
+    claim_token = models.UUIDField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = NotificationDispatchManager()
+
+    class Meta:
+        verbose_name = _("notification dispatch")
+        verbose_name_plural = _("notification dispatches")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_id", "occurrence"],
+                name="unique_notification_dispatch",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["claim_token"], name="dispatch_claim_token_idx"),
+            models.Index(
+                fields=["source_type", "occurrence"],
+                name="dispatch_type_occurrence_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_source_type_display()} {self.source_id} ({self.occurrence})"
+
+
+class TaskWatermarkManager(models.Manager):
+    def get_value(self, name):
+        return self.filter(name=name).values_list("value", flat=True).first()
+
+    def advance(self, name, value):
+        """Move the watermark `name` forward to `value`, never backwards."""
+        if not self.filter(name=name, value__lt=value).update(value=value):
+            self.get_or_create(name=name, defaults={"value": value})
+
+
+class TaskWatermark(models.Model):
+    """
+    Point up to which a periodic task has done its work, so the next run
+    resumes from there however long ago the last one was.
+    """
+
+    SCHEDULED_DATE_NOTIFICATIONS = "scheduled_date_notifications"
+    RECURRING_ALERT_NOTIFICATIONS = "recurring_alert_notifications"
+    # End of the window materialized into WorkoutOccurrence.
+    WORKOUT_OCCURRENCES = "workout_occurrences"
+
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.DateTimeField()
+
+    objects = TaskWatermarkManager()
+
+    class Meta:
+        verbose_name = _("task watermark")
+        verbose_name_plural = _("task watermarks")
+
+    def __str__(self):
+        return f"{self.name} ({self.value})"
+
+
+class WorkoutOccurrence(models.Model):
+    """
+    Upcoming occurrence of a scheduled date or recurring alert, materialized
+    for a rolling window so due and calendar lookups are plain range scans.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    datetime = models.DateTimeField()
+
+    workout = models.ForeignKey(
+        Workout, on_delete=models.CASCADE, related_name="occurrences"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="workout_occurrences"
+    )
+    scheduled_date = models.ForeignKey(
+        ScheduledWorkoutDate,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="occurrences",
+    )
+    recurring_alert = models.ForeignKey(
+        RecurringWorkoutAlert,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="occurrences",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scheduled_date"], name="unique_scheduled_date_occurrence"
+            ),
+            models.UniqueConstraint(
+                fields=["recurring_alert", "datetime"],
+                name="unique_recurring_alert_occurrence",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["datetime"], name="occurrence_datetime_idx"),
+            models.Index(
+                fields=["user", "datetime"], name="occurrence_user_datetime_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.workout.name} - {self.datetime}"
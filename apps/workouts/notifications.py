@@ -0,0 +1,138 @@
+from dataclasses import asdict, dataclass
+
+import requests
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils.module_loading import import_string
+
+
+@dataclass(frozen=True)
+class Notification:
+    user_id: str
+    recipient: str
+    subject: str
+    message: str
+
+    @classmethod
+    def for_scheduled_date(cls, scheduled_date):
+        workout = scheduled_date.workout
+        return cls(
+            user_id=str(workout.user_id),
+            recipient=workout.user.email,
+            subject=f"Workout reminder: {workout.name}",
+            message=f"Your workout {workout.name} is scheduled for "
+            f"{scheduled_date.datetime:%Y-%m-%d %H:%M}.",
+        )
+
+    @classmethod
+    def for_recurring_alert(cls, alert):
+        workout = alert.workout
+        return cls(
+            user_id=str(workout.user_id),
+            recipient=workout.user.email,
+            subject=f"Workout reminder: {workout.name}",
+            message=f"It's time for your workout {workout.name}.",
+        )
+
+
+class NotificationDeliveryError(Exception):
+    """
+    Raised by `send_many()` when a batch is only partly delivered. `failed`
+    holds the notifications that were not, the rest of the batch was sent.
+    """
+
+    def __init__(self, failed):
+        super().__init__(f"{len(failed)} notifications could not be delivered.")
+        self.failed = failed
+
+
+class BaseNotificationBackend:
+    """
+    Base class for notification delivery backends.
+
+    Subclasses must implement `send_many()`, which delivers a batch of
+    notifications reusing a single connection and returns how many were sent.
+    Unless failing silently, a failure raises `NotificationDeliveryError`
+    with the notifications left undelivered.
+    """
+
+    def __init__(self, fail_silently=False, **kwargs):
+        self.fail_silently = fail_silently
+
+    def send(self, notification):
+        return self.send_many([notification])
+
+    def send_many(self, notifications):
+        raise NotImplementedError(
+            "subclasses of BaseNotificationBackend must override send_many() method"
+        )
+
+
+class EmailBackend(BaseNotificationBackend):
+    def send_many(self, notifications):
+        if not notifications:
+            return 0
+
+        connection = get_connection(fail_silently=self.fail_silently)
+        messages = [
+            EmailMessage(
+                notification.subject,
+                notification.message,
+                to=[notification.recipient],
+                connection=connection,
+            )
+            for notification in notifications
+        ]
+
+        # One message per call on the open connection, so a failure tells
+        # which messages were already sent.
+        sent = 0
+        with connection:
+            for index, message in enumerate(messages):
+                try:
+                    sent += connection.send_messages([message]) or 0
+                except Exception as error:
+                    raise NotificationDeliveryError(notifications[index:]) from error
+
+        return sent
+
+
+class WebhookBackend(BaseNotificationBackend):
+    def __init__(self, url=None, timeout=None, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url or settings.NOTIFICATION_WEBHOOK_URL
+        self.timeout = timeout or settings.NOTIFICATION_WEBHOOK_TIMEOUT
+
+    def send_many(self, notifications):
+        sent = 0
+        with requests.Session() as session:
+            for index, notification in enumerate(notifications):
+                try:
+                    response = session.post(
+                        self.url, json=asdict(notification), timeout=self.timeout
+                    )
+                    response.raise_for_status()
+                except requests.RequestException as error:
+                    if not self.fail_silently:
+                        raise NotificationDeliveryError(
+                            notifications[index:]
+                        ) from error
+                else:
+                    sent += 1
+
+        return sent
+
+
+class InMemoryBackend(BaseNotificationBackend):
+    """Keeps notifications in `InMemoryBackend.outbox`, for tests and benchmarks."""
+
+    outbox = []
+
+    def send_many(self, notifications):
+        self.outbox.extend(notifications)
+        return len(notifications)
+
+
+def get_notification_backend(backend=None, **kwargs):
+    backend_class = import_string(backend or settings.NOTIFICATION_BACKEND)
+    return backend_class(**kwargs)
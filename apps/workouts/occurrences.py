@@ -0,0 +1,244 @@
+import datetime
+import heapq
+from datetime import timedelta
+from operator import itemgetter
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from workouts.models import (
+    RecurringWorkoutAlert,
+    ScheduledWorkoutDate,
+    TaskWatermark,
+    WorkoutOccurrence,
+)
+from workouts.utils import chunked
+
+
+def get_window_start():
+    # Keep the minutes the notification tasks may still catch up on.
+    current_minute = timezone.now().replace(second=0, microsecond=0)
+    return current_minute - timedelta(minutes=settings.NOTIFICATION_CATCH_UP_MINUTES)
+
+
+def get_window_end():
+    current_minute = timezone.now().replace(second=0, microsecond=0)
+    return current_minute + timedelta(days=settings.WORKOUT_OCCURRENCE_HORIZON_DAYS)
+
+
+def get_materialized_end():
+    """
+    End of the materialized part of the window: every occurrence from the
+    window start up to it is in WorkoutOccurrence, and the ones after it
+    are not until materialize_workout_occurrences runs again.
+    """
+    window_start, window_end = get_window_start(), get_window_end()
+    materialized_end = TaskWatermark.objects.get_value(
+        TaskWatermark.WORKOUT_OCCURRENCES
+    )
+    if materialized_end is None:
+        return window_start
+
+    return min(max(materialized_end, window_start), window_end)
+
+
+def iter_days(start, end):
+    day = start.date()
+    while day <= end.date():
+        yield day
+        day += timedelta(days=1)
+
+
+def combine(day, time):
+    return datetime.datetime.combine(day, time, tzinfo=datetime.timezone.utc)
+
+
+def get_recurring_alerts_on(week_day):
+    return RecurringWorkoutAlert.objects.filter(week_days__has_day=week_day)
+
+
+def expand_recurring_alert(alert, start, end):
+    """Datetimes in [start, end) at which `alert` goes off."""
+    for day in iter_days(start, end):
+        occurrence = combine(day, alert.time)
+        if day.weekday() in alert.week_days and start <= occurrence < end:
+            yield occurrence
+
+
+def materialize_scheduled_dates(scheduled_dates):
+    window_start, window_end = get_window_start(), get_window_end()
+
+    WorkoutOccurrence.objects.filter(scheduled_date__in=scheduled_dates).delete()
+    WorkoutOccurrence.objects.bulk_create(
+        [
+            WorkoutOccurrence(
+                datetime=scheduled_date.datetime,
+                workout_id=scheduled_date.workout_id,
+                user_id=scheduled_date.workout.user_id,
+                scheduled_date=scheduled_date,
+            )
+            for scheduled_date in scheduled_dates
+            if window_start <= scheduled_date.datetime < window_end
+        ]
+    )
+
+
+def materialize_recurring_alerts(alerts):
+    window_start, window_end = get_window_start(), get_window_end()
+
+    WorkoutOccurrence.objects.filter(
+        recurring_alert__in=alerts, datetime__gte=window_start
+    ).delete()
+    WorkoutOccurrence.objects.bulk_create(
+        [
+            WorkoutOccurrence(
+                datetime=occurrence,
+                workout_id=alert.workout_id,
+                user_id=alert.workout.user_id,
+                recurring_alert=alert,
+            )
+            for alert in alerts
+            for occurrence in expand_recurring_alert(alert, window_start, window_end)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def iter_scheduled_occurrences(start, end, chunk_size):
+    scheduled_dates = ScheduledWorkoutDate.objects.filter(
+        datetime__gte=start, datetime__lt=end
+    ).values("id", "datetime", "workout_id", "workout__user_id")
+
+    for scheduled_date in scheduled_dates.iterator(chunk_size=chunk_size):
+        yield WorkoutOccurrence(
+            datetime=scheduled_date["datetime"],
+            workout_id=scheduled_date["workout_id"],
+            user_id=scheduled_date["workout__user_id"],
+            scheduled_date_id=scheduled_date["id"],
+        )
+
+
+def iter_recurring_occurrences(start, end, chunk_size):
+    for day in iter_days(start, end):
+        alerts = get_recurring_alerts_on(day.weekday()).values(
+            "id", "time", "workout_id", "workout__user_id"
+        )
+
+        for alert in alerts.iterator(chunk_size=chunk_size):
+            occurrence = combine(day, alert["time"])
+            if start <= occurrence < end:
+                yield WorkoutOccurrence(
+                    datetime=occurrence,
+                    workout_id=alert["workout_id"],
+                    user_id=alert["workout__user_id"],
+                    recurring_alert_id=alert["id"],
+                )
+
+
+def materialize_window(start, end, batch_size=2000):
+    """
+    Materialize every occurrence in [start, end) and return how many there
+    are. Existing occurrences are left untouched, so windows can overlap.
+    """
+    total = 0
+    for iter_occurrences in [iter_scheduled_occurrences, iter_recurring_occurrences]:
+        occurrences = iter_occurrences(start, end, batch_size)
+        for batch in chunked(occurrences, batch_size):
+            WorkoutOccurrence.objects.bulk_create(batch, ignore_conflicts=True)
+            total += len(batch)
+
+    return total
+
+
+def get_calendar_item(occurrence):
+    return {
+        "datetime": occurrence["datetime"],
+        "workout": occurrence["workout_id"],
+        "workout_name": occurrence["workout__name"],
+        "scheduled_date": occurrence.get("scheduled_date_id"),
+        "recurring_alert": occurrence.get("recurring_alert_id"),
+    }
+
+
+def iter_materialized_user_occurrences(user, start, end, chunk_size):
+    occurrences = (
+        WorkoutOccurrence.objects.filter(
+            user=user, datetime__gte=start, datetime__lt=end
+        )
+        .order_by("datetime")
+        .values(
+            "datetime",
+            "workout_id",
+            "workout__name",
+            "scheduled_date_id",
+            "recurring_alert_id",
+        )
+    )
+    for occurrence in occurrences.iterator(chunk_size=chunk_size):
+        yield get_calendar_item(occurrence)
+
+
+def iter_expanded_user_occurrences(user, start, end, chunk_size):
+    scheduled_dates = (
+        ScheduledWorkoutDate.objects.filter(
+            workout__user=user, datetime__gte=start, datetime__lt=end
+        )
+        .order_by("datetime")
+        .values("datetime", "workout_id", "workout__name", scheduled_date_id=F("id"))
+    )
+    alerts = (
+        RecurringWorkoutAlert.objects.filter(workout__user=user)
+        .exclude(week_days=[])
+        .order_by("time")
+        .values(
+            "time",
+            "week_days",
+            "workout_id",
+            "workout__name",
+            recurring_alert_id=F("id"),
+        )
+    )
+
+    # Alerts are bucketed by week day once, so each day only walks the alerts
+    # that go off on it, already ordered by time.
+    alerts_by_week_day = [[] for _ in range(7)]
+    for alert in alerts:
+        for week_day in alert["week_days"]:
+            alerts_by_week_day[week_day].append(alert)
+
+    def iter_alert_occurrences():
+        for day in iter_days(start, end):
+            for alert in alerts_by_week_day[day.weekday()]:
+                occurrence = combine(day, alert["time"])
+                if start <= occurrence < end:
+                    yield get_calendar_item({**alert, "datetime": occurrence})
+
+    yield from heapq.merge(
+        map(get_calendar_item, scheduled_dates.iterator(chunk_size=chunk_size)),
+        iter_alert_occurrences(),
+        key=itemgetter("datetime"),
+    )
+
+
+def iter_user_occurrences(user, start, end, chunk_size=2000):
+    """
+    Occurrences of the workouts of `user` in [start, end), ordered by
+    datetime. The materialized part of the window is read from
+    WorkoutOccurrence and the rest of the range, including the end of the
+    window not materialized yet, is expanded from the dates and alerts.
+    """
+    window_start, materialized_end = get_window_start(), get_materialized_end()
+
+    if start < window_start:
+        yield from iter_expanded_user_occurrences(
+            user, start, min(end, window_start), chunk_size
+        )
+    if start < materialized_end and end > window_start:
+        yield from iter_materialized_user_occurrences(
+            user, max(start, window_start), min(end, materialized_end), chunk_size
+        )
+    if end > materialized_end:
+        yield from iter_expanded_user_occurrences(
+            user, max(start, materialized_end), end, chunk_size
+        )
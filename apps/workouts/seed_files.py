@@ -0,0 +1,139 @@
+import gzip
+import io
+import json
+import sys
+
+GZIP_MAGIC = b"\x1f\x8b"
+WHITESPACE = " \t\n\r"
+
+
+def open_seed_file(path):
+    """Open `path`, or stdin when it is `-`, as text, unzipping gzip files."""
+    file = sys.stdin.buffer if path == "-" else open(path, "rb")
+    if file.peek(len(GZIP_MAGIC))[: len(GZIP_MAGIC)] == GZIP_MAGIC:
+        file = gzip.GzipFile(fileobj=file)
+
+    return io.TextIOWrapper(file, encoding="utf-8")
+
+
+class JSONStream:
+    """
+    Incremental reader of a JSON document.
+
+    Containers are walked with `iter_object()` and `iter_array()`, and any
+    other value is decoded whole with `read_value()`. Only the value being
+    read and a chunk of the file are kept in memory.
+    """
+
+    def __init__(self, file, chunk_size=64 * 1024):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def fill(self):
+        chunk = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return bool(chunk)
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of the JSON document.")
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {char!r}.")
+
+        self.pos += 1
+        return char
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+
+            # A number at the end of the buffer may go on in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_array(self):
+        """Yield once per item, which the caller must read before resuming."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield
+            if self.expect(",]") == "]":
+                return
+
+    def iter_object(self):
+        """Yield each key, whose value the caller must read before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+def read_seed_exercises(file):
+    """Yield `(category name, exercise)` pairs of a seed file loaded at once."""
+    for category in json.load(file)["exercise_categories"]:
+        yield category.get("name"), None
+        for exercise in category.get("exercises", []):
+            yield category.get("name"), exercise
+
+
+def stream_seed_category(stream):
+    name, pending = None, []
+    for key in stream.iter_object():
+        if key == "name":
+            name = stream.read_value()
+            yield name, None
+            # Exercises listed before the name of their category.
+            yield from ((name, exercise) for exercise in pending)
+            pending.clear()
+        elif key == "exercises":
+            for _ in stream.iter_array():
+                exercise = stream.read_value()
+                if name is None:
+                    pending.append(exercise)
+                else:
+                    yield name, exercise
+        else:
+            stream.read_value()
+
+
+def stream_seed_exercises(file):
+    """Yield the same pairs as `read_seed_exercises`, parsing incrementally."""
+    stream = JSONStream(file)
+    for key in stream.iter_object():
+        if key != "exercise_categories":
+            stream.read_value()
+            continue
+
+        for _ in stream.iter_array():
+            yield from stream_seed_category(stream)
@@ -1,9 +1,171 @@
+from datetime import timedelta
+
 from rest_framework import serializers
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 from drf_spectacular.utils import extend_schema_field
 
-from . import models
+from . import analytics, models
+from .occurrences import materialize_recurring_alerts, materialize_scheduled_dates
+from .stats import increment_workout_stats, refresh_workout_stats
+
+
+class SparseFieldsetsMixin:
+    """
+    Keeps only the fields named in the `fields` and `omit` context entries.
+    Nested serializers share their parent's context, so only the top-level
+    serializer is trimmed. Unknown field names are ignored. Serializers that
+    add fields of their own do it in `get_all_fields`, so they are trimmed too.
+    """
+
+    def is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        return parent is None
+
+    def get_all_fields(self):
+        return super().get_fields()
+
+    def get_fields(self):
+        fields = self.get_all_fields()
+        requested = self.context.get("fields")
+        omitted = self.context.get("omit") or ()
+        if not self.is_top_level() or (requested is None and not omitted):
+            return fields
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if (requested is None or name in requested) and name not in omitted
+        }
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Reads related objects from `prefetched` when a BulkListSerializer loaded
+    them upfront, instead of querying them one by one.
+    """
+
+    prefetched = None
+
+    def to_internal_value(self, data):
+        if self.prefetched is None:
+            return super().to_internal_value(data)
+
+        try:
+            return self.prefetched[str(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    Validates a list of items in one pass and writes them with a single
+    `bulk_create()` or `bulk_update()`.
+
+    Updates expect `instance` to map the `id` of every item to its instance.
+    """
+
+    def prefetch_related_fields(self, data):
+        items = [item for item in data if isinstance(item, dict)]
+
+        for field in self.child.fields.values():
+            if field.read_only or not isinstance(
+                field, PrefetchedPrimaryKeyRelatedField
+            ):
+                continue
+
+            queryset = field.get_queryset()
+            pks = set()
+            for item in items:
+                try:
+                    pks.add(queryset.model._meta.pk.to_python(item[field.field_name]))
+                except (KeyError, TypeError, DjangoValidationError):
+                    pass
+
+            field.prefetched = {str(obj.pk): obj for obj in queryset.filter(pk__in=pks)}
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.prefetch_related_fields(data)
+
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        item_id = str(data.get("id")) if isinstance(data, dict) else None
+        if item_id not in self.instance:
+            raise serializers.ValidationError({"id": ["Not found."]})
+
+        self.child.instance = self.instance[item_id]
+        self.child.initial_data = data
+        try:
+            validated_data = super().run_child_validation(data)
+        finally:
+            self.child.instance = None
+
+        return {**validated_data, "id": item_id}
+
+    def validate(self, attrs):
+        if self.instance is not None:
+            ids = [item["id"] for item in attrs]
+            if len(ids) != len(set(ids)):
+                raise serializers.ValidationError("Each item can only appear once.")
+
+        return attrs
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        instances = [model(**attrs) for attrs in validated_data]
+        for instance in instances:
+            self.child.prepare_bulk_instance(instance)
+
+        model.objects.bulk_create(instances)
+        self.child.bulk_saved(instances, created=True)
+        return instances
+
+    def update(self, instances, validated_data):
+        model = self.child.Meta.model
+        updated = []
+        for attrs in validated_data:
+            instance = instances[attrs.pop("id")]
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            self.child.prepare_bulk_instance(instance)
+            updated.append(instance)
+
+        # Like save(), write every column, refreshing the auto_now ones.
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not field.primary_key and not getattr(field, "auto_now_add", False)
+        ]
+        for instance in updated:
+            for field in fields:
+                field.pre_save(instance, add=False)
+
+        model.objects.bulk_update(updated, [field.name for field in fields])
+        self.child.bulk_saved(updated, created=False)
+        return updated
+
+
+class BulkSerializerMixin:
+    """Hooks run by BulkListSerializer around its bulk writes."""
+
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
+    def prepare_bulk_instance(self, instance):
+        pass
+
+    def bulk_saved(self, instances, created):
+        pass
 
 
 class ExerciseCategorySerializer(serializers.ModelSerializer):
@@ -31,23 +193,42 @@ class NestedExerciseSerializer(serializers.ModelSerializer):
         depth = 2
 
 
-class ExercisePlanSerializer(serializers.ModelSerializer):
+class ExercisePlanSerializer(
+    SparseFieldsetsMixin, BulkSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = models.ExercisePlan
         fields = "__all__"
         read_only_fields = ["workout", "created_at", "updated_at"]
+        list_serializer_class = BulkListSerializer
+
+    @cached_property
+    def nested_exercise_serializer(self):
+        return NestedExerciseSerializer(context=self.context)
 
     def to_representation(self, instance):
         repr = super().to_representation(instance)
-        repr["exercise"] = NestedExerciseSerializer(instance.exercise).data
+        if "exercise" in repr:
+            repr["exercise"] = self.nested_exercise_serializer.to_representation(
+                instance.exercise
+            )
         return repr
 
     def create(self, validated_data):
         validated_data["workout"] = self.context["workout"]
         return super().create(validated_data)
 
+    def bulk_saved(self, instances, created):
+        if created:
+            increment_workout_stats(
+                models.UserWorkoutStats.objects.filter(
+                    user_id=instances[0].workout.user_id
+                ),
+                exercise_plans=len(instances),
+            )
+
 
-class WorkoutSerializer(serializers.ModelSerializer):
+class WorkoutSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     status = serializers.SerializerMethodField()
     exercises = serializers.SerializerMethodField()
 
@@ -62,8 +243,13 @@ class WorkoutSerializer(serializers.ModelSerializer):
     @extend_schema_field({"type": "string", "enum": ["Active", "Pending", "Completed"]})
     def get_status(self, instance):
         if instance.type == "S":
-            pending_dates = instance.scheduled_dates.filter(datetime__gt=timezone.now())
-            if pending_dates.exists():
+            has_pending_dates = getattr(instance, "has_pending_dates", None)
+            if has_pending_dates is None:
+                has_pending_dates = instance.scheduled_dates.filter(
+                    datetime__gt=timezone.now()
+                ).exists()
+
+            if has_pending_dates:
                 return "Active"
             else:
                 return "Completed"
@@ -74,7 +260,28 @@ class WorkoutSerializer(serializers.ModelSerializer):
         return "Pending"
 
     def get_exercises(self, instance) -> int:
-        return instance.exercise_plans.count()
+        exercise_count = getattr(instance, "exercise_count", None)
+        if exercise_count is None:
+            exercise_count = instance.exercise_plans.count()
+
+        return exercise_count
+
+    def get_all_fields(self):
+        fields = super().get_all_fields()
+        for name in self.context.get("expand", ()):
+            fields[name] = self.get_expanded_serializer_class(name)(
+                many=True, read_only=True
+            )
+
+        return fields
+
+    def get_expanded_serializer_class(self, name):
+        return {
+            "exercise_plans": ExercisePlanSerializer,
+            "scheduled_dates": ScheduledDateSerializer,
+            "recurring_alerts": RecurringAlertSerializer,
+            "comments": CommentSerializer,
+        }[name]
 
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
@@ -92,11 +299,12 @@ class CommentSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ScheduledDateSerializer(serializers.ModelSerializer):
+class ScheduledDateSerializer(BulkSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = models.ScheduledWorkoutDate
         fields = "__all__"
         read_only_fields = ["workout"]
+        list_serializer_class = BulkListSerializer
 
     def validate_datetime(self, value):
         current_date = timezone.now()
@@ -111,16 +319,21 @@ class ScheduledDateSerializer(serializers.ModelSerializer):
         validated_data["workout"] = self.context["workout"]
         return super().create(validated_data)
 
+    def bulk_saved(self, instances, created):
+        materialize_scheduled_dates(instances)
+        refresh_workout_stats(instances[0].workout.user_id)
+
 
-class RecurringAlertSerializer(serializers.ModelSerializer):
+class RecurringAlertSerializer(BulkSerializerMixin, serializers.ModelSerializer):
     week_days = serializers.ListField(
         child=serializers.IntegerField(min_value=0, max_value=6),
     )
 
     class Meta:
         model = models.RecurringWorkoutAlert
-        fields = "__all__"
+        exclude = ["minute_of_day"]
         read_only_fields = ["workout"]
+        list_serializer_class = BulkListSerializer
 
     def validate_week_days(self, value):
         if len(value) != len(set(value)):
@@ -131,3 +344,84 @@ class RecurringAlertSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data["workout"] = self.context["workout"]
         return super().create(validated_data)
+
+    def prepare_bulk_instance(self, instance):
+        instance.sync_schedule_fields()
+
+    def bulk_saved(self, instances, created):
+        materialize_recurring_alerts(instances)
+
+
+class UserWorkoutStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = models.UserWorkoutStats
+        exclude = ["user", "refresh_at"]
+        read_only_fields = [
+            "workouts",
+            "active_workouts",
+            "completed_workouts",
+            "pending_workouts",
+            "exercise_plans",
+            "comments",
+        ]
+
+
+class CalendarRangeSerializer(serializers.Serializer):
+    def get_fields(self):
+        # "from" is a Python keyword, so it can't be declared as an attribute.
+        return {
+            "from": serializers.DateTimeField(),
+            "to": serializers.DateTimeField(),
+        }
+
+    def validate(self, attrs):
+        if attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "Must be later than from."})
+
+        max_range = timedelta(days=settings.CALENDAR_MAX_RANGE_DAYS)
+        if attrs["to"] - attrs["from"] > max_range:
+            raise serializers.ValidationError(
+                {"to": f"The range cannot exceed {max_range.days} days."}
+            )
+
+        return attrs
+
+
+class CalendarOccurrenceSerializer(serializers.Serializer):
+    datetime = serializers.DateTimeField()
+    workout = serializers.UUIDField()
+    workout_name = serializers.CharField()
+    scheduled_date = serializers.UUIDField(allow_null=True)
+    recurring_alert = serializers.UUIDField(allow_null=True)
+
+
+class VolumeQuerySerializer(serializers.Serializer):
+    unit = serializers.ChoiceField(
+        choices=[analytics.KILOGRAMS, analytics.POUNDS], default=analytics.KILOGRAMS
+    )
+
+    def get_fields(self):
+        # "from" is a Python keyword, so it can't be declared as an attribute.
+        return {
+            **super().get_fields(),
+            "from": serializers.DateTimeField(required=False),
+            "to": serializers.DateTimeField(required=False),
+        }
+
+    def validate(self, attrs):
+        if "from" in attrs and "to" in attrs and attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "Must be later than from."})
+
+        return attrs
+
+
+class VolumeSerializer(serializers.Serializer):
+    week = serializers.DateField()
+    exercise = serializers.UUIDField()
+    exercise_name = serializers.CharField()
+    category = serializers.UUIDField()
+    category_name = serializers.CharField()
+    plans = serializers.IntegerField()
+    volume = serializers.DecimalField(
+        max_digits=None, decimal_places=2, coerce_to_string=False
+    )
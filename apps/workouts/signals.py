@@ -0,0 +1,121 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import User
+from workouts.cache import catalog_cache
+from workouts.models import (
+    ExerciseCategory,
+    Exercise,
+    ExercisePlan,
+    ScheduledWorkoutDate,
+    RecurringWorkoutAlert,
+    UserWorkoutStats,
+    Workout,
+    WorkoutComment,
+)
+from workouts.occurrences import (
+    materialize_scheduled_dates,
+    materialize_recurring_alerts,
+)
+from workouts.stats import (
+    get_new_workout_counter,
+    increment_workout_stats,
+    refresh_workout_stats,
+)
+
+ITEM_COUNTERS = {ExercisePlan: "exercise_plans", WorkoutComment: "comments"}
+
+
+@receiver(post_save, sender=ExerciseCategory)
+@receiver(post_delete, sender=ExerciseCategory)
+@receiver(post_save, sender=Exercise)
+@receiver(post_delete, sender=Exercise)
+def invalidate_catalog_cache(sender, **kwargs):
+    catalog_cache.bump_version()
+
+
+# Occurrences of deleted dates and alerts go away through the cascade. Bulk
+# writes skip these signals and materialize their occurrences themselves.
+@receiver(post_save, sender=ScheduledWorkoutDate)
+def update_scheduled_date_occurrence(sender, instance, raw=False, **kwargs):
+    if not raw:
+        materialize_scheduled_dates([instance])
+
+
+@receiver(post_save, sender=RecurringWorkoutAlert)
+def update_recurring_alert_occurrences(sender, instance, raw=False, **kwargs):
+    if not raw:
+        materialize_recurring_alerts([instance])
+
+
+# Workout stats. Bulk writes skip these signals and refresh the stats
+# themselves.
+def is_deleted_with(origin, models):
+    """Whether a deletion started from an instance or queryset of `models`."""
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, models)
+
+
+@receiver(post_save, sender=Workout)
+def update_workout_stats(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        increment_workout_stats(
+            UserWorkoutStats.objects.filter(user_id=instance.user_id),
+            workouts=1,
+            **{get_new_workout_counter(instance): 1},
+        )
+    elif instance.type != getattr(instance, "_loaded_type", None):
+        refresh_workout_stats(instance.user_id)
+
+    instance._loaded_type = instance.type
+
+
+@receiver(post_delete, sender=Workout)
+def refresh_workout_stats_on_delete(sender, instance, origin=None, **kwargs):
+    # The stats of a deleted user go away with it.
+    if not is_deleted_with(origin, User):
+        refresh_workout_stats(instance.user_id)
+
+
+@receiver(post_save, sender=ExercisePlan)
+@receiver(post_save, sender=WorkoutComment)
+def count_workout_item(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        increment_workout_stats(
+            UserWorkoutStats.objects.filter(user__workouts=instance.workout_id),
+            **{ITEM_COUNTERS[sender]: 1},
+        )
+
+
+@receiver(post_save, sender=ScheduledWorkoutDate)
+def refresh_workout_stats_on_date_save(sender, instance, raw=False, **kwargs):
+    # A date can turn its workout active or completed.
+    if not raw:
+        refresh_workout_stats(instance.workout.user_id)
+
+
+@receiver(post_delete, sender=ExercisePlan)
+@receiver(post_delete, sender=WorkoutComment)
+@receiver(post_delete, sender=ScheduledWorkoutDate)
+def update_workout_stats_on_item_delete(sender, instance, origin=None, **kwargs):
+    # Deleting the workout recounts its stats, and deleting the user drops them.
+    if is_deleted_with(origin, (Workout, User)):
+        return
+
+    if isinstance(origin, QuerySet):
+        # Every row is deleted before the first signal, so one recount
+        # covers the whole queryset.
+        if not getattr(origin, "_workout_stats_refreshed", False):
+            origin._workout_stats_refreshed = True
+            refresh_workout_stats(instance.workout.user_id)
+    elif sender is ScheduledWorkoutDate:
+        refresh_workout_stats(instance.workout.user_id)
+    else:
+        increment_workout_stats(
+            UserWorkoutStats.objects.filter(user__workouts=instance.workout_id),
+            **{ITEM_COUNTERS[sender]: -1},
+        )
@@ -0,0 +1,122 @@
+from django.db import transaction
+from django.db.models import Count, F, Min, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from workouts.models import (
+    ExercisePlan,
+    ScheduledWorkoutDate,
+    UserWorkoutStats,
+    Workout,
+    WorkoutComment,
+)
+
+COUNTERS = [
+    "workouts",
+    "active_workouts",
+    "completed_workouts",
+    "pending_workouts",
+    "exercise_plans",
+    "comments",
+]
+
+# Status of a workout that was just created, so it has no dates yet.
+NEW_WORKOUT_COUNTERS = {
+    Workout.SCHEDULED: "completed_workouts",
+    Workout.RECURRENT: "active_workouts",
+}
+
+
+def get_new_workout_counter(workout):
+    return NEW_WORKOUT_COUNTERS.get(workout.type, "pending_workouts")
+
+
+def count_per_workout(model):
+    counts = (
+        model.objects.filter(workout=OuterRef("pk"))
+        .order_by()
+        .values("workout")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def compute_workout_stats(user_id):
+    """Count the workouts of `user_id` by status, and their items, in one query."""
+    now = timezone.now()
+    last_dates = (
+        ScheduledWorkoutDate.objects.filter(workout=OuterRef("pk"))
+        .order_by("-datetime")
+        .values("datetime")[:1]
+    )
+    workouts = Workout.objects.filter(user_id=user_id).annotate(
+        last_date=Subquery(last_dates),
+        plan_count=count_per_workout(ExercisePlan),
+        comment_count=count_per_workout(WorkoutComment),
+    )
+
+    active_scheduled = Q(type=Workout.SCHEDULED, last_date__gt=now)
+    values = workouts.aggregate(
+        workouts=Count("pk"),
+        recurrent=Count("pk", filter=Q(type=Workout.RECURRENT)),
+        scheduled=Count("pk", filter=Q(type=Workout.SCHEDULED)),
+        active_scheduled=Count("pk", filter=active_scheduled),
+        exercise_plans=Coalesce(Sum("plan_count"), 0),
+        comments=Coalesce(Sum("comment_count"), 0),
+        refresh_at=Min("last_date", filter=active_scheduled),
+    )
+
+    return UserWorkoutStats(
+        user_id=user_id,
+        workouts=values["workouts"],
+        active_workouts=values["recurrent"] + values["active_scheduled"],
+        completed_workouts=values["scheduled"] - values["active_scheduled"],
+        pending_workouts=values["workouts"] - values["recurrent"] - values["scheduled"],
+        exercise_plans=values["exercise_plans"],
+        comments=values["comments"],
+        refresh_at=values["refresh_at"],
+    )
+
+
+def refresh_workout_stats(user_id):
+    """
+    Recount the stats of `user_id` and store them, creating the row if needed.
+    The row is locked before counting, so increments made meanwhile wait and
+    are added to the new counts instead of being overwritten by them. Users
+    without a row yet get no increments, so there is nothing to lock.
+    """
+    with transaction.atomic(savepoint=False):
+        locked = UserWorkoutStats.objects.select_for_update().filter(pk=user_id)
+        exists = locked.exists()
+        stats = compute_workout_stats(user_id)
+        if exists:
+            stats.save(update_fields=[*COUNTERS, "refresh_at", "updated_at"])
+        else:
+            UserWorkoutStats.objects.bulk_create(
+                [stats],
+                update_conflicts=True,
+                unique_fields=["user"],
+                update_fields=[*COUNTERS, "refresh_at", "updated_at"],
+            )
+    return stats
+
+
+def increment_workout_stats(stats, **deltas):
+    """
+    Add `deltas` to the counters of the `stats` queryset. Users without a
+    row yet are skipped, as theirs is counted in full when first read.
+    """
+    stats.update(
+        **{name: F(name) + delta for name, delta in deltas.items()},
+        updated_at=timezone.now(),
+    )
+
+
+def get_workout_stats(user_id):
+    """Return the stats of `user_id`, a primary key read unless they are stale."""
+    stats = UserWorkoutStats.objects.filter(pk=user_id).first()
+    if stats is None or (stats.refresh_at and stats.refresh_at <= timezone.now()):
+        stats = refresh_workout_stats(user_id)
+
+    return stats
@@ -1,37 +1,255 @@
+import time
+import logging
+from datetime import timedelta
+
+from django.conf import settings
 from django.utils import timezone
-from celery import shared_task
+from django.utils.dateparse import parse_datetime
+from celery import group, shared_task
+
+from workouts.models import (
+    ScheduledWorkoutDate,
+    RecurringWorkoutAlert,
+    NotificationDispatch,
+    TaskWatermark,
+    WorkoutOccurrence,
+)
+from workouts.notifications import (
+    Notification,
+    NotificationDeliveryError,
+    get_notification_backend,
+)
+from workouts.occurrences import (
+    get_materialized_end,
+    get_window_end,
+    get_window_start,
+    materialize_window,
+)
+from workouts.utils import chunked
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_pending_minutes(watermark_name):
+    """
+    Minutes to process: the current one plus any minute after the last one
+    processed, as recorded in the watermark `watermark_name`, within the
+    catch-up window. Minutes already processed are never returned again, so
+    items created for a minute that just passed are not sent late.
+    """
+    current_minute = timezone.now().replace(second=0, microsecond=0)
+    earliest_minute = current_minute - timedelta(
+        minutes=settings.NOTIFICATION_CATCH_UP_MINUTES
+    )
+
+    processed_minute = TaskWatermark.objects.get_value(watermark_name)
+    if processed_minute is None:
+        minute = current_minute
+    else:
+        minute = max(processed_minute + timedelta(minutes=1), earliest_minute)
+
+    minutes = []
+    while minute <= current_minute:
+        minutes.append(minute)
+        minute += timedelta(minutes=1)
+
+    return minutes
+
+
+def dispatch_in_batches(task, ids, occurrence):
+    """Fan out the `ids` queryset to `task` in fixed-size batches."""
+    batch_size = settings.NOTIFICATION_BATCH_SIZE
+
+    batches = [
+        task.s([str(pk) for pk in batch], occurrence.isoformat())
+        for batch in chunked(ids.iterator(chunk_size=batch_size), batch_size)
+    ]
+    if batches:
+        group(batches).apply_async()
 
-from workouts.models import ScheduledWorkoutDate, RecurringWorkoutAlert
+    return len(batches)
 
 
-def send_notification(**kwargs):
-    print("Notified!")
+def notify_pending_minutes(watermark_name, get_source_ids_at, notify_task):
+    """
+    Dispatch the sources due in each pending minute to `notify_task`, then
+    record the last minute as processed, whether anything was due or not.
+    """
+    batches = 0
+    pending_minutes = get_pending_minutes(watermark_name)
+    materialized_end = get_materialized_end()
+    for minute_start in pending_minutes:
+        source_ids = get_source_ids_at(minute_start, materialized_end)
+        batches += dispatch_in_batches(notify_task, source_ids, minute_start)
+
+    if pending_minutes:
+        TaskWatermark.objects.advance(watermark_name, pending_minutes[-1])
+
+    return batches
+
+
+def claim_notifications(source_type, source_ids, occurrence):
+    return NotificationDispatch.objects.claim(
+        source_type, source_ids, parse_datetime(occurrence)
+    )
+
+
+def send_notifications(notifications, label, claim_token):
+    """
+    Deliver `notifications`, the notification of each claimed source id. On
+    a failure the claims of the undelivered ones are given back and the
+    error raised, so the retry of the task sends them, and only them.
+    """
+    started_at = time.perf_counter()
+
+    try:
+        sent = get_notification_backend().send_many(list(notifications.values()))
+    except NotificationDeliveryError as error:
+        failed = {id(notification) for notification in error.failed}
+        NotificationDispatch.objects.release(
+            claim_token,
+            [
+                source_id
+                for source_id, notification in notifications.items()
+                if id(notification) in failed
+            ],
+        )
+        raise
+    except Exception:
+        NotificationDispatch.objects.release(claim_token)
+        raise
+
+    duration = time.perf_counter() - started_at
+    logger.info(
+        "Sent %s %s notifications in %.3fs",
+        sent,
+        label,
+        duration,
+        extra={"notification_type": label, "sent": sent, "duration": duration},
+    )
+    return {"sent": sent, "duration": duration}
+
+
+def get_occurrences_at(minute_start):
+    return WorkoutOccurrence.objects.filter(
+        datetime__gte=minute_start,
+        datetime__lt=minute_start + timedelta(minutes=1),
+    )
+
+
+def get_scheduled_dates_at(minute_start, materialized_end):
+    # Minutes past the materialized window, e.g. after the materialize task
+    # missed its runs, are read from the dates themselves.
+    if minute_start >= materialized_end:
+        scheduled_dates = ScheduledWorkoutDate.objects.filter(
+            datetime__gte=minute_start,
+            datetime__lt=minute_start + timedelta(minutes=1),
+        )
+        return scheduled_dates.values_list("id", flat=True)
+
+    return (
+        get_occurrences_at(minute_start)
+        .filter(scheduled_date__isnull=False)
+        .values_list("scheduled_date_id", flat=True)
+    )
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=settings.NOTIFICATION_MAX_RETRIES,
+)
+def notify_scheduled_dates(scheduled_date_ids, occurrence):
+    claim_token, claimed_ids = claim_notifications(
+        NotificationDispatch.SCHEDULED_DATE, scheduled_date_ids, occurrence
+    )
+    scheduled_dates = ScheduledWorkoutDate.objects.filter(
+        pk__in=claimed_ids
+    ).select_related("workout__user")
+    notifications = {
+        scheduled_date.id: Notification.for_scheduled_date(scheduled_date)
+        for scheduled_date in scheduled_dates
+    }
+    return send_notifications(notifications, "scheduled date", claim_token)
 
 
 @shared_task
 def notify_scheduled_dates_at_the_current_minute():
-    current_datetime = timezone.now()
-    scheduled_dates = ScheduledWorkoutDate.objects.filter(
-        datetime__date=current_datetime.date(),
-        datetime__hour=current_datetime.hour,
-        datetime__minute=current_datetime.minute,
+    return notify_pending_minutes(
+        TaskWatermark.SCHEDULED_DATE_NOTIFICATIONS,
+        get_scheduled_dates_at,
+        notify_scheduled_dates,
+    )
+
+
+def get_recurring_alerts_at(minute_start, materialized_end):
+    if minute_start >= materialized_end:
+        alerts = RecurringWorkoutAlert.objects.filter(
+            minute_of_day=minute_start.hour * 60 + minute_start.minute,
+            week_days__has_day=minute_start.weekday(),
+        )
+        return alerts.values_list("id", flat=True)
+
+    return (
+        get_occurrences_at(minute_start)
+        .filter(recurring_alert__isnull=False)
+        .values_list("recurring_alert_id", flat=True)
     )
 
-    for scheduled_date in scheduled_dates:
-        send_notification(scheduled_date)
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=settings.NOTIFICATION_MAX_RETRIES,
+)
+def notify_recurring_alerts(alert_ids, occurrence):
+    claim_token, claimed_ids = claim_notifications(
+        NotificationDispatch.RECURRING_ALERT, alert_ids, occurrence
+    )
+    alerts = RecurringWorkoutAlert.objects.filter(pk__in=claimed_ids).select_related(
+        "workout__user"
+    )
+    notifications = {
+        alert.id: Notification.for_recurring_alert(alert) for alert in alerts
+    }
+    return send_notifications(notifications, "recurring alert", claim_token)
 
 
 @shared_task
 def notify_recurring_alerts_at_the_current_minute():
-    current_datetime = timezone.now()
-    current_time = current_datetime.time()
-    current_week_day = current_datetime.weekday()
+    return notify_pending_minutes(
+        TaskWatermark.RECURRING_ALERT_NOTIFICATIONS,
+        get_recurring_alerts_at,
+        notify_recurring_alerts,
+    )
 
-    alerts = RecurringWorkoutAlert.objects.filter(
-        time__hour=current_time.hour,
-        time__minute=current_time.minute,
-        week_days__contains=current_week_day,
+
+@shared_task
+def delete_old_notification_dispatches():
+    oldest_occurrence = timezone.now() - timedelta(
+        days=settings.NOTIFICATION_DISPATCH_RETENTION_DAYS
     )
+    deleted, _ = NotificationDispatch.objects.filter(
+        occurrence__lt=oldest_occurrence
+    ).delete()
+    return deleted
+
 
-    for alert in alerts:
-        send_notification(alert)
+@shared_task
+def materialize_workout_occurrences():
+    """
+    Materialize the occurrences from where the last run stopped to the end
+    of the window, so runs that were missed are made up by the next one, and
+    drop the occurrences that fell behind the window.
+    """
+    window_start, window_end = get_window_start(), get_window_end()
+
+    materialized = materialize_window(
+        get_materialized_end(),
+        window_end,
+        batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    )
+    TaskWatermark.objects.advance(TaskWatermark.WORKOUT_OCCURRENCES, window_end)
+    deleted, _ = WorkoutOccurrence.objects.filter(datetime__lt=window_start).delete()
+    return {"materialized": materialized, "deleted": deleted}
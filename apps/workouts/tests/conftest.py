@@ -1,6 +1,9 @@
 import json
 import pytest
 
+from workout_tracker.celery import app as celery_app
+from workouts.cache import catalog_cache
+from workouts.notifications import InMemoryBackend
 from .factories import (
     ExerciseCategoryFactory,
     ExerciseFactory,
@@ -12,6 +15,30 @@ from .factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    catalog_cache.clear()
+    yield
+    catalog_cache.clear()
+
+
+@pytest.fixture
+def celery_eager():
+    celery_app.conf.task_always_eager = True
+    celery_app.conf.task_eager_propagates = True
+    yield
+    celery_app.conf.task_always_eager = False
+    celery_app.conf.task_eager_propagates = False
+
+
+@pytest.fixture
+def notification_outbox(settings):
+    settings.NOTIFICATION_BACKEND = "workouts.notifications.InMemoryBackend"
+    InMemoryBackend.outbox.clear()
+    yield InMemoryBackend.outbox
+    InMemoryBackend.outbox.clear()
+
+
 @pytest.fixture
 def seed_data():
     return {
@@ -43,10 +70,10 @@ def seed_data():
 
 
 @pytest.fixture
-def mock_open_seed_data(mocker, seed_data):
-    mock_open = mocker.mock_open(read_data=json.dumps(seed_data))
-    mocker.patch("builtins.open", mock_open)
-    return mock_open
+def seed_file(tmp_path, seed_data):
+    path = tmp_path / "seed_data.json"
+    path.write_text(json.dumps(seed_data))
+    return path
 
 
 @pytest.fixture
@@ -0,0 +1,56 @@
+import pytest
+
+from workouts.cache import CatalogCache
+
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestCatalogCache:
+    @pytest.fixture
+    def cache(self):
+        cache = CatalogCache(maxsize=2)
+        cache.clear()
+        return cache
+
+    def test_get_or_set_computes_value_only_once(self, cache, mocker):
+        compute = mocker.Mock(return_value=["Cardio"])
+
+        assert cache.get_or_set("categories", compute) == ["Cardio"]
+        assert cache.get_or_set("categories", compute) == ["Cardio"]
+
+        compute.assert_called_once()
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["local_hits"] == 1
+
+    def test_values_are_shared_between_processes(self, cache, mocker):
+        other_process_cache = CatalogCache(maxsize=2)
+        cache.get_or_set("categories", lambda: ["Cardio"])
+
+        compute = mocker.Mock()
+        value = other_process_cache.get_or_set("categories", compute)
+
+        assert value == ["Cardio"]
+        compute.assert_not_called()
+        assert other_process_cache.stats()["shared_hits"] == 1
+
+    def test_bump_version_invalidates_entries(self, cache, mocker):
+        cache.get_or_set("categories", lambda: ["Cardio"])
+        old_version = cache.get_version()
+
+        cache.bump_version()
+        compute = mocker.Mock(return_value=["Strength"])
+
+        assert cache.get_version() != old_version
+        assert cache.get_or_set("categories", compute) == ["Strength"]
+        compute.assert_called_once()
+
+    def test_local_cache_evicts_least_recently_used_entries(self, cache):
+        cache.get_or_set("first", lambda: 1)
+        cache.get_or_set("second", lambda: 2)
+        cache.get_or_set("first", lambda: 1)
+        cache.get_or_set("third", lambda: 3)
+
+        assert cache.stats()["local_size"] == 2
+        assert cache.get_or_set("first", lambda: None) == 1
+        assert cache.stats()["local_hits"] == 2
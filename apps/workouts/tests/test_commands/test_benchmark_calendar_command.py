@@ -0,0 +1,29 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from users.models import User
+from workouts.models import Workout, WorkoutOccurrence
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+class TestBenchmarkCalendarCommand:
+    def test_reports_every_range_and_rolls_back_the_data(self):
+        out = StringIO()
+        call_command(
+            "benchmark_calendar",
+            workouts=10,
+            days=[7, 60],
+            repeat=1,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        assert "7 days:" in output
+        assert "60 days:" in output
+        assert not User.objects.exists()
+        assert not Workout.objects.exists()
+        assert not WorkoutOccurrence.objects.exists()
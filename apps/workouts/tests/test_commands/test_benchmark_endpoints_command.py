@@ -0,0 +1,80 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import URLResolver
+
+from workouts import urls
+from workouts.models import ExercisePlan, Workout
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+def iter_url_patterns(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_patterns(pattern.url_patterns)
+        else:
+            yield pattern
+
+
+@pytest.fixture
+def load_data():
+    call_command(
+        "generate_load_data",
+        users=2,
+        workouts_per_user=6,
+        exercises=5,
+        stdout=StringIO(),
+    )
+
+
+class TestBenchmarkEndpointsCommand:
+    def benchmark(self, **options):
+        out = StringIO()
+        call_command(
+            "benchmark_endpoints", repeat=1, task_items=5, stdout=out, **options
+        )
+        return out.getvalue()
+
+    def test_times_every_endpoint_and_task(self, load_data):
+        output = self.benchmark()
+
+        endpoints = {
+            f"{method.upper()} {pattern.name}"
+            for pattern in iter_url_patterns(urls.urlpatterns)
+            for method in pattern.callback.actions
+            if method != "head"
+        }
+        timed = {" ".join(line.split()[:2]) for line in output.splitlines()}
+
+        assert endpoints <= timed
+        assert "TASK notify_scheduled_dates_at_the_current_minute" in timed
+        assert "TASK notify_recurring_alerts_at_the_current_minute" in timed
+
+    def test_rolls_back_the_changes(self, load_data):
+        workouts = Workout.objects.count()
+        plans = ExercisePlan.objects.count()
+
+        self.benchmark()
+
+        assert Workout.objects.count() == workouts
+        assert ExercisePlan.objects.count() == plans
+
+    def test_compares_the_results_with_a_saved_baseline(self, load_data, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        self.benchmark(save_baseline=str(baseline))
+
+        results = json.loads(baseline.read_text())
+        assert results["GET workouts-list"]["queries"] > 0
+
+        results["GET workouts-list"]["queries"] = 0
+        baseline.write_text(json.dumps(results))
+
+        with pytest.raises(CommandError, match="GET workouts-list"):
+            self.benchmark(compare=str(baseline))
+
+    def test_fails_without_data(self):
+        with pytest.raises(CommandError):
+            self.benchmark()
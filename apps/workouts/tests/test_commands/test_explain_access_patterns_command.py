@@ -0,0 +1,31 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+class TestExplainAccessPatternsCommand:
+    def test_explains_every_list_endpoint(self, workout_created):
+        out = StringIO()
+        call_command(
+            "explain_access_patterns", workout=str(workout_created.id), stdout=out
+        )
+
+        output = out.getvalue()
+        for name in [
+            "workouts",
+            "exercise_plans",
+            "comments",
+            "scheduled_dates",
+            "recurring_alerts",
+            "exercise_categories",
+        ]:
+            assert name in output
+
+    def test_fails_without_workouts(self):
+        with pytest.raises(CommandError, match="There are no workouts to explain."):
+            call_command("explain_access_patterns", stdout=StringIO())
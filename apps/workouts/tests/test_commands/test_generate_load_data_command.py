@@ -0,0 +1,72 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from users.models import User
+from workouts.models import (
+    ExercisePlan,
+    RecurringWorkoutAlert,
+    ScheduledWorkoutDate,
+    Workout,
+    WorkoutComment,
+    WorkoutOccurrence,
+)
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+def generate(**options):
+    call_command(
+        "generate_load_data",
+        users=3,
+        workouts_per_user=4,
+        plans_per_workout=2,
+        comments_per_workout=1,
+        dates_per_workout=3,
+        alerts_per_workout=2,
+        exercises=10,
+        batch_size=2,
+        stdout=StringIO(),
+        **options,
+    )
+
+
+class TestGenerateLoadDataCommand:
+    def test_creates_the_requested_rows(self):
+        generate()
+
+        scheduled = Workout.objects.filter(type=Workout.SCHEDULED).count()
+        recurrent = Workout.objects.filter(type=Workout.RECURRENT).count()
+
+        assert User.objects.count() == 3
+        assert scheduled + recurrent == 12
+        assert ExercisePlan.objects.count() == 24
+        assert WorkoutComment.objects.count() == 12
+        assert ScheduledWorkoutDate.objects.count() == scheduled * 3
+        assert RecurringWorkoutAlert.objects.count() == recurrent * 2
+        assert WorkoutOccurrence.objects.exists()
+
+    def test_alerts_have_their_schedule_fields_in_sync(self):
+        generate()
+
+        for alert in RecurringWorkoutAlert.objects.all():
+            assert alert.minute_of_day == alert.time.hour * 60 + alert.time.minute
+
+    def test_same_seed_generates_the_same_data(self):
+        generate(seed=1)
+        first = list(Workout.objects.order_by("name").values_list("name", "type"))
+        Workout.objects.all().delete()
+        User.objects.all().delete()
+
+        generate(seed=1)
+
+        assert list(Workout.objects.order_by("name").values_list("name", "type")) == (
+            first
+        )
+
+    def test_fails_if_the_seed_was_already_generated(self):
+        generate()
+
+        with pytest.raises(CommandError):
+            generate()
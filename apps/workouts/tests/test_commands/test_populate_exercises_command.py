@@ -1,45 +1,105 @@
+import json
 import os
+import uuid
+from io import StringIO
+from unittest.mock import call
 
 import pytest
-from unittest.mock import call
 from django.conf import settings
+from django.core.management import call_command
 from django_mock_queries.query import MockSet, MockModel
 
 from workouts.management.commands.populate_exercises import (
     Command as PopulateExercisesCommand,
 )
 from workouts.models import ExerciseCategory, Exercise
+from workouts.seed_files import open_seed_file
 
 
 pytestmark = [pytest.mark.unit]
 
 
 class TestPopulateExercisesCommand:
-    def test_handle(self, mocker, mock_open_seed_data, seed_data):
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_handle(self, mocker, seed_file, seed_data, stream):
         exercise_categories_data = seed_data["exercise_categories"]
 
         mock_insert_exercise_categories = mocker.patch.object(
             PopulateExercisesCommand, "insert_exercise_categories"
         )
         mock_insert_exercises = mocker.patch.object(
-            PopulateExercisesCommand, "insert_exercises"
+            PopulateExercisesCommand,
+            "insert_exercises",
+            return_value={"inserted": 1, "updated": 1, "unchanged": 1},
         )
+        mocker.patch("workouts.management.commands.populate_exercises.transaction")
         command = PopulateExercisesCommand()
         mock_stdout_write = mocker.patch.object(command.stdout, "write")
 
-        command.handle()
+        command.handle(file=str(seed_file), stream=stream, batch_size=1000)
 
-        mock_open_seed_data.assert_called_once_with(
-            os.path.join(
-                settings.BASE_DIR, "apps", "workouts", "data", "seed_data.json"
-            ),
-            "r",
-        )
         mock_insert_exercise_categories.assert_called_once_with(
             [{"name": category["name"]} for category in exercise_categories_data]
         )
         mock_insert_exercises.assert_called_once_with(exercise_categories_data)
-        mock_stdout_write.assert_called_once_with("Exercises added successfully!")
+        assert (
+            mock_stdout_write.call_args_list[0]
+            .args[0]
+            .startswith("Processed 3 exercises in ")
+        )
+        mock_stdout_write.assert_any_call(
+            "Total: 1 exercises inserted, 1 updated, 1 unchanged."
+        )
+        mock_stdout_write.assert_called_with("Exercises added successfully!")
+
+    def test_handle_reads_the_bundled_seed_file_by_default(self, mocker):
+        mock_open_seed_file = mocker.patch(
+            "workouts.management.commands.populate_exercises.open_seed_file",
+            side_effect=open_seed_file,
+        )
+        mocker.patch.object(PopulateExercisesCommand, "insert_exercise_categories")
+        mocker.patch.object(
+            PopulateExercisesCommand,
+            "insert_exercises",
+            return_value={"inserted": 0, "updated": 0, "unchanged": 0},
+        )
+        mocker.patch("workouts.management.commands.populate_exercises.transaction")
+
+        call_command("populate_exercises", stdout=StringIO())
+
+        mock_open_seed_file.assert_called_once_with(
+            os.path.join(
+                settings.BASE_DIR, "apps", "workouts", "data", "seed_data.json"
+            )
+        )
+
+    def test_handle_writes_in_batches(self, mocker, seed_file, seed_data):
+        mock_insert_exercise_categories = mocker.patch.object(
+            PopulateExercisesCommand, "insert_exercise_categories"
+        )
+        mock_insert_exercises = mocker.patch.object(
+            PopulateExercisesCommand,
+            "insert_exercises",
+            return_value={"inserted": 1, "updated": 1, "unchanged": 1},
+        )
+        mocker.patch("workouts.management.commands.populate_exercises.transaction")
+        command = PopulateExercisesCommand()
+        mock_stdout_write = mocker.patch.object(command.stdout, "write")
+
+        command.handle(file=str(seed_file), stream=True, batch_size=2)
+
+        cardio, flexibility = seed_data["exercise_categories"]
+        # Each batch holds two (category, exercise) pairs, the category
+        # alone being one of them.
+        assert mock_insert_exercises.call_args_list == [
+            call([cardio]),
+            call([{"name": "Flexibility", "exercises": flexibility["exercises"][:1]}]),
+            call([{"name": "Flexibility", "exercises": flexibility["exercises"][1:]}]),
+        ]
+        assert mock_insert_exercise_categories.call_count == 3
+        mock_stdout_write.assert_any_call(
+            "Total: 3 exercises inserted, 3 updated, 3 unchanged."
+        )
 
     def test_insert_exercise_categories__duplicate_categories_are_removed(self, mocker):
         mock_remove_duplicated = mocker.patch(
@@ -77,7 +137,8 @@ class TestPopulateExercisesCommand:
             [
                 mock_exercise_category(name="Strength"),
                 mock_exercise_category(name="flexibility"),
-            ]
+            ],
+            ignore_conflicts=True,
         )
         mock_stdout_write.assert_called_once_with(
             "Successfully added 2 new exercise categories."
@@ -116,30 +177,20 @@ class TestPopulateExercisesCommand:
     def test_insert_exercises__categories_that_do_not_exist_are_ignored(
         self, mocker, seed_data
     ):
-        exercise_categories_data = seed_data["exercise_categories"]
-        first_category = exercise_categories_data[0]
-        second_category = exercise_categories_data[1]
+        first_category, second_category = seed_data["exercise_categories"]
+        first_id, second_id = uuid.uuid4(), uuid.uuid4()
 
-        mock_exercise_category = mocker.patch(
-            "workouts.management.commands.populate_exercises.ExerciseCategory"
-        )
-        mock_exercise = mocker.patch(
-            "workouts.management.commands.populate_exercises.Exercise"
-        )
-        mocker.patch(
-            "workouts.management.commands.populate_exercises.remove_duplicate_exercises_by_name_and_category"
+        mock_exercise_category_objects = mocker.patch.object(
+            ExerciseCategory, "objects"
         )
-        #  Definir DoesNotExist como una excepción dentro del mock
-        mock_exercise_category.DoesNotExist = type("DoesNotExist", (Exception,), {})
-
-        mock_first_category = MockModel(name=first_category["name"])
-        mock_second_category = MockModel(name=second_category["name"])
+        mock_exercise_objects = mocker.patch.object(Exercise, "objects")
 
-        mock_exercise_category.objects.get.side_effect = [
-            mock_exercise_category.DoesNotExist("first error"),
-            mock_first_category,
-            mock_second_category,
+        mock_exercise_category_objects.filter.return_value.values_list.return_value = [
+            (first_category["name"], first_id),
+            (second_category["name"], second_id),
         ]
+        mock_exercise_objects.filter.return_value.values_list.return_value = []
+
         data_to_insert = [
             {
                 "name": "Not exist",
@@ -152,125 +203,178 @@ class TestPopulateExercisesCommand:
         ]
 
         command = PopulateExercisesCommand()
+        mocker.patch.object(command.stdout, "write")
         command.insert_exercises(data_to_insert)
 
-        assert mock_exercise.objects.filter.call_count == 2
-        assert mock_exercise.objects.filter.call_args_list == [
-            call(
-                name__in=[item["name"] for item in first_category["exercises"]],
-                category=mock_first_category,
-            ),
-            call(
-                name__in=[item["name"] for item in second_category["exercises"]],
-                category=mock_second_category,
-            ),
-        ]
+        mock_exercise_category_objects.filter.assert_called_once_with(
+            name__in=["Not exist", first_category["name"], second_category["name"]]
+        )
+        mock_exercise_objects.filter.assert_called_once_with(
+            category_id__in=[first_id, second_id],
+            name__in=[
+                "Exercise",
+                *(item["name"] for item in first_category["exercises"]),
+                *(item["name"] for item in second_category["exercises"]),
+            ],
+        )
+        (exercises,), _ = mock_exercise_objects.bulk_create.call_args
+        assert [(item.name, item.category_id) for item in exercises] == [
+            (item["name"], first_id) for item in first_category["exercises"]
+        ] + [(item["name"], second_id) for item in second_category["exercises"]]
 
-    def test_insert_exercises__add_only_exercises_that_do_not_exist(
+    def test_insert_exercises__upsert_new_and_changed_exercises(
         self, mocker, seed_data
     ):
-        exercise_categories_data = seed_data["exercise_categories"]
-        first_category = exercise_categories_data[0]
-        second_category = exercise_categories_data[1]
+        first_category, second_category = seed_data["exercise_categories"]
+        first_id, second_id = uuid.uuid4(), uuid.uuid4()
+        unchanged, changed = second_category["exercises"]
 
-        mock_exercise_category = mocker.patch(
-            "workouts.management.commands.populate_exercises.ExerciseCategory"
-        )
-        mock_exercise = mocker.patch(
-            "workouts.management.commands.populate_exercises.Exercise"
-        )
-        mock_remove_duplicated_exercises = mocker.patch(
-            "workouts.management.commands.populate_exercises.remove_duplicate_exercises_by_name_and_category"
+        mock_exercise_category_objects = mocker.patch.object(
+            ExerciseCategory, "objects"
         )
+        mock_exercise_objects = mocker.patch.object(Exercise, "objects")
 
-        input_data = [first_category, second_category]
-        mock_first_category = MockModel(name=first_category["name"])
-        mock_second_category = MockModel(name=second_category["name"])
-
-        mock_exercise_category.objects.get.side_effect = [
-            mock_first_category,
-            mock_second_category,
+        mock_exercise_category_objects.filter.return_value.values_list.return_value = [
+            (first_category["name"], first_id),
+            (second_category["name"], second_id),
         ]
-        mock_exercise.objects.filter.side_effect = [
-            MockSet(),
-            MockSet(MockModel(**second_category["exercises"][0])),
+        # The exercise of the first category only exists under the second one.
+        mock_exercise_objects.filter.return_value.values_list.return_value = [
+            (unchanged["name"], second_id, unchanged["description"]),
+            (changed["name"], second_id, "Old description"),
+            (first_category["exercises"][0]["name"], second_id, ""),
         ]
 
-        exercises_to_add_expected = [
-            mock_exercise(**item, category=mock_first_category)
-            for item in first_category["exercises"]
-        ] + [
-            mock_exercise(**item, category=mock_second_category)
-            for item in second_category["exercises"][1::]
-        ]
-
-        mock_remove_duplicated_exercises.return_value = exercises_to_add_expected
-
         command = PopulateExercisesCommand()
         mock_stdout_write = mocker.patch.object(command.stdout, "write")
 
-        command.insert_exercises(input_data)
+        counts = command.insert_exercises([first_category, second_category])
 
-        mock_remove_duplicated_exercises.assert_called_once_with(
-            exercises_to_add_expected
-        )
-        mock_exercise.objects.bulk_create.assert_called_once_with(
-            exercises_to_add_expected
+        (exercises,), kwargs = mock_exercise_objects.bulk_create.call_args
+        assert [(item.name, item.category_id) for item in exercises] == [
+            (first_category["exercises"][0]["name"], first_id),
+            (changed["name"], second_id),
+        ]
+        assert kwargs == {
+            "update_conflicts": True,
+            "unique_fields": ["category", "name"],
+            "update_fields": ["description"],
+        }
+        assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+        mock_stdout_write.assert_called_once_with(
+            "1 exercises inserted, 1 updated, 1 unchanged."
         )
-        mock_stdout_write.assert_called_once_with("Successfully added 2 new exercises.")
 
-    def test_insert_exercises__all_already_exist(self, mocker, seed_data):
-        exercise_categories_data = seed_data["exercise_categories"]
-        category_data = exercise_categories_data[0]
+    def test_insert_exercises__duplicate_exercises_are_added_once(
+        self, mocker, seed_data
+    ):
+        category = seed_data["exercise_categories"][0]
+        category_id = uuid.uuid4()
 
-        mock_exercise_category = mocker.patch(
-            "workouts.management.commands.populate_exercises.ExerciseCategory"
+        mock_exercise_category_objects = mocker.patch.object(
+            ExerciseCategory, "objects"
         )
         mock_exercise_objects = mocker.patch.object(Exercise, "objects")
-        mock_remove_duplicated_exercises = mocker.patch(
-            "workouts.management.commands.populate_exercises.remove_duplicate_exercises_by_name_and_category"
-        )
 
-        input_data = [category_data]
-        mock_category = mock_exercise_category(name=category_data["name"])
+        mock_exercise_category_objects.filter.return_value.values_list.return_value = [
+            (category["name"], category_id)
+        ]
+        mock_exercise_objects.filter.return_value.values_list.return_value = []
+
+        command = PopulateExercisesCommand()
+        mocker.patch.object(command.stdout, "write")
+
+        command.insert_exercises([category, category])
+
+        (exercises,), _ = mock_exercise_objects.bulk_create.call_args
+        assert [item.name for item in exercises] == [
+            item["name"] for item in category["exercises"]
+        ]
 
-        mock_exercise_category.objects.get.return_value = mock_category
+    def test_insert_exercises__all_already_exist_unchanged(self, mocker, seed_data):
+        category = seed_data["exercise_categories"][0]
+        category_id = uuid.uuid4()
 
-        mock_exercise_objects.filter.return_value = MockSet(
-            *[
-                MockModel(**item, category=mock_category)
-                for item in category_data["exercises"]
-            ]
+        mock_exercise_category_objects = mocker.patch.object(
+            ExerciseCategory, "objects"
         )
+        mock_exercise_objects = mocker.patch.object(Exercise, "objects")
 
-        mock_remove_duplicated_exercises.return_value = []
+        mock_exercise_category_objects.filter.return_value.values_list.return_value = [
+            (category["name"], category_id)
+        ]
+        mock_exercise_objects.filter.return_value.values_list.return_value = [
+            (item["name"], category_id, item["description"])
+            for item in category["exercises"]
+        ]
 
         command = PopulateExercisesCommand()
         mock_stdout_write = mocker.patch.object(command.stdout, "write")
 
-        command.insert_exercises(input_data)
+        counts = command.insert_exercises([category])
 
-        mock_remove_duplicated_exercises.assert_called_once_with([])
         mock_exercise_objects.bulk_create.assert_not_called()
-        mock_stdout_write.assert_called_once_with("No new exercises to add.")
+        assert counts == {"inserted": 0, "updated": 0, "unchanged": 1}
+        mock_stdout_write.assert_called_once_with(
+            "0 exercises inserted, 0 updated, 1 unchanged."
+        )
 
     def test_insert_exercises__empty_list(self, mocker):
         mock_exercise_category_objects = mocker.patch.object(
             ExerciseCategory, "objects"
         )
         mock_exercise_objects = mocker.patch.object(Exercise, "objects")
-        mock_remove_duplicated_exercises = mocker.patch(
-            "workouts.management.commands.populate_exercises.remove_duplicate_exercises_by_name_and_category"
-        )
 
-        input_data = []
-        mock_remove_duplicated_exercises.return_value = []
+        mock_exercise_category_objects.filter.return_value.values_list.return_value = []
+        mock_exercise_objects.filter.return_value.values_list.return_value = []
 
         command = PopulateExercisesCommand()
         mock_stdout_write = mocker.patch.object(command.stdout, "write")
-        command.insert_exercises(input_data)
+        command.insert_exercises([])
 
-        mock_exercise_category_objects.assert_not_called()
-        mock_remove_duplicated_exercises.assert_called_once_with([])
         mock_exercise_objects.bulk_create.assert_not_called()
-        mock_stdout_write.assert_called_once_with("No new exercises to add.")
+        mock_stdout_write.assert_called_once_with(
+            "0 exercises inserted, 0 updated, 0 unchanged."
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestPopulateExercisesQueries:
+    @pytest.mark.parametrize("size", [5, 50])
+    def test_query_count_does_not_depend_on_the_seed_size(
+        self, django_assert_num_queries, size
+    ):
+        exercise_categories = [
+            {
+                "name": f"Category {index}",
+                "exercises": [
+                    {"name": f"Exercise {number}", "description": ""}
+                    for number in range(size)
+                ],
+            }
+            for index in range(3)
+        ]
+        command = PopulateExercisesCommand(stdout=StringIO())
+
+        with django_assert_num_queries(5):
+            command.insert_exercise_categories(
+                [{"name": item["name"]} for item in exercise_categories]
+            )
+            command.insert_exercises(exercise_categories)
+
+        assert Exercise.objects.count() == size * 3
+
+    def test_changed_descriptions_are_updated(self, seed_file, seed_data):
+        call_command("populate_exercises", file=str(seed_file), stdout=StringIO())
+
+        seed_data["exercise_categories"][0]["exercises"][0]["description"] = "New"
+        seed_file.write_text(json.dumps(seed_data))
+        stdout = StringIO()
+        call_command("populate_exercises", file=str(seed_file), stdout=stdout)
+
+        assert Exercise.objects.get(name="Running").description == "New"
+        assert Exercise.objects.count() == 3
+        assert "Total: 0 exercises inserted, 1 updated, 2 unchanged." in (
+            stdout.getvalue()
+        )
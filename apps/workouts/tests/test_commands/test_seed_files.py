@@ -0,0 +1,84 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from workouts.seed_files import (
+    JSONStream,
+    open_seed_file,
+    read_seed_exercises,
+    stream_seed_exercises,
+)
+
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestStreamSeedExercises:
+    def test_yields_the_same_pairs_as_loading_the_file_at_once(self, seed_data):
+        document = json.dumps(seed_data, indent=2)
+
+        assert list(stream_seed_exercises(io.StringIO(document))) == list(
+            read_seed_exercises(io.StringIO(document))
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7])
+    def test_values_split_across_chunks_are_read_whole(self, chunk_size):
+        stream = JSONStream(
+            io.StringIO('{"a": [12345, "x\\"y", true, null, {"b": -1.5e3}]}'),
+            chunk_size=chunk_size,
+        )
+
+        values = {}
+        for key in stream.iter_object():
+            values[key] = []
+            for _ in stream.iter_array():
+                values[key].append(stream.read_value())
+
+        assert values == {"a": [12345, 'x"y', True, None, {"b": -1500.0}]}
+
+    def test_exercises_before_the_category_name_are_kept(self):
+        document = json.dumps(
+            {
+                "version": 2,
+                "exercise_categories": [
+                    {
+                        "exercises": [{"name": "Running"}],
+                        "name": "Cardio",
+                        "extra": {"ignored": [1, 2]},
+                    },
+                    {"name": "Empty", "exercises": []},
+                ],
+            }
+        )
+
+        assert list(stream_seed_exercises(io.StringIO(document))) == [
+            ("Cardio", None),
+            ("Cardio", {"name": "Running"}),
+            ("Empty", None),
+        ]
+
+    def test_truncated_document_fails(self):
+        with pytest.raises(ValueError):
+            list(stream_seed_exercises(io.StringIO('{"exercise_categories": [{"na')))
+
+
+class TestOpenSeedFile:
+    def test_reads_plain_files(self, seed_file, seed_data):
+        with open_seed_file(str(seed_file)) as file:
+            assert json.load(file) == seed_data
+
+    def test_reads_gzip_files(self, tmp_path, seed_data):
+        path = tmp_path / "seed_data.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(seed_data).encode()))
+
+        with open_seed_file(str(path)) as file:
+            assert json.load(file) == seed_data
+
+    def test_reads_stdin_with_a_dash(self, mocker, seed_data):
+        stdin = mocker.patch("workouts.seed_files.sys.stdin")
+        stdin.buffer = io.BufferedReader(io.BytesIO(json.dumps(seed_data).encode()))
+
+        with open_seed_file("-") as file:
+            assert json.load(file) == seed_data
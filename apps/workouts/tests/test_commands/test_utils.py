@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from django_mock_queries.query import MockModel
 
@@ -46,15 +48,13 @@ class TestRemoveDuplicatedItemsByName:
 
 class TestRemoveDuplicateExercisesByNameCategory:
     def test_return_first_ocurrence_of_the_name_and_category_pair(self):
-        cardio_category = MockModel(name="Cardio")
-        flexibility_category = MockModel(name="Flexibility")
+        cardio_id = uuid.uuid4()
+        flexibility_id = uuid.uuid4()
 
-        exercise_one = MockModel(name="Running", category=cardio_category)
-        exercise_two = MockModel(
-            name="Hamstring Stretch", category=flexibility_category
-        )
-        exercise_one_duplicate = MockModel(name="Running", category=cardio_category)
-        exercise_three = MockModel(name="Running", category=flexibility_category)
+        exercise_one = MockModel(name="Running", category_id=cardio_id)
+        exercise_two = MockModel(name="Hamstring Stretch", category_id=flexibility_id)
+        exercise_one_duplicate = MockModel(name="Running", category_id=cardio_id)
+        exercise_three = MockModel(name="Running", category_id=flexibility_id)
 
         result = remove_duplicate_exercises_by_name_and_category(
             [exercise_one, exercise_two, exercise_one_duplicate, exercise_three]
@@ -63,21 +63,19 @@ class TestRemoveDuplicateExercisesByNameCategory:
         assert result == [exercise_one, exercise_two, exercise_three]
 
     @pytest.mark.parametrize(
-        "name, category",
+        "name, category_id",
         [
-            (None, MockModel(name="Cardio")),
+            (None, uuid.uuid4()),
             ("Test Exercise", None),
             (None, None),
         ],
     )
     def test_exercises_without_name_or_category_or_both_are_excluded(
-        self, name, category
+        self, name, category_id
     ):
-        cardio_category = MockModel(name="Cardio")
-        flexibility_category = MockModel(name="Flexibility")
-        exercise1 = MockModel(name="Running", category=cardio_category)
-        exercise2 = MockModel(name=name, category=category)
-        exercise3 = MockModel(name="Hamstring Stretch", category=flexibility_category)
+        exercise1 = MockModel(name="Running", category_id=uuid.uuid4())
+        exercise2 = MockModel(name=name, category_id=category_id)
+        exercise3 = MockModel(name="Hamstring Stretch", category_id=uuid.uuid4())
 
         result = remove_duplicate_exercises_by_name_and_category(
             [exercise1, exercise2, exercise3]
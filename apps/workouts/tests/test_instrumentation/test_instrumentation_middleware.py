@@ -0,0 +1,101 @@
+import pytest
+from django.urls import reverse
+
+from workout_tracker.instrumentation import (
+    QueryBudgetExceeded,
+    RequestMetrics,
+    endpoint_metrics,
+)
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_endpoint_metrics():
+    endpoint_metrics.reset()
+    yield
+    endpoint_metrics.reset()
+
+
+def test_server_timing_lists_queries_and_durations():
+    metrics = RequestMetrics()
+    metrics.queries = 3
+    metrics.durations = {"db": 0.0125, "serializer": 0.002}
+
+    assert metrics.get_server_timing(0.05) == (
+        'db;dur=12.50;desc="3 queries", serializer;dur=2.00, total;dur=50.00'
+    )
+
+
+class TestInstrumentationMiddleware:
+    url = reverse("workouts-list")
+
+    def test_response_has_server_timing_header(
+        self, api_client, create_batch_workouts_with, user_created
+    ):
+        create_batch_workouts_with(size=2, user=user_created)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 200
+        timings = [item.split(";")[0] for item in response["Server-Timing"].split(", ")]
+        assert timings == ["db", "serializer", "total"]
+        assert 'desc="2 queries"' in response["Server-Timing"]
+
+    def test_requests_are_aggregated_by_endpoint(self, api_client, user_created):
+        api_client.force_authenticate(user=user_created)
+        api_client.get(self.url, format="json")
+        api_client.get(self.url, format="json")
+        api_client.post(self.url, {"name": "Legs"}, format="json")
+
+        stats = endpoint_metrics.stats()
+
+        assert stats["GET workouts-list"]["requests"] == 2
+        assert stats["GET workouts-list"]["max_queries"] == 1
+        assert stats["GET workouts-list"]["query_budget"] == 7
+        assert stats["POST workouts-list"]["requests"] == 1
+
+    def test_request_over_budget_raises_in_strict_mode(
+        self, api_client, user_created, settings
+    ):
+        settings.QUERY_BUDGETS = {"GET workouts-list": 0}
+
+        api_client.force_authenticate(user=user_created)
+        with pytest.raises(QueryBudgetExceeded):
+            api_client.get(self.url, format="json")
+
+    def test_request_over_budget_is_logged_otherwise(
+        self, api_client, user_created, settings, caplog
+    ):
+        settings.QUERY_BUDGETS = {"GET workouts-list": 0}
+        settings.QUERY_BUDGETS_STRICT = False
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 200
+        assert "GET workouts-list ran 1 queries, over its budget of 0." in caplog.text
+
+
+class TestMetricsView:
+    url = reverse("metrics")
+
+    def test_admin_can_read_metrics(self, api_client, user_created):
+        user_created.is_staff = True
+        user_created.save()
+
+        api_client.force_authenticate(user=user_created)
+        api_client.get(reverse("workouts-list"), format="json")
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["GET workouts-list"]["requests"] == 1
+        assert "avg_db_ms" in response.data["GET workouts-list"]
+
+    def test_regular_user_cannot_read_metrics(self, api_client, user_created):
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 403
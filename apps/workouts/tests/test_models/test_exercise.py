@@ -1,6 +1,7 @@
 import pytest
+from django.db import IntegrityError
 
-from workouts.models import Exercise
+from workouts.models import Exercise, ExerciseCategory
 
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
@@ -75,3 +76,12 @@ class TestExerciseModel:
 
         assert category.exercises.count() == 1
         assert category.exercises.first() == exercise
+
+    def test_names_are_unique_per_category(self, exercise_category_created):
+        Exercise.objects.create(name="Running", category=exercise_category_created)
+        Exercise.objects.create(
+            name="Running", category=ExerciseCategory.objects.create(name="Other")
+        )
+
+        with pytest.raises(IntegrityError):
+            Exercise.objects.create(name="Running", category=exercise_category_created)
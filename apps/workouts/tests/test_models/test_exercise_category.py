@@ -1,4 +1,5 @@
 import pytest
+from django.db import IntegrityError
 
 from workouts.models import ExerciseCategory
 
@@ -24,3 +25,9 @@ class TestExerciseCategory:
         category = ExerciseCategory(**category_data)
 
         assert str(category.name) == category_data["name"]
+
+    def test_names_are_unique(self):
+        ExerciseCategory.objects.create(name="Cardio")
+
+        with pytest.raises(IntegrityError):
+            ExerciseCategory.objects.create(name="Cardio")
@@ -0,0 +1,55 @@
+import uuid
+
+import pytest
+from django.db.utils import IntegrityError
+from django.utils import timezone
+
+from workouts.models import NotificationDispatch
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+class TestNotificationDispatchModel:
+    def test_claim_returns_only_new_occurrences(self):
+        occurrence = timezone.now().replace(second=0, microsecond=0)
+        [first_id, second_id] = [uuid.uuid4(), uuid.uuid4()]
+
+        first_token, first_claim = NotificationDispatch.objects.claim(
+            NotificationDispatch.SCHEDULED_DATE, [first_id], occurrence
+        )
+        second_token, second_claim = NotificationDispatch.objects.claim(
+            NotificationDispatch.SCHEDULED_DATE, [first_id, second_id], occurrence
+        )
+
+        assert first_token != second_token
+        assert first_claim == {first_id}
+        assert second_claim == {second_id}
+        assert NotificationDispatch.objects.count() == 2
+
+    def test_release_allows_claiming_again(self):
+        occurrence = timezone.now().replace(second=0, microsecond=0)
+        source_id = uuid.uuid4()
+
+        claim_token, _ = NotificationDispatch.objects.claim(
+            NotificationDispatch.RECURRING_ALERT, [source_id], occurrence
+        )
+        NotificationDispatch.objects.release(claim_token)
+        _, claimed_ids = NotificationDispatch.objects.claim(
+            NotificationDispatch.RECURRING_ALERT, [source_id], occurrence
+        )
+
+        assert claimed_ids == {source_id}
+
+    def test_source_and_occurrence_are_unique(self):
+        dispatch_data = {
+            "source_type": NotificationDispatch.SCHEDULED_DATE,
+            "source_id": uuid.uuid4(),
+            "occurrence": timezone.now(),
+        }
+        NotificationDispatch.objects.create(**dispatch_data, claim_token=uuid.uuid4())
+
+        with pytest.raises(IntegrityError):
+            NotificationDispatch.objects.create(
+                **dispatch_data, claim_token=uuid.uuid4()
+            )
@@ -1,6 +1,9 @@
+import datetime
 from datetime import timedelta
 
 import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.utils import timezone
 
 from workouts.models import RecurringWorkoutAlert
@@ -72,6 +75,55 @@ class TestRecurringWorkoutAlertModel:
 
         assert RecurringWorkoutAlert.objects.count() == 0
 
+    def test_save_keeps_minute_of_day_in_sync(self, workout_created):
+        recurring_alert = RecurringWorkoutAlert.objects.create(
+            time=datetime.time(7, 30, 15), week_days=[0, 2], workout=workout_created
+        )
+
+        assert recurring_alert.minute_of_day == 450
+
+        recurring_alert.time = datetime.time(23, 59)
+        recurring_alert.save(update_fields=["time"])
+        recurring_alert.refresh_from_db()
+
+        assert recurring_alert.minute_of_day == 1439
+
+    def test_week_days_are_stored_as_a_bitmask(self, workout_created):
+        recurring_alert = RecurringWorkoutAlert.objects.create(
+            time=datetime.time(7, 30), week_days=[6, 0, 2], workout=workout_created
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT week_days FROM {RecurringWorkoutAlert._meta.db_table}"
+            )
+            assert cursor.fetchone() == (0b1000101,)
+
+        recurring_alert.refresh_from_db()
+        assert recurring_alert.week_days == [0, 2, 6]
+        assert RecurringWorkoutAlert.objects.filter(week_days=[0, 2, 6]).exists()
+
+    @pytest.mark.parametrize(
+        "week_day, expected", [(0, True), (2, True), (6, False), (1, False)]
+    )
+    def test_filter_by_week_day(self, workout_created, week_day, expected):
+        RecurringWorkoutAlert.objects.create(
+            time=datetime.time(7, 30), week_days=[0, 2], workout=workout_created
+        )
+
+        assert (
+            RecurringWorkoutAlert.objects.filter(week_days__has_day=week_day).exists()
+            is expected
+        )
+
+    def test_week_days_out_of_range_are_invalid(self, workout_created):
+        recurring_alert = RecurringWorkoutAlert(
+            time=datetime.time(7, 30), week_days=[0, 7], workout=workout_created
+        )
+
+        with pytest.raises(ValidationError):
+            recurring_alert.full_clean()
+
     def test_get_days_display_method(self):
         alert_data = {
             "week_days": [0, 1, 2, 6],
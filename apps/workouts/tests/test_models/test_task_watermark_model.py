@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from workouts.models import TaskWatermark
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+class TestTaskWatermarkModel:
+    def test_advance_creates_the_watermark(self):
+        now = timezone.now()
+
+        assert TaskWatermark.objects.get_value("task") is None
+
+        TaskWatermark.objects.advance("task", now)
+
+        assert TaskWatermark.objects.get_value("task") == now
+
+    def test_advance_never_moves_the_watermark_backwards(self):
+        now = timezone.now()
+
+        TaskWatermark.objects.advance("task", now)
+        TaskWatermark.objects.advance("task", now - timedelta(minutes=1))
+        assert TaskWatermark.objects.get_value("task") == now
+
+        TaskWatermark.objects.advance("task", now + timedelta(minutes=1))
+        assert TaskWatermark.objects.get_value("task") == now + timedelta(minutes=1)
@@ -0,0 +1,75 @@
+import datetime
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from workouts.models import WorkoutOccurrence
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+class TestWorkoutOccurrenceModel:
+    def test_scheduled_date_is_materialized_on_save(self, create_scheduled_date_with):
+        scheduled_date = create_scheduled_date_with(
+            datetime=timezone.now() + timedelta(days=1)
+        )
+
+        occurrence = WorkoutOccurrence.objects.get()
+        assert occurrence.scheduled_date == scheduled_date
+        assert occurrence.datetime == scheduled_date.datetime
+        assert occurrence.workout == scheduled_date.workout
+        assert occurrence.user == scheduled_date.workout.user
+
+    def test_scheduled_date_outside_the_window_is_not_materialized(
+        self, settings, create_scheduled_date_with
+    ):
+        settings.WORKOUT_OCCURRENCE_HORIZON_DAYS = 14
+        scheduled_date = create_scheduled_date_with(
+            datetime=timezone.now() + timedelta(days=1)
+        )
+
+        scheduled_date.datetime = timezone.now() + timedelta(days=15)
+        scheduled_date.save()
+
+        assert not WorkoutOccurrence.objects.exists()
+
+    def test_recurring_alert_is_materialized_for_every_active_day(
+        self, settings, create_recurring_alert_with
+    ):
+        settings.WORKOUT_OCCURRENCE_HORIZON_DAYS = 14
+        tomorrow = timezone.now() + timedelta(days=1)
+
+        alert = create_recurring_alert_with(
+            time=datetime.time(12, 0), week_days=[tomorrow.weekday()]
+        )
+
+        occurrences = list(alert.occurrences.order_by("datetime"))
+        assert len(occurrences) == 2
+        assert all(
+            occurrence.datetime.weekday() == tomorrow.weekday()
+            and occurrence.datetime.time() == datetime.time(12, 0)
+            for occurrence in occurrences
+        )
+
+    def test_recurring_alert_occurrences_follow_updates(
+        self, create_recurring_alert_with
+    ):
+        alert = create_recurring_alert_with(time=datetime.time(12, 0), week_days=[0, 1])
+
+        alert.week_days = []
+        alert.save()
+
+        assert not alert.occurrences.exists()
+
+    def test_occurrences_are_deleted_with_their_source(
+        self, create_scheduled_date_with
+    ):
+        scheduled_date = create_scheduled_date_with(
+            datetime=timezone.now() + timedelta(days=1)
+        )
+
+        scheduled_date.delete()
+
+        assert not WorkoutOccurrence.objects.exists()
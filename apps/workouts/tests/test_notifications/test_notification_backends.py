@@ -0,0 +1,133 @@
+import pytest
+import requests
+from django.core import mail
+
+from workouts.notifications import (
+    EmailBackend,
+    InMemoryBackend,
+    Notification,
+    NotificationDeliveryError,
+    WebhookBackend,
+    get_notification_backend,
+)
+
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture
+def notifications():
+    return [
+        Notification(
+            user_id=str(index),
+            recipient=f"user{index}@test.com",
+            subject="Workout reminder: Legs",
+            message="It's time for your workout Legs.",
+        )
+        for index in range(3)
+    ]
+
+
+class TestGetNotificationBackend:
+    def test_uses_the_configured_backend(self, settings):
+        settings.NOTIFICATION_BACKEND = "workouts.notifications.InMemoryBackend"
+
+        assert isinstance(get_notification_backend(), InMemoryBackend)
+
+    def test_backend_can_be_overridden(self):
+        backend = get_notification_backend(
+            "workouts.notifications.EmailBackend", fail_silently=True
+        )
+
+        assert isinstance(backend, EmailBackend)
+        assert backend.fail_silently
+
+
+class TestEmailBackend:
+    def test_send_many_reuses_one_connection(self, mocker, notifications):
+        mock_get_connection = mocker.patch(
+            "workouts.notifications.get_connection",
+            return_value=mocker.MagicMock(**{"send_messages.return_value": 1}),
+        )
+
+        sent = EmailBackend().send_many(notifications)
+
+        assert sent == 3
+        mock_get_connection.assert_called_once()
+        connection = mock_get_connection.return_value
+        connection.__enter__.assert_called_once()
+        assert [
+            call.args[0][0].to for call in connection.send_messages.call_args_list
+        ] == [[notification.recipient] for notification in notifications]
+
+    def test_failure_reports_the_unsent_messages(self, mocker, notifications):
+        mocker.patch(
+            "workouts.notifications.get_connection",
+            return_value=mocker.MagicMock(
+                **{"send_messages.side_effect": [1, ConnectionError(), 1]}
+            ),
+        )
+
+        with pytest.raises(NotificationDeliveryError) as error:
+            EmailBackend().send_many(notifications)
+
+        assert error.value.failed == notifications[1:]
+
+    def test_send_delivers_an_email(self, notifications):
+        mail.outbox = []
+
+        EmailBackend().send(notifications[0])
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject == notifications[0].subject
+        assert mail.outbox[0].to == [notifications[0].recipient]
+
+
+class TestWebhookBackend:
+    def test_send_many_reuses_one_session(self, mocker, notifications):
+        mock_session = mocker.patch("workouts.notifications.requests.Session")
+        session = mock_session.return_value.__enter__.return_value
+
+        sent = WebhookBackend(url="https://hooks.test/").send_many(notifications)
+
+        assert sent == 3
+        mock_session.assert_called_once()
+        assert session.post.call_count == 3
+        assert session.post.call_args.kwargs["json"]["recipient"] == "user2@test.com"
+
+    def test_failed_requests_are_skipped_when_failing_silently(
+        self, mocker, notifications
+    ):
+        mock_session = mocker.patch("workouts.notifications.requests.Session")
+        session = mock_session.return_value.__enter__.return_value
+        session.post.side_effect = [
+            mocker.MagicMock(),
+            requests.ConnectionError(),
+            mocker.MagicMock(),
+        ]
+
+        backend = WebhookBackend(url="https://hooks.test/", fail_silently=True)
+
+        assert backend.send_many(notifications) == 2
+
+    def test_failed_requests_raise_by_default(self, mocker, notifications):
+        mock_session = mocker.patch("workouts.notifications.requests.Session")
+        session = mock_session.return_value.__enter__.return_value
+        session.post.side_effect = [mocker.MagicMock(), requests.ConnectionError()]
+
+        with pytest.raises(NotificationDeliveryError) as error:
+            WebhookBackend(url="https://hooks.test/").send_many(notifications)
+
+        assert error.value.failed == notifications[1:]
+        assert isinstance(error.value.__cause__, requests.ConnectionError)
+
+
+class TestInMemoryBackend:
+    def test_send_many_keeps_notifications_in_the_outbox(self, notifications):
+        InMemoryBackend.outbox.clear()
+
+        sent = InMemoryBackend().send_many(notifications)
+
+        assert sent == 3
+        assert InMemoryBackend.outbox == notifications
+        InMemoryBackend.outbox.clear()
@@ -3,6 +3,7 @@ import uuid
 import pytest
 from django_mock_queries.query import MockModel
 
+from workouts.models import ExerciseCategory
 from workouts.serializers import ExerciseCategorySerializer
 
 
@@ -22,6 +23,7 @@ class TestExerciseCategorySerializer:
 
         assert serializer.data == expected_data
 
+    @pytest.mark.django_db
     def test_valid_data(self):
         category_data = {"name": "Cardio"}
         serializer = ExerciseCategorySerializer(data=category_data)
@@ -36,6 +38,7 @@ class TestExerciseCategorySerializer:
         assert not serializer.is_valid()
         assert serializer.errors != {}
 
+    @pytest.mark.django_db
     def test_ignore_extra_fields(self):
         category_data = {
             "name": "Cardio",
@@ -45,3 +48,11 @@ class TestExerciseCategorySerializer:
 
         assert serializer.is_valid()
         assert "extra_field" not in serializer.validated_data
+
+    @pytest.mark.django_db
+    def test_name_must_be_unique(self):
+        ExerciseCategory.objects.create(name="Cardio")
+        serializer = ExerciseCategorySerializer(data={"name": "Cardio"})
+
+        assert not serializer.is_valid()
+        assert "name" in serializer.errors
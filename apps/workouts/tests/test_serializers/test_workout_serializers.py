@@ -130,6 +130,37 @@ class TestWorkoutSerializer:
         serializer = WorkoutSerializer(mock_workout)
         assert serializer.data["exercises"] == 1
 
+    @pytest.mark.parametrize(
+        "has_pending_dates, expected_status", [(True, "Active"), (False, "Completed")]
+    )
+    def test_serialize_status__uses_annotation(
+        self, workout_data, has_pending_dates, expected_status
+    ):
+        workout_data = {
+            **workout_data,
+            "type": "S",
+            "has_pending_dates": has_pending_dates,
+            "scheduled_dates": MockSet(),
+        }
+        mock_workout = MockModel(**workout_data)
+        mock_workout.serializable_value = lambda field_name: getattr(
+            mock_workout, field_name
+        )
+
+        serializer = WorkoutSerializer(mock_workout)
+        assert serializer.data["status"] == expected_status
+
+    def test_serializer_exercises__uses_annotation(self, workout_data):
+        workout_data = {**workout_data, "exercise_count": 3}
+
+        mock_workout = MockModel(**workout_data)
+        mock_workout.serializable_value = lambda field_name: getattr(
+            mock_workout, field_name
+        )
+
+        serializer = WorkoutSerializer(mock_workout)
+        assert serializer.data["exercises"] == 3
+
     def test_valid_data(self):
         workout_data = {
             "name": "Test workout",
@@ -0,0 +1,163 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from workouts.models import ExercisePlan, UserWorkoutStats, Workout
+from workouts.stats import (
+    COUNTERS,
+    compute_workout_stats,
+    get_workout_stats,
+    refresh_workout_stats,
+)
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def get_counters(stats):
+    return {name: getattr(stats, name) for name in COUNTERS}
+
+
+class TestComputeWorkoutStats:
+    def test_counts_workouts_by_status_and_their_items(
+        self,
+        user_created,
+        create_workout_with,
+        create_scheduled_date_with,
+        create_batch_exercise_plans_with,
+        create_batch_comments_with,
+    ):
+        now = timezone.now()
+        create_workout_with(user=user_created)
+        recurrent = create_workout_with(user=user_created, type=Workout.RECURRENT)
+        active = create_workout_with(user=user_created, type=Workout.SCHEDULED)
+        completed = create_workout_with(user=user_created, type=Workout.SCHEDULED)
+        create_scheduled_date_with(workout=active, datetime=now - timedelta(days=1))
+        create_scheduled_date_with(workout=active, datetime=now + timedelta(days=2))
+        create_scheduled_date_with(workout=completed, datetime=now - timedelta(days=1))
+        create_batch_exercise_plans_with(size=3, workout=recurrent)
+        create_batch_exercise_plans_with(size=2, workout=active)
+        create_batch_comments_with(size=2, workout=completed)
+        create_workout_with()
+
+        stats = compute_workout_stats(user_created.pk)
+
+        assert get_counters(stats) == {
+            "workouts": 4,
+            "active_workouts": 2,
+            "completed_workouts": 1,
+            "pending_workouts": 1,
+            "exercise_plans": 5,
+            "comments": 2,
+        }
+        assert stats.refresh_at == now + timedelta(days=2)
+
+    def test_user_without_workouts(self, user_created):
+        stats = compute_workout_stats(user_created.pk)
+
+        assert get_counters(stats) == dict.fromkeys(COUNTERS, 0)
+        assert stats.refresh_at is None
+
+
+class TestWorkoutStatsSignals:
+    def assert_in_sync(self, user):
+        stored = UserWorkoutStats.objects.get(pk=user.pk)
+        assert get_counters(stored) == get_counters(compute_workout_stats(user.pk))
+
+    def test_writes_keep_the_stored_stats_in_sync(
+        self,
+        user_created,
+        create_workout_with,
+        create_exercise_plan_with,
+        create_comment_with,
+        create_scheduled_date_with,
+    ):
+        refresh_workout_stats(user_created.pk)
+
+        workout = create_workout_with(user=user_created)
+        self.assert_in_sync(user_created)
+
+        plan = create_exercise_plan_with(workout=workout)
+        comment = create_comment_with(workout=workout)
+        self.assert_in_sync(user_created)
+
+        workout.switch_to_scheduled()
+        create_scheduled_date_with(
+            workout=workout, datetime=timezone.now() + timedelta(days=1)
+        )
+        self.assert_in_sync(user_created)
+
+        workout.switch_to_recurrent()
+        self.assert_in_sync(user_created)
+
+        plan.delete()
+        comment.delete()
+        self.assert_in_sync(user_created)
+
+        workout.delete()
+        self.assert_in_sync(user_created)
+        assert UserWorkoutStats.objects.get(pk=user_created.pk).workouts == 0
+
+    def test_queryset_deletes_recount_once(
+        self,
+        user_created,
+        create_workout_with,
+        create_batch_exercise_plans_with,
+        django_assert_num_queries,
+    ):
+        workout = create_workout_with(user=user_created)
+        create_batch_exercise_plans_with(size=5, workout=workout)
+        refresh_workout_stats(user_created.pk)
+
+        # Plans, delete, workout of the first plan, then lock, count and store.
+        with django_assert_num_queries(6):
+            ExercisePlan.objects.filter(workout=workout).delete()
+
+        self.assert_in_sync(user_created)
+
+    def test_deleting_the_user_deletes_their_stats(
+        self, user_created, create_exercise_plan_with, create_workout_with
+    ):
+        create_exercise_plan_with(workout=create_workout_with(user=user_created))
+        refresh_workout_stats(user_created.pk)
+
+        user_created.delete()
+
+        assert not UserWorkoutStats.objects.exists()
+
+
+class TestGetWorkoutStats:
+    def test_creates_the_stats_on_first_read(self, user_created, create_workout_with):
+        create_workout_with(user=user_created)
+
+        stats = get_workout_stats(user_created.pk)
+
+        assert stats.workouts == 1
+        assert UserWorkoutStats.objects.get(pk=user_created.pk).workouts == 1
+
+    def test_reads_the_stored_stats_by_primary_key(
+        self, user_created, django_assert_num_queries
+    ):
+        refresh_workout_stats(user_created.pk)
+
+        with django_assert_num_queries(1):
+            get_workout_stats(user_created.pk)
+
+    def test_recounts_once_a_scheduled_workout_completes(
+        self, mocker, user_created, create_workout_with, create_scheduled_date_with
+    ):
+        workout = create_workout_with(user=user_created, type=Workout.SCHEDULED)
+        date = create_scheduled_date_with(
+            workout=workout, datetime=timezone.now() + timedelta(hours=1)
+        )
+        assert get_workout_stats(user_created.pk).active_workouts == 1
+
+        mocker.patch(
+            "workouts.stats.timezone.now",
+            return_value=date.datetime + timedelta(minutes=1),
+        )
+        stats = get_workout_stats(user_created.pk)
+
+        assert (stats.active_workouts, stats.completed_workouts) == (0, 1)
+        assert stats.refresh_at is None
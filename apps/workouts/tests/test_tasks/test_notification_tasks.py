@@ -1,24 +1,35 @@
-from unittest.mock import call
-from datetime import timedelta, datetime
+from datetime import timedelta
 from django.utils import timezone
 
 import pytest
 
+from workout_tracker.celery import app as celery_app
+from workouts.models import NotificationDispatch, TaskWatermark, WorkoutOccurrence
+from workouts.notifications import (
+    InMemoryBackend,
+    Notification,
+    NotificationDeliveryError,
+)
 from workouts.tasks import (
+    delete_old_notification_dispatches,
+    notify_scheduled_dates,
     notify_scheduled_dates_at_the_current_minute,
     notify_recurring_alerts_at_the_current_minute,
 )
 
-pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.django_db,
+    pytest.mark.usefixtures("celery_eager"),
+]
 
 
 def test_notify_scheduled_dates_at_the_current_minute(
-    mocker, create_scheduled_date_with
+    mocker, notification_outbox, create_scheduled_date_with
 ):
     current_datetime = timezone.now().replace(second=0, microsecond=0)
 
     mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
-    mock_send_notification = mocker.patch("workouts.tasks.send_notification")
 
     scheduled1 = create_scheduled_date_with(datetime=current_datetime)
     create_scheduled_date_with(datetime=current_datetime - timedelta(seconds=30))
@@ -29,20 +40,37 @@ def test_notify_scheduled_dates_at_the_current_minute(
 
     notify_scheduled_dates_at_the_current_minute()
 
-    assert mock_send_notification.call_count == 2
-    mock_send_notification.assert_has_calls(
-        [call(scheduled1), call(scheduled4)], any_order=True
+    assert len(notification_outbox) == 2
+    assert set(notification_outbox) == {
+        Notification.for_scheduled_date(scheduled1),
+        Notification.for_scheduled_date(scheduled4),
+    }
+
+
+def test_notify_scheduled_dates_at_the_current_minute__minute_boundaries(
+    mocker, notification_outbox, create_scheduled_date_with
+):
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+
+    mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
+
+    scheduled = create_scheduled_date_with(
+        datetime=current_datetime + timedelta(seconds=59, microseconds=999999)
     )
+    create_scheduled_date_with(datetime=current_datetime - timedelta(microseconds=1))
+
+    notify_scheduled_dates_at_the_current_minute()
+
+    assert notification_outbox == [Notification.for_scheduled_date(scheduled)]
 
 
 def test_notify_recurring_alerts_at_the_current_minute(
-    mocker, create_recurring_alert_with
+    mocker, notification_outbox, create_recurring_alert_with
 ):
     current_datetime = timezone.now().replace(second=0, microsecond=0)
     current_weekday = current_datetime.weekday()
 
     mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
-    mock_send_notification = mocker.patch("workouts.tasks.send_notification")
 
     alert1 = create_recurring_alert_with(
         time=current_datetime.time(), week_days=[current_weekday]
@@ -66,7 +94,219 @@ def test_notify_recurring_alerts_at_the_current_minute(
 
     notify_recurring_alerts_at_the_current_minute()
 
-    assert mock_send_notification.call_count == 2
-    mock_send_notification.assert_has_calls(
-        [call(alert1), call(alert2)], any_order=True
+    assert len(notification_outbox) == 2
+    assert set(notification_outbox) == {
+        Notification.for_recurring_alert(alert1),
+        Notification.for_recurring_alert(alert2),
+    }
+
+
+def test_notifications_are_dispatched_in_batches(
+    mocker, settings, notification_outbox, create_batch_scheduled_dates_with
+):
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+    settings.NOTIFICATION_BATCH_SIZE = 2
+
+    mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
+    mock_notify_batch = mocker.spy(notify_scheduled_dates, "run")
+
+    create_batch_scheduled_dates_with(size=5, datetime=current_datetime)
+
+    batches = notify_scheduled_dates_at_the_current_minute()
+
+    assert batches == 3
+    assert [len(call.args[0]) for call in mock_notify_batch.call_args_list] == [2, 2, 1]
+    assert len(notification_outbox) == 5
+
+
+def test_notification_batch_is_sent_with_a_fixed_number_of_queries(
+    notification_outbox, create_batch_scheduled_dates_with, django_assert_num_queries
+):
+    scheduled_dates = create_batch_scheduled_dates_with(size=3)
+    occurrence = timezone.now().replace(second=0, microsecond=0)
+
+    with django_assert_num_queries(3):
+        result = notify_scheduled_dates(
+            [str(scheduled_date.id) for scheduled_date in scheduled_dates],
+            occurrence.isoformat(),
+        )
+
+    assert result["sent"] == 3
+    assert {notification.recipient for notification in notification_outbox} == {
+        scheduled_date.workout.user.email for scheduled_date in scheduled_dates
+    }
+
+
+def test_overlapping_runs_send_each_notification_once(
+    mocker, notification_outbox, create_scheduled_date_with
+):
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+
+    mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
+    scheduled = create_scheduled_date_with(datetime=current_datetime)
+
+    notify_scheduled_dates_at_the_current_minute()
+    notify_scheduled_dates_at_the_current_minute()
+
+    assert notification_outbox == [Notification.for_scheduled_date(scheduled)]
+    assert NotificationDispatch.objects.get().source_id == scheduled.id
+
+
+def test_missed_minutes_are_caught_up(
+    mocker, settings, notification_outbox, create_recurring_alert_with
+):
+    settings.NOTIFICATION_CATCH_UP_MINUTES = 5
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+    last_run = current_datetime - timedelta(minutes=3)
+    mock_now = mocker.patch("workouts.tasks.timezone.now", return_value=last_run)
+
+    alert1 = create_recurring_alert_with(
+        time=last_run.time(), week_days=[last_run.weekday()]
+    )
+    notify_recurring_alerts_at_the_current_minute()
+
+    missed_minute = current_datetime - timedelta(minutes=2)
+    alert2 = create_recurring_alert_with(
+        time=missed_minute.time(), week_days=[missed_minute.weekday()]
+    )
+    too_old_minute = current_datetime - timedelta(minutes=6)
+    create_recurring_alert_with(
+        time=too_old_minute.time(), week_days=[too_old_minute.weekday()]
+    )
+    mock_now.return_value = current_datetime
+    notify_recurring_alerts_at_the_current_minute()
+
+    assert notification_outbox == [
+        Notification.for_recurring_alert(alert1),
+        Notification.for_recurring_alert(alert2),
+    ]
+
+
+def test_quiet_minutes_advance_the_watermark(
+    mocker, settings, notification_outbox, create_scheduled_date_with
+):
+    settings.NOTIFICATION_CATCH_UP_MINUTES = 15
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+    last_run = current_datetime - timedelta(minutes=5)
+    mock_now = mocker.patch("workouts.tasks.timezone.now", return_value=last_run)
+
+    for minutes in range(5):
+        mock_now.return_value = last_run + timedelta(minutes=minutes)
+        notify_scheduled_dates_at_the_current_minute()
+
+    assert notification_outbox == []
+    assert TaskWatermark.objects.get_value(
+        TaskWatermark.SCHEDULED_DATE_NOTIFICATIONS
+    ) == current_datetime - timedelta(minutes=1)
+
+    # Created for a minute that was already processed, so it is not sent late.
+    create_scheduled_date_with(datetime=current_datetime - timedelta(minutes=3))
+    scheduled = create_scheduled_date_with(datetime=current_datetime)
+    mock_now.return_value = current_datetime
+    notify_scheduled_dates_at_the_current_minute()
+
+    assert notification_outbox == [Notification.for_scheduled_date(scheduled)]
+    assert (
+        TaskWatermark.objects.get_value(TaskWatermark.SCHEDULED_DATE_NOTIFICATIONS)
+        == current_datetime
+    )
+
+
+def test_minutes_past_the_materialized_window_are_read_from_the_sources(
+    mocker,
+    notification_outbox,
+    create_scheduled_date_with,
+    create_recurring_alert_with,
+):
+    current_datetime = timezone.now().replace(second=0, microsecond=0)
+
+    mocker.patch("workouts.tasks.timezone.now", return_value=current_datetime)
+    scheduled = create_scheduled_date_with(datetime=current_datetime)
+    alert = create_recurring_alert_with(
+        time=current_datetime.time(), week_days=[current_datetime.weekday()]
+    )
+    # The materialize task stopped before the current minute.
+    WorkoutOccurrence.objects.all().delete()
+    TaskWatermark.objects.filter(name=TaskWatermark.WORKOUT_OCCURRENCES).update(
+        value=current_datetime
+    )
+
+    notify_scheduled_dates_at_the_current_minute()
+    notify_recurring_alerts_at_the_current_minute()
+
+    assert notification_outbox == [
+        Notification.for_scheduled_date(scheduled),
+        Notification.for_recurring_alert(alert),
+    ]
+
+
+def test_failed_delivery_is_retried_until_the_retries_run_out(
+    mocker, notification_outbox, create_scheduled_date_with
+):
+    mock_send_many = mocker.patch(
+        "workouts.notifications.InMemoryBackend.send_many",
+        side_effect=ConnectionError(),
+    )
+    scheduled = create_scheduled_date_with()
+    occurrence = timezone.now().replace(second=0, microsecond=0)
+    # Eager retries only end in a failed result when errors don't propagate.
+    celery_app.conf.task_eager_propagates = False
+
+    result = notify_scheduled_dates.apply(
+        args=[[str(scheduled.id)], occurrence.isoformat()], throw=False
+    )
+
+    assert isinstance(result.result, ConnectionError)
+    assert mock_send_many.call_count == notify_scheduled_dates.max_retries + 1
+    assert not NotificationDispatch.objects.exists()
+
+
+def test_partly_delivered_batch_retries_only_the_undelivered_notifications(
+    mocker, notification_outbox, create_batch_scheduled_dates_with
+):
+    send_many = InMemoryBackend.send_many
+
+    def send_the_first_then_fail(backend, notifications):
+        if mock_send_many.call_count == 1:
+            send_many(backend, notifications[:1])
+            raise NotificationDeliveryError(notifications[1:])
+        return send_many(backend, notifications)
+
+    mock_send_many = mocker.patch.object(
+        InMemoryBackend,
+        "send_many",
+        autospec=True,
+        side_effect=send_the_first_then_fail,
+    )
+    scheduled_dates = create_batch_scheduled_dates_with(size=3)
+    occurrence = timezone.now().replace(second=0, microsecond=0)
+
+    result = notify_scheduled_dates.apply(
+        args=[[str(date.id) for date in scheduled_dates], occurrence.isoformat()],
+        throw=False,
+    )
+
+    assert result.result["sent"] == 2
+    assert mock_send_many.call_count == 2
+    assert sorted(notification_outbox, key=repr) == sorted(
+        [Notification.for_scheduled_date(date) for date in scheduled_dates], key=repr
+    )
+    assert NotificationDispatch.objects.count() == 3
+
+
+def test_delete_old_notification_dispatches(settings, create_scheduled_date_with):
+    settings.NOTIFICATION_DISPATCH_RETENTION_DAYS = 7
+    scheduled = create_scheduled_date_with()
+    current_minute = timezone.now().replace(second=0, microsecond=0)
+
+    for days in [8, 1]:
+        NotificationDispatch.objects.claim(
+            NotificationDispatch.SCHEDULED_DATE,
+            [scheduled.id],
+            current_minute - timedelta(days=days),
+        )
+
+    assert delete_old_notification_dispatches() == 1
+    assert NotificationDispatch.objects.get().occurrence == current_minute - timedelta(
+        days=1
     )
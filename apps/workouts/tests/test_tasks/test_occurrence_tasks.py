@@ -0,0 +1,55 @@
+import datetime
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from workouts.models import TaskWatermark, WorkoutOccurrence
+from workouts.occurrences import get_window_end
+from workouts.tasks import materialize_workout_occurrences
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+def test_materialize_workout_occurrences_resumes_from_the_last_run(
+    mocker, settings, create_recurring_alert_with
+):
+    settings.WORKOUT_OCCURRENCE_HORIZON_DAYS = 14
+    alert = create_recurring_alert_with(
+        time=datetime.time(12, 0), week_days=list(range(7))
+    )
+    materialize_workout_occurrences()
+    materialized = alert.occurrences.count()
+
+    # The daily runs of the next two days are missed.
+    later = timezone.now() + timedelta(days=3)
+    mocker.patch("workouts.occurrences.timezone.now", return_value=later)
+    result = materialize_workout_occurrences()
+
+    assert result == {"materialized": 3, "deleted": 3}
+    assert alert.occurrences.count() == materialized
+    assert alert.occurrences.latest("datetime").datetime > later + timedelta(days=13)
+    assert (
+        TaskWatermark.objects.get_value(TaskWatermark.WORKOUT_OCCURRENCES)
+        == get_window_end()
+    )
+
+
+def test_materialize_workout_occurrences_fills_the_whole_window_without_a_watermark(
+    create_batch_scheduled_dates_with,
+):
+    create_batch_scheduled_dates_with(
+        size=3, datetime=timezone.now() + timedelta(hours=1)
+    )
+    TaskWatermark.objects.all().delete()
+    WorkoutOccurrence.objects.all().delete()
+
+    result = materialize_workout_occurrences()
+
+    assert result["materialized"] == 3
+    assert WorkoutOccurrence.objects.count() == 3
+
+    result = materialize_workout_occurrences()
+
+    assert result["materialized"] == 0
+    assert WorkoutOccurrence.objects.count() == 3
@@ -0,0 +1,167 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from workouts.models import ExercisePlan
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+class TestVolumeView:
+    url = reverse("analytics-volume")
+
+    def get_week(self, datetime):
+        date = timezone.localtime(datetime).date()
+        return (date - timedelta(days=date.weekday())).isoformat()
+
+    def create_expected_volume(self, week, exercise, plans, volume):
+        return {
+            "week": week,
+            "exercise": str(exercise.id),
+            "exercise_name": exercise.name,
+            "category": str(exercise.category.id),
+            "category_name": exercise.category.name,
+            "plans": plans,
+            "volume": volume,
+        }
+
+    def test_unauthenticated_user_cannot_get_the_volume(self, api_client):
+        response = api_client.get(self.url)
+        assert response.status_code == 401
+
+    def test_user_gets_the_volume_of_their_plans_per_week_and_exercise(
+        self,
+        api_client,
+        user_created,
+        create_workout_with,
+        create_exercise_with,
+        create_exercise_plan_with,
+    ):
+        workout = create_workout_with(user=user_created)
+        squat, bench = create_exercise_with(), create_exercise_with()
+        plan = create_exercise_plan_with(
+            workout=workout, exercise=squat, sets=3, reps=10, weight=100
+        )
+        create_exercise_plan_with(
+            workout=workout, exercise=squat, sets=2, reps=5, weight=80
+        )
+        create_exercise_plan_with(
+            workout=workout, exercise=bench, sets=4, reps=8, weight=60
+        )
+        last_week_plan = create_exercise_plan_with(
+            workout=workout, exercise=squat, sets=5, reps=5, weight=90
+        )
+        ExercisePlan.objects.filter(pk=last_week_plan.pk).update(
+            created_at=plan.created_at - timedelta(days=7)
+        )
+        create_exercise_plan_with(exercise=squat, sets=3, reps=10, weight=100)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url)
+
+        assert response.status_code == 200
+        this_week = self.get_week(plan.created_at)
+        last_week = self.get_week(plan.created_at - timedelta(days=7))
+        expected = sorted(
+            [
+                self.create_expected_volume(this_week, squat, 2, 3800.0),
+                self.create_expected_volume(this_week, bench, 1, 1920.0),
+            ],
+            key=lambda item: (item["category_name"], item["exercise_name"]),
+        )
+        assert response.json() == [
+            *expected,
+            self.create_expected_volume(last_week, squat, 1, 2250.0),
+        ]
+
+    def test_weights_are_converted_to_the_requested_unit(
+        self,
+        api_client,
+        user_created,
+        create_workout_with,
+        create_exercise_with,
+        create_exercise_plan_with,
+    ):
+        workout = create_workout_with(user=user_created)
+        exercise = create_exercise_with()
+        plan_data = {"workout": workout, "exercise": exercise, "sets": 1, "reps": 10}
+        plan = create_exercise_plan_with(
+            **plan_data, weight=100, weight_measure_unit="lbs"
+        )
+        create_exercise_plan_with(**plan_data, weight=50, weight_measure_unit=" KG")
+        create_exercise_plan_with(**plan_data, weight=50, weight_measure_unit="")
+        create_exercise_plan_with(**plan_data, weight=50, weight_measure_unit="stone")
+        create_exercise_plan_with(**plan_data, weight=None)
+
+        api_client.force_authenticate(user=user_created)
+        week = self.get_week(plan.created_at)
+
+        response = api_client.get(self.url)
+        assert response.json() == [
+            self.create_expected_volume(week, exercise, 3, 1453.59),
+        ]
+
+        response = api_client.get(self.url, {"unit": "lb"})
+        assert response.json() == [
+            self.create_expected_volume(week, exercise, 3, 3204.62),
+        ]
+
+    def test_volume_of_large_plans_does_not_overflow(
+        self, api_client, user_created, create_workout_with, create_exercise_plan_with
+    ):
+        workout = create_workout_with(user=user_created)
+        create_exercise_plan_with(workout=workout, sets=1000, reps=1000, weight=100000)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url)
+
+        assert response.json()[0]["volume"] == 100000000000.0
+
+    def test_volume_is_filtered_by_the_creation_of_the_plans(
+        self, api_client, user_created, create_workout_with, create_exercise_plan_with
+    ):
+        workout = create_workout_with(user=user_created)
+        plan = create_exercise_plan_with(workout=workout, weight=10)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(
+            self.url, {"from": (plan.created_at + timedelta(seconds=1)).isoformat()}
+        )
+        assert response.json() == []
+
+        response = api_client.get(
+            self.url, {"to": (plan.created_at + timedelta(seconds=1)).isoformat()}
+        )
+        assert len(response.json()) == 1
+
+    def test_to_must_be_later_than_from(self, api_client, user_created):
+        now = timezone.now()
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(
+            self.url, {"from": now.isoformat(), "to": now.isoformat()}
+        )
+
+        assert response.status_code == 400
+        assert "to" in response.json()
+
+    def test_volume_is_aggregated_in_a_single_query(
+        self,
+        api_client,
+        user_created,
+        create_workout_with,
+        create_exercise_plan_with,
+        django_assert_num_queries,
+    ):
+        workout = create_workout_with(user=user_created)
+        for _ in range(5):
+            create_exercise_plan_with(workout=workout, weight=20)
+
+        api_client.force_authenticate(user=user_created)
+        with django_assert_num_queries(1):
+            response = api_client.get(self.url)
+
+        assert len(response.json()) == 5
@@ -0,0 +1,271 @@
+import json
+import datetime
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from workouts.occurrences import (
+    get_window_end,
+    get_window_start,
+    iter_expanded_user_occurrences,
+    iter_materialized_user_occurrences,
+)
+from workouts.serializers import CalendarOccurrenceSerializer
+from workouts.tasks import materialize_workout_occurrences
+from workouts.tests.utils import serialize_datetime
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+
+class ParentCalendarView:
+    url = reverse("calendar-list")
+
+    def get_calendar(self, api_client, start, end):
+        return api_client.get(
+            self.url, {"from": start.isoformat(), "to": end.isoformat()}
+        )
+
+    def create_expected_occurrence(
+        self, occurrence, workout, scheduled_date=None, recurring_alert=None
+    ):
+        return {
+            "datetime": serialize_datetime(occurrence),
+            "workout": str(workout.id),
+            "workout_name": workout.name,
+            "scheduled_date": scheduled_date and str(scheduled_date.id),
+            "recurring_alert": recurring_alert and str(recurring_alert.id),
+        }
+
+
+class TestCalendarView(ParentCalendarView):
+    def test_user_gets_the_occurrences_of_their_workouts_sorted_by_datetime(
+        self,
+        api_client,
+        create_workout_with,
+        create_scheduled_date_with,
+        create_recurring_alert_with,
+    ):
+        today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        tomorrow = today + timedelta(days=1)
+        workout = create_workout_with()
+        alert = create_recurring_alert_with(
+            time=datetime.time(12, 0), week_days=[tomorrow.weekday()], workout=workout
+        )
+        scheduled_date = create_scheduled_date_with(
+            datetime=tomorrow + timedelta(hours=9), workout=workout
+        )
+        create_scheduled_date_with(datetime=tomorrow + timedelta(hours=10))
+
+        api_client.force_authenticate(user=workout.user)
+        response = self.get_calendar(api_client, tomorrow, tomorrow + timedelta(days=7))
+
+        assert response.status_code == 200
+        assert response.json() == [
+            self.create_expected_occurrence(
+                tomorrow + timedelta(hours=9), workout, scheduled_date=scheduled_date
+            ),
+            self.create_expected_occurrence(
+                tomorrow + timedelta(hours=12), workout, recurring_alert=alert
+            ),
+        ]
+
+    def test_occurrences_outside_the_materialized_window_are_expanded(
+        self,
+        settings,
+        api_client,
+        create_workout_with,
+        create_scheduled_date_with,
+        create_recurring_alert_with,
+    ):
+        settings.WORKOUT_OCCURRENCE_HORIZON_DAYS = 14
+        today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        workout = create_workout_with()
+        past_date = create_scheduled_date_with(
+            datetime=today - timedelta(days=3, hours=-8), workout=workout
+        )
+        future_date = create_scheduled_date_with(
+            datetime=today + timedelta(days=20, hours=8), workout=workout
+        )
+        alert = create_recurring_alert_with(
+            time=datetime.time(7, 0),
+            week_days=[(today + timedelta(days=20)).weekday()],
+            workout=workout,
+        )
+
+        api_client.force_authenticate(user=workout.user)
+        response = self.get_calendar(
+            api_client, today - timedelta(days=3), today - timedelta(days=2)
+        )
+        assert response.json() == [
+            self.create_expected_occurrence(
+                past_date.datetime, workout, scheduled_date=past_date
+            )
+        ]
+
+        response = self.get_calendar(
+            api_client, today + timedelta(days=20), today + timedelta(days=21)
+        )
+        assert response.json() == [
+            self.create_expected_occurrence(
+                today + timedelta(days=20, hours=7), workout, recurring_alert=alert
+            ),
+            self.create_expected_occurrence(
+                future_date.datetime, workout, scheduled_date=future_date
+            ),
+        ]
+
+    def test_the_end_of_the_window_not_materialized_yet_is_expanded(
+        self, mocker, settings, api_client, create_recurring_alert_with
+    ):
+        settings.WORKOUT_OCCURRENCE_HORIZON_DAYS = 14
+        alert = create_recurring_alert_with(
+            time=datetime.time(12, 0), week_days=list(range(7))
+        )
+        materialize_workout_occurrences()
+
+        # Two days later, before the materialize task runs again.
+        later = timezone.now() + timedelta(days=2)
+        mocker.patch("workouts.occurrences.timezone.now", return_value=later)
+        start = later.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=14)
+
+        api_client.force_authenticate(user=alert.workout.user)
+        response = self.get_calendar(api_client, start, end)
+
+        assert response.json() == [
+            self.create_expected_occurrence(
+                start + timedelta(days=days, hours=12),
+                alert.workout,
+                recurring_alert=alert,
+            )
+            for days in range(14)
+        ]
+
+    def test_expanded_and_materialized_occurrences_match(
+        self,
+        create_workout_with,
+        create_batch_scheduled_dates_with,
+        create_recurring_alert_with,
+    ):
+        workout = create_workout_with()
+        create_batch_scheduled_dates_with(
+            size=5, datetime=timezone.now() + timedelta(days=2), workout=workout
+        )
+        for hour in range(5):
+            create_recurring_alert_with(
+                time=datetime.time(hour, 30), week_days=[0, 3, 6], workout=workout
+            )
+        start, end = get_window_start(), get_window_end()
+
+        expanded = list(iter_expanded_user_occurrences(workout.user, start, end, 100))
+        materialized = list(
+            iter_materialized_user_occurrences(workout.user, start, end, 100)
+        )
+
+        assert len(expanded) == len(materialized) > 5
+        assert sorted(expanded, key=repr) == sorted(materialized, key=repr)
+
+    def test_wide_ranges_are_streamed(
+        self, settings, api_client, create_workout_with, create_recurring_alert_with
+    ):
+        settings.CALENDAR_STREAMING_DAYS = 31
+        workout = create_workout_with()
+        create_recurring_alert_with(
+            time=datetime.time(12, 0), week_days=list(range(7)), workout=workout
+        )
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        api_client.force_authenticate(user=workout.user)
+        response = self.get_calendar(api_client, start, start + timedelta(days=60))
+
+        assert response.status_code == 200
+        assert response.streaming
+        occurrences = json.loads(b"".join(response.streaming_content))
+        assert len(occurrences) == 60
+        assert occurrences[0] == self.create_expected_occurrence(
+            start + timedelta(hours=12),
+            workout,
+            recurring_alert=workout.recurring_alerts.get(),
+        )
+
+    @pytest.mark.parametrize("streaming_days", [31, 1])
+    def test_occurrences_match_the_documented_serializer(
+        self,
+        settings,
+        streaming_days,
+        api_client,
+        create_workout_with,
+        create_scheduled_date_with,
+        create_recurring_alert_with,
+    ):
+        settings.CALENDAR_STREAMING_DAYS = streaming_days
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        workout = create_workout_with()
+        create_recurring_alert_with(
+            time=datetime.time(12, 0), week_days=list(range(7)), workout=workout
+        )
+        create_scheduled_date_with(
+            datetime=start + timedelta(days=1, hours=9), workout=workout
+        )
+
+        api_client.force_authenticate(user=workout.user)
+        response = self.get_calendar(api_client, start, start + timedelta(days=7))
+
+        if response.streaming:
+            occurrences = json.loads(b"".join(response.streaming_content))
+        else:
+            occurrences = response.json()
+        fields = set(CalendarOccurrenceSerializer().fields)
+        assert len(occurrences) == 8
+        for occurrence in occurrences:
+            assert set(occurrence) == fields
+            assert CalendarOccurrenceSerializer(data=occurrence).is_valid()
+
+    def test_calendar_is_served_with_a_fixed_number_of_queries(
+        self,
+        api_client,
+        django_assert_num_queries,
+        create_batch_workouts_with,
+        create_recurring_alert_with,
+        user_created,
+    ):
+        for workout in create_batch_workouts_with(size=5, user=user_created):
+            create_recurring_alert_with(
+                time=datetime.time(12, 0), week_days=[0, 1, 2], workout=workout
+            )
+        start = timezone.now() - timedelta(days=7)
+
+        api_client.force_authenticate(user=user_created)
+        # One query reads the materialized end, two expand the past days and
+        # one reads the materialized window.
+        with django_assert_num_queries(4):
+            response = self.get_calendar(api_client, start, start + timedelta(days=14))
+
+        # 5 workouts going off 3 days a week, for 2 weeks.
+        assert len(response.json()) == 30
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"from": "2024-10-14T00:00:00Z"},
+            {"from": "2024-10-14T00:00:00Z", "to": "2024-10-14T00:00:00Z"},
+            {"from": "2024-10-14T00:00:00Z", "to": "2026-10-14T00:00:00Z"},
+            {"from": "invalid", "to": "2024-10-15T00:00:00Z"},
+        ],
+    )
+    def test_invalid_range(self, api_client, user_created, params):
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, params)
+
+        assert response.status_code == 400
+
+    def test_unauthenticated_user_cannot_access_the_calendar(self, api_client):
+        response = api_client.get(
+            self.url, {"from": "2024-10-14T00:00:00Z", "to": "2024-10-15T00:00:00Z"}
+        )
+
+        assert response.status_code == 401
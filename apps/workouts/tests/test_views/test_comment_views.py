@@ -59,6 +59,35 @@ class TestListCommentsView(ParentWorkoutCommentView):
 
         assert response.json()["results"] == expected_comments
 
+    def test_user_can_list_comments_with_cursor_pagination(
+        self, api_client, workout_created, create_batch_comments_with
+    ):
+        comments = create_batch_comments_with(size=3, workout=workout_created)
+        workout_id = str(workout_created.id)
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.get(
+            f"{self.url}{workout_id}/{self.comments_url}",
+            {"pagination": "cursor", "page_size": 2},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert set(response.json().keys()) == {"next", "previous", "results"}
+        assert response.json()["next"] is not None
+
+        next_response = api_client.get(response.json()["next"], format="json")
+        returned_comments = (
+            response.json()["results"] + next_response.json()["results"]
+        )
+
+        sorted_comments = sorted(
+            comments, key=lambda comment: (comment.created_at, comment.id), reverse=True
+        )
+        assert returned_comments == [
+            self.create_expected_comment(comment) for comment in sorted_comments
+        ]
+
     def test_user_cannnot_access_comments_of_another_user_s_workout(
         self,
         api_client,
@@ -126,6 +155,21 @@ class TestRetrieveCommentView(ParentWorkoutCommentView):
 
         assert response.json() == expected_data
 
+    def test_retrieve_checks_the_workout_owner_in_the_same_query(
+        self, api_client, comment_created, django_assert_num_queries
+    ):
+        workout = comment_created.workout
+
+        api_client.force_authenticate(user=workout.user)
+        with django_assert_num_queries(1) as captured:
+            response = api_client.get(
+                f"{self.url}{workout.id}/{self.comments_url}{comment_created.id}/",
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert '"workouts_workout"' in captured.captured_queries[0]["sql"]
+
     def test_user_cannot_access_comment_that_not_exist(
         self, api_client, workout_created
     ):
@@ -221,6 +265,20 @@ class TestCreateCommentView(ParentWorkoutCommentView):
         expected_data = self.create_expected_comment(comment_created)
         assert response.json() == expected_data
 
+    def test_create_fetches_the_workout_once(
+        self, api_client, workout_created, django_assert_num_queries
+    ):
+        api_client.force_authenticate(user=workout_created.user)
+        # Workout and insert, plus the comment counter of the workout stats.
+        with django_assert_num_queries(3):
+            response = api_client.post(
+                f"{self.url}{workout_created.id}/{self.comments_url}",
+                {"comment": "Test workout comment"},
+                format="json",
+            )
+
+        assert response.status_code == 201
+
     def test_create_fails_with_incorrect_data(self, api_client, workout_created):
         workout_id = str(workout_created.id)
         authenticated_user = workout_created.user
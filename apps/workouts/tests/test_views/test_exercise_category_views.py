@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from django.urls import reverse
 
@@ -34,6 +36,94 @@ class TestExerciseCategoryViews(ParentCategoryViews):
         response = api_client.get(self.url, format="json")
         assert response.status_code == 401
 
+    def test_cached_categories_cost_no_queries(
+        self,
+        api_client,
+        user_created,
+        create_batch_exercise_categories,
+        django_assert_num_queries,
+    ):
+        create_batch_exercise_categories(size=3)
+
+        api_client.force_authenticate(user=user_created)
+        first_response = api_client.get(self.url, format="json")
+
+        with django_assert_num_queries(0):
+            second_response = api_client.get(self.url, format="json")
+
+        assert second_response.status_code == 200
+        assert second_response.json() == first_response.json()
+
+    def test_category_changes_invalidate_the_cache(
+        self, api_client, user_created, create_exercise_category_with
+    ):
+        category = create_exercise_category_with(name="Cardio")
+
+        api_client.force_authenticate(user=user_created)
+        api_client.get(self.url, format="json")
+
+        new_category = create_exercise_category_with(name="Strength")
+        category.name = "Balance"
+        category.save()
+        response = api_client.get(self.url, format="json")
+
+        assert response.data["results"] == [
+            {"id": str(category.id), "name": "Balance"},
+            {"id": str(new_category.id), "name": "Strength"},
+        ]
+
+        new_category.delete()
+        response = api_client.get(self.url, format="json")
+
+        assert response.data["count"] == 1
+
+    def test_list_returns_not_modified_when_etag_matches(
+        self,
+        api_client,
+        user_created,
+        create_exercise_category_with,
+        django_assert_num_queries,
+    ):
+        create_exercise_category_with(name="Cardio")
+
+        api_client.force_authenticate(user=user_created)
+        etag = api_client.get(self.url, format="json")["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(self.url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+        create_exercise_category_with(name="Strength")
+        response = api_client.get(self.url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.data["count"] == 2
+
+
+class TestCacheStatsView(ParentCategoryViews):
+    url = reverse("exercise-categories-cache-stats")
+
+    def test_admin_can_read_cache_stats(self, api_client, user_created):
+        user_created.is_staff = True
+        user_created.save()
+
+        api_client.force_authenticate(user=user_created)
+        api_client.get(reverse("exercise-categories-list"), format="json")
+        api_client.get(reverse("exercise-categories-list"), format="json")
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["misses"] == 1
+        assert response.data["local_hits"] == 1
+
+    def test_regular_user_cannot_read_cache_stats(self, api_client, user_created):
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 403
+
 
 class TestExerciseViews(ParentCategoryViews):
     exercises_url = "exercises/"
@@ -89,6 +179,76 @@ class TestExerciseViews(ParentCategoryViews):
 
         assert response.status_code == 404
 
+    @pytest.mark.parametrize("etag", ["*", "other category"])
+    def test_unknown_category_is_not_found_even_when_the_etag_matches(
+        self, api_client, user_created, create_batch_exercise_categories, etag
+    ):
+        [category, _] = create_batch_exercise_categories(size=2)
+        unknown_url = f"{self.url}{uuid.uuid4()}/{self.exercises_url}"
+
+        api_client.force_authenticate(user=user_created)
+        if etag == "other category":
+            url = f"{self.url}{category.id}/{self.exercises_url}"
+            etag = api_client.get(url, format="json")["ETag"]
+        response = api_client.get(unknown_url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 404
+
+    def test_new_category_is_found_after_the_ids_are_cached(
+        self, api_client, user_created, create_exercise_category_with
+    ):
+        api_client.force_authenticate(user=user_created)
+        api_client.get(f"{self.url}{uuid.uuid4()}/{self.exercises_url}")
+
+        category = create_exercise_category_with(name="Mobility")
+        response = api_client.get(f"{self.url}{category.id}/{self.exercises_url}")
+
+        assert response.status_code == 200
+
+    def test_cached_exercises_cost_no_queries(
+        self,
+        api_client,
+        user_created,
+        exercise_category_created,
+        create_batch_exercises_with,
+        django_assert_num_queries,
+    ):
+        create_batch_exercises_with(size=3, category=exercise_category_created)
+        url = f"{self.url}{exercise_category_created.id}/{self.exercises_url}"
+
+        api_client.force_authenticate(user=user_created)
+        first_response = api_client.get(url, format="json")
+
+        with django_assert_num_queries(0):
+            second_response = api_client.get(url, format="json")
+
+        assert second_response.status_code == 200
+        assert second_response.json() == first_response.json()
+
+    def test_list_exercises_with_sparse_fieldset(
+        self,
+        api_client,
+        user_created,
+        exercise_category_created,
+        create_exercise_with,
+    ):
+        exercise = create_exercise_with(category=exercise_category_created)
+        url = f"{self.url}{exercise_category_created.id}/{self.exercises_url}"
+
+        api_client.force_authenticate(user=user_created)
+        full_response = api_client.get(url, format="json")
+        response = api_client.get(url, {"omit": "description"}, format="json")
+
+        assert response.json()["results"] == [
+            {
+                "id": str(exercise.id),
+                "name": exercise.name,
+                "category": exercise_category_created.name,
+            }
+        ]
+        # Both fieldsets are served from the same cached data.
+        assert "description" in full_response.json()["results"][0]
+
     def test_unauthenticated_user_cannot_list_exercises(
         self, api_client, exercise_category_created
     ):
@@ -7,7 +7,6 @@ from workouts.models import ExercisePlan
 from workouts.serializers import NestedExerciseSerializer
 from workouts.tests.utils import serialize_datetime
 
-
 pytestmark = [pytest.mark.integration, pytest.mark.django_db]
 
 
@@ -119,6 +118,58 @@ class TestListExercisePlanView(ParentExercisePlanView):
 
         assert response.status_code == 401
 
+    @pytest.mark.parametrize("size", [1, 20])
+    def test_list_query_count_does_not_depend_on_page_size(
+        self,
+        api_client,
+        workout_created,
+        create_batch_exercise_plans_with,
+        django_assert_num_queries,
+        size,
+    ):
+        create_batch_exercise_plans_with(size=size, workout=workout_created)
+        workout_id = str(workout_created.id)
+
+        api_client.force_authenticate(user=workout_created.user)
+        with django_assert_num_queries(3):
+            response = api_client.get(
+                f"{self.url}{workout_id}/{self.exercise_plans_url}", format="json"
+            )
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == size
+        assert all(
+            isinstance(plan["exercise"]["category"], dict)
+            for plan in response.json()["results"]
+        )
+
+    def test_list_without_exercise_skips_the_exercise_join(
+        self,
+        api_client,
+        workout_created,
+        create_batch_exercise_plans_with,
+        django_assert_num_queries,
+    ):
+        plans = create_batch_exercise_plans_with(size=2, workout=workout_created)
+        workout_id = str(workout_created.id)
+
+        api_client.force_authenticate(user=workout_created.user)
+        with django_assert_num_queries(3) as captured:
+            response = api_client.get(
+                f"{self.url}{workout_id}/{self.exercise_plans_url}",
+                {"fields": "id,sets,reps"},
+                format="json",
+            )
+
+        assert '"workouts_exercise"' not in captured.captured_queries[-1]["sql"]
+        assert sorted(response.json()["results"], key=lambda p: p["id"]) == sorted(
+            [
+                {"id": str(plan.id), "sets": plan.sets, "reps": plan.reps}
+                for plan in plans
+            ],
+            key=lambda p: p["id"],
+        )
+
 
 class TestRetrieveExercisePlanView(ParentExercisePlanView):
     def test_user_can_access_exercise_plan_of_his_workout(
@@ -528,3 +579,167 @@ class TestDeleteExercisePlanView(ParentExercisePlanView):
         )
 
         assert response.status_code == 401
+
+
+class TestBulkExercisePlanView(ParentExercisePlanView):
+    bulk_url = "bulk/"
+
+    def get_bulk_url(self, workout):
+        return f"{self.url}{workout.id}/{self.exercise_plans_url}{self.bulk_url}"
+
+    def test_bulk_create_exercise_plans_with_a_fixed_number_of_queries(
+        self,
+        api_client,
+        workout_created,
+        create_batch_exercises_with,
+        django_assert_max_num_queries,
+    ):
+        exercises = create_batch_exercises_with(size=10)
+        plans_data = [
+            {"name": f"Plan {index}", "exercise": str(exercise.id), "sets": 3}
+            for index, exercise in enumerate(exercises)
+        ]
+
+        api_client.force_authenticate(user=workout_created.user)
+        # Workout, exercises, insert, stats counter and reload, plus the
+        # transaction.
+        with django_assert_max_num_queries(7):
+            response = api_client.post(
+                self.get_bulk_url(workout_created), plans_data, format="json"
+            )
+
+        assert response.status_code == 201
+        assert workout_created.exercise_plans.count() == 10
+        assert [plan["name"] for plan in response.json()] == [
+            plan["name"] for plan in plans_data
+        ]
+        assert response.json()[0] == self.create_expected_exercise_plan(
+            ExercisePlan.objects.get(pk=response.json()[0]["id"])
+        )
+
+    def test_bulk_create_reports_errors_per_item_and_writes_nothing(
+        self, api_client, workout_created, exercise_created
+    ):
+        plans_data = [
+            {"name": "Valid plan", "exercise": str(exercise_created.id)},
+            {"name": "Unknown exercise", "exercise": str(uuid.uuid4())},
+            {"exercise": str(exercise_created.id)},
+        ]
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.post(
+            self.get_bulk_url(workout_created), plans_data, format="json"
+        )
+
+        assert response.status_code == 400
+        errors = response.json()
+        assert len(errors) == 3
+        assert errors[0] == {}
+        assert set(errors[1]) == {"exercise"}
+        assert set(errors[2]) == {"name"}
+        assert not ExercisePlan.objects.exists()
+
+    def test_bulk_create_fails_with_too_many_items(
+        self, settings, api_client, workout_created, exercise_created
+    ):
+        settings.BULK_MAX_ITEMS = 2
+        plans_data = [
+            {"name": f"Plan {index}", "exercise": str(exercise_created.id)}
+            for index in range(3)
+        ]
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.post(
+            self.get_bulk_url(workout_created), plans_data, format="json"
+        )
+
+        assert response.status_code == 400
+        assert not ExercisePlan.objects.exists()
+
+    def test_bulk_update_exercise_plans(
+        self, api_client, workout_created, create_batch_exercise_plans_with
+    ):
+        plans = create_batch_exercise_plans_with(size=3, workout=workout_created)
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.patch(
+            self.get_bulk_url(workout_created),
+            [
+                {"id": str(plan.id), "sets": index + 1}
+                for index, plan in enumerate(plans)
+            ],
+            format="json",
+        )
+
+        assert response.status_code == 200
+        for index, plan in enumerate(plans):
+            previous_updated_at = plan.updated_at
+            plan.refresh_from_db()
+            assert plan.sets == index + 1
+            assert plan.updated_at > previous_updated_at
+            assert response.json()[index] == self.create_expected_exercise_plan(plan)
+
+    def test_bulk_update_rejects_plans_of_other_workouts(
+        self,
+        api_client,
+        workout_created,
+        create_exercise_plan_with,
+        exercise_plan_created,
+    ):
+        plan = create_exercise_plan_with(workout=workout_created, sets=3)
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.patch(
+            self.get_bulk_url(workout_created),
+            [
+                {"id": str(plan.id), "sets": 10},
+                {"id": str(exercise_plan_created.id), "sets": 10},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert response.json() == [{}, {"id": ["Not found."]}]
+        plan.refresh_from_db()
+        assert plan.sets == 3
+
+    def test_bulk_delete_exercise_plans(
+        self, api_client, workout_created, create_batch_exercise_plans_with
+    ):
+        plans = create_batch_exercise_plans_with(size=3, workout=workout_created)
+
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.delete(
+            self.get_bulk_url(workout_created),
+            [str(plan.id) for plan in plans[:2]],
+            format="json",
+        )
+
+        assert response.status_code == 204
+        assert list(workout_created.exercise_plans.all()) == [plans[2]]
+
+    def test_bulk_delete_fails_if_a_plan_does_not_exist(
+        self, api_client, workout_created, exercise_plan_created
+    ):
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.delete(
+            self.get_bulk_url(workout_created),
+            [str(uuid.uuid4()), str(exercise_plan_created.id)],
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"0": ["Not found."], "1": ["Not found."]}
+        assert ExercisePlan.objects.exists()
+
+    def test_bulk_fails_if_workout_belongs_to_another_user(
+        self, api_client, user_created, workout_created, exercise_created
+    ):
+        api_client.force_authenticate(user=user_created)
+        response = api_client.post(
+            self.get_bulk_url(workout_created),
+            [{"name": "Plan", "exercise": str(exercise_created.id)}],
+            format="json",
+        )
+
+        assert response.status_code == 404
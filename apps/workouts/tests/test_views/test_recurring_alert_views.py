@@ -6,7 +6,6 @@ from django.urls import reverse
 
 from workouts.models import RecurringWorkoutAlert, Workout
 
-
 pytestmark = [pytest.mark.integration, pytest.mark.django_db]
 
 
@@ -549,3 +548,75 @@ class TestDeleteRecurringAlertView(ParentRecurringAlertView):
         )
 
         assert response.status_code == 401
+
+
+class TestBulkRecurringAlertView(ParentRecurringAlertView):
+    def get_bulk_url(self, workout):
+        return f"{self.url}{workout.id}/{self.recurring_alerts_url}bulk/"
+
+    def test_bulk_create_recurring_alerts(self, api_client, create_workout_with):
+        workout = create_workout_with(type=Workout.SCHEDULED)
+        alerts_data = [
+            {"time": "07:30:00", "week_days": [0, 2]},
+            {"time": "18:00:00", "week_days": [6]},
+        ]
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.post(
+            self.get_bulk_url(workout), alerts_data, format="json"
+        )
+
+        assert response.status_code == 201
+        workout.refresh_from_db()
+        assert workout.is_recurrent()
+
+        alerts = RecurringWorkoutAlert.objects.filter(workout=workout).order_by("time")
+        assert response.json() == [
+            self.create_expected_alert(alert) for alert in alerts
+        ]
+        assert [(alert.minute_of_day, alert.week_days) for alert in alerts] == [
+            (450, [0, 2]),
+            (1080, [6]),
+        ]
+        # Every alert goes off on each of its week days within the window.
+        assert {
+            occurrence.recurring_alert_id for occurrence in workout.occurrences.all()
+        } == {alert.id for alert in alerts}
+
+    def test_bulk_update_keeps_the_schedule_fields_in_sync(
+        self, api_client, create_workout_with, create_recurring_alert_with
+    ):
+        workout = create_workout_with(type=Workout.RECURRENT)
+        alert = create_recurring_alert_with(
+            workout=workout, time=datetime.time(7, 0), week_days=[0]
+        )
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.patch(
+            self.get_bulk_url(workout),
+            [{"id": str(alert.id), "time": "08:15:00", "week_days": []}],
+            format="json",
+        )
+
+        assert response.status_code == 200
+        alert.refresh_from_db()
+        assert (alert.minute_of_day, alert.week_days) == (495, [])
+        assert not alert.occurrences.exists()
+
+    def test_bulk_update_rejects_repeated_items(
+        self, api_client, create_workout_with, create_recurring_alert_with
+    ):
+        workout = create_workout_with(type=Workout.RECURRENT)
+        alert = create_recurring_alert_with(workout=workout)
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.patch(
+            self.get_bulk_url(workout),
+            [{"id": str(alert.id), "week_days": [1]}] * 2,
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "non_field_errors": ["Each item can only appear once."]
+        }
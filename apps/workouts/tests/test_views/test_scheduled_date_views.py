@@ -3,12 +3,12 @@ import datetime
 
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.timezone import make_aware
 
 from workouts.models import ScheduledWorkoutDate, Workout
 from workouts.tests.utils import serialize_datetime
 
-
 pytestmark = [pytest.mark.integration, pytest.mark.django_db]
 
 
@@ -567,3 +567,73 @@ class TestDeleteScheduledDateView(ParentScheduledDateView):
         )
 
         assert response.status_code == 401
+
+
+class TestBulkScheduledDateView(ParentScheduledDateView):
+    def get_bulk_url(self, workout):
+        return f"{self.url}{workout.id}/{self.scheduled_dates_url}bulk/"
+
+    def test_bulk_create_scheduled_dates(
+        self, api_client, create_workout_with, create_recurring_alert_with
+    ):
+        workout = create_workout_with(type=Workout.RECURRENT)
+        create_recurring_alert_with(workout=workout)
+        now = timezone.now()
+        datetimes = [now + datetime.timedelta(days=days) for days in [1, 2, 30]]
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.post(
+            self.get_bulk_url(workout),
+            [{"datetime": value.isoformat()} for value in datetimes],
+            format="json",
+        )
+
+        assert response.status_code == 201
+        workout.refresh_from_db()
+        assert workout.is_scheduled()
+        assert not workout.recurring_alerts.exists()
+        assert [item["datetime"] for item in response.json()] == [
+            serialize_datetime(value) for value in datetimes
+        ]
+        # Only the dates within the materialized window get an occurrence.
+        assert sorted(workout.occurrences.values_list("datetime", flat=True)) == (
+            datetimes[:2]
+        )
+
+    def test_bulk_create_in_the_past_fails_without_switching_the_workout(
+        self, api_client, create_workout_with, create_recurring_alert_with
+    ):
+        workout = create_workout_with(type=Workout.RECURRENT)
+        create_recurring_alert_with(workout=workout)
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.post(
+            self.get_bulk_url(workout),
+            [{"datetime": (timezone.now() - datetime.timedelta(days=1)).isoformat()}],
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert set(response.json()[0]) == {"datetime"}
+        workout.refresh_from_db()
+        assert workout.is_recurrent()
+        assert workout.recurring_alerts.exists()
+
+    def test_bulk_update_moves_the_occurrences(
+        self, api_client, create_workout_with, create_scheduled_date_with
+    ):
+        workout = create_workout_with(type=Workout.SCHEDULED)
+        scheduled_date = create_scheduled_date_with(
+            workout=workout, datetime=timezone.now() + datetime.timedelta(days=1)
+        )
+        new_datetime = timezone.now() + datetime.timedelta(days=3)
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.patch(
+            self.get_bulk_url(workout),
+            [{"id": str(scheduled_date.id), "datetime": new_datetime.isoformat()}],
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert scheduled_date.occurrences.get().datetime == new_datetime
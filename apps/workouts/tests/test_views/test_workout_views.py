@@ -6,7 +6,6 @@ from django.urls import reverse
 from workouts.models import Workout
 from workouts.tests.utils import serialize_datetime
 
-
 pytestmark = [pytest.mark.integration, pytest.mark.django_db]
 
 
@@ -62,6 +61,245 @@ class TestListWorkoutView(ParentWorkoutView):
         response = api_client.get(self.url, format="json")
         assert response.status_code == 401
 
+    @pytest.mark.parametrize("size", [1, 20])
+    def test_list_query_count_does_not_depend_on_page_size(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        create_batch_exercise_plans_with,
+        create_scheduled_date_with,
+        django_assert_num_queries,
+        size,
+    ):
+        workouts = create_batch_workouts_with(size=size, user=user_created, type="S")
+        for workout in workouts:
+            create_batch_exercise_plans_with(size=2, workout=workout)
+            create_scheduled_date_with(workout=workout)
+
+        api_client.force_authenticate(user=user_created)
+        with django_assert_num_queries(2):
+            response = api_client.get(self.url, format="json")
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == size
+        assert all(
+            workout["status"] == "Active" and workout["exercises"] == 2
+            for workout in response.json()["results"]
+        )
+
+    @pytest.mark.parametrize("size", [1, 5])
+    def test_expanded_list_query_count_does_not_depend_on_page_size(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        create_batch_exercise_plans_with,
+        create_batch_comments_with,
+        create_scheduled_date_with,
+        create_recurring_alert_with,
+        django_assert_num_queries,
+        size,
+    ):
+        for workout in create_batch_workouts_with(size=size, user=user_created):
+            create_batch_exercise_plans_with(size=2, workout=workout)
+            create_batch_comments_with(size=2, workout=workout)
+            create_scheduled_date_with(workout=workout)
+            create_recurring_alert_with(workout=workout)
+
+        api_client.force_authenticate(user=user_created)
+        # Count and page, plus one query per expanded collection.
+        with django_assert_num_queries(6):
+            response = api_client.get(
+                self.url,
+                {"expand": "exercise_plans,scheduled_dates,recurring_alerts,comments"},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert all(
+            len(workout["exercise_plans"]) == 2
+            and len(workout["comments"]) == 2
+            and len(workout["scheduled_dates"]) == 1
+            and len(workout["recurring_alerts"]) == 1
+            for workout in response.json()["results"]
+        )
+
+    def test_list_fails_with_unknown_expand(self, api_client, user_created):
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(
+            self.url, {"expand": "comments,exercises"}, format="json"
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"expand": "Unknown collections: exercises."}
+
+    def test_list_returns_only_the_requested_fields(
+        self, api_client, user_created, create_batch_workouts_with
+    ):
+        workouts = create_batch_workouts_with(size=2, user=user_created)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, {"fields": "id,name"}, format="json")
+
+        assert response.status_code == 200
+        assert sorted(response.json()["results"], key=lambda w: w["id"]) == sorted(
+            [{"id": str(workout.id), "name": workout.name} for workout in workouts],
+            key=lambda w: w["id"],
+        )
+
+    @pytest.mark.parametrize(
+        "params,annotation",
+        [
+            ({"fields": "id,name"}, None),
+            ({"omit": "exercises"}, "EXISTS"),
+            ({"fields": "id,exercises"}, "COUNT"),
+        ],
+    )
+    def test_list_skips_the_annotations_of_unrequested_fields(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        django_assert_num_queries,
+        params,
+        annotation,
+    ):
+        create_batch_workouts_with(size=2, user=user_created)
+
+        api_client.force_authenticate(user=user_created)
+        with django_assert_num_queries(2) as captured:
+            response = api_client.get(self.url, params, format="json")
+
+        page_sql = captured.captured_queries[-1]["sql"].upper()
+        assert response.status_code == 200
+        for keyword in ["EXISTS", "COUNT"]:
+            assert (keyword in page_sql) == (keyword == annotation)
+
+    @pytest.mark.parametrize(
+        "params,num_queries",
+        [
+            ({"fields": "id"}, 2),
+            ({"fields": "id,comments"}, 3),
+            ({"omit": "comments"}, 2),
+        ],
+    )
+    def test_sparse_fieldsets_apply_to_expanded_collections(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        create_batch_comments_with,
+        django_assert_num_queries,
+        params,
+        num_queries,
+    ):
+        for workout in create_batch_workouts_with(size=2, user=user_created):
+            create_batch_comments_with(size=2, workout=workout)
+
+        api_client.force_authenticate(user=user_created)
+        # Count and page, plus the comments only when they are kept.
+        with django_assert_num_queries(num_queries):
+            response = api_client.get(
+                self.url, {"expand": "comments", **params}, format="json"
+            )
+
+        assert response.status_code == 200
+        for workout in response.json()["results"]:
+            assert ("comments" in workout) == (num_queries == 3)
+            if "fields" in params:
+                assert set(workout) == set(params["fields"].split(","))
+
+    def test_omit_leaves_out_fields(self, api_client, workout_created):
+        api_client.force_authenticate(user=workout_created.user)
+        response = api_client.get(
+            f"{self.url}{workout_created.id}/",
+            {"omit": "description,status"},
+            format="json",
+        )
+
+        expected_data = self.create_expected_workout(workout_created)
+        del expected_data["description"], expected_data["status"]
+        assert response.json() == expected_data
+
+    def test_list_returns_not_modified_when_etag_matches(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        django_assert_num_queries,
+    ):
+        create_batch_workouts_with(size=2, user=user_created)
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url, format="json")
+        etag = response["ETag"]
+
+        with django_assert_num_queries(2):
+            response = api_client.get(self.url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_list_etag_changes_when_a_child_changes(
+        self,
+        api_client,
+        workout_created,
+        create_exercise_plan_with,
+        create_scheduled_date_with,
+    ):
+        api_client.force_authenticate(user=workout_created.user)
+        first_etag = api_client.get(self.url, format="json")["ETag"]
+
+        create_exercise_plan_with(workout=workout_created)
+        response = api_client.get(
+            self.url, format="json", HTTP_IF_NONE_MATCH=first_etag
+        )
+        second_etag = response["ETag"]
+
+        assert response.status_code == 200
+        assert second_etag != first_etag
+
+        workout_created.switch_to_scheduled()
+        create_scheduled_date_with(workout=workout_created)
+        response = api_client.get(
+            self.url, format="json", HTTP_IF_NONE_MATCH=second_etag
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == "Active"
+
+    def test_cursor_pagination_walks_every_page_without_counting(
+        self,
+        api_client,
+        user_created,
+        create_batch_workouts_with,
+        django_assert_num_queries,
+    ):
+        workouts = create_batch_workouts_with(size=5, user=user_created)
+
+        api_client.force_authenticate(user=user_created)
+        with django_assert_num_queries(1):
+            response = api_client.get(
+                self.url, {"pagination": "cursor", "page_size": 2}, format="json"
+            )
+
+        assert response.status_code == 200
+        assert set(response.json().keys()) == {"next", "previous", "results"}
+
+        returned_ids = [workout["id"] for workout in response.json()["results"]]
+        next_url = response.json()["next"]
+        while next_url:
+            response = api_client.get(next_url, format="json")
+            returned_ids += [workout["id"] for workout in response.json()["results"]]
+            next_url = response.json()["next"]
+
+        sorted_workouts = sorted(
+            workouts, key=lambda workout: (workout.created_at, workout.id), reverse=True
+        )
+        assert returned_ids == [str(workout.id) for workout in sorted_workouts]
+
 
 class TestRetrieveWorkoutView(ParentWorkoutView):
     def test_user_can_access_his_workout(self, api_client, workout_created):
@@ -76,6 +314,75 @@ class TestRetrieveWorkoutView(ParentWorkoutView):
 
         assert response.json() == expected_data
 
+    def test_retrieve_returns_not_modified_when_etag_matches(
+        self, api_client, workout_created
+    ):
+        url = f"{self.url}{workout_created.id}/"
+
+        api_client.force_authenticate(user=workout_created.user)
+        etag = api_client.get(url, format="json")["ETag"]
+        response = api_client.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+        workout_created.name = "New name"
+        workout_created.save()
+        response = api_client.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    @pytest.mark.parametrize(
+        "workout_type,collection",
+        [
+            ("S", "exercise_plans"),
+            ("S", "comments"),
+            ("S", "scheduled_dates"),
+            ("R", "recurring_alerts"),
+        ],
+    )
+    def test_expanded_collection_matches_its_nested_route(
+        self,
+        api_client,
+        create_workout_with,
+        create_batch_exercise_plans_with,
+        create_batch_comments_with,
+        create_batch_scheduled_dates_with,
+        create_batch_recurring_alerts_with,
+        workout_type,
+        collection,
+    ):
+        workout = create_workout_with(type=workout_type)
+        create_batch_exercise_plans_with(size=3, workout=workout)
+        create_batch_comments_with(size=3, workout=workout)
+        create_batch_scheduled_dates_with(size=3, workout=workout)
+        create_batch_recurring_alerts_with(size=3, workout=workout)
+        url = f"{self.url}{workout.id}/"
+
+        api_client.force_authenticate(user=workout.user)
+        response = api_client.get(url, {"expand": collection}, format="json")
+        nested_response = api_client.get(f"{url}{collection}/", format="json")
+
+        assert response.status_code == 200
+        assert response.json()[collection] == nested_response.json()["results"]
+
+    def test_expanded_retrieve_etag_changes_when_a_nested_item_changes(
+        self, api_client, workout_created, create_comment_with
+    ):
+        comment = create_comment_with(workout=workout_created)
+        url = f"{self.url}{workout_created.id}/?expand=comments"
+
+        api_client.force_authenticate(user=workout_created.user)
+        etag = api_client.get(url, format="json")["ETag"]
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        comment.comment = "Updated comment"
+        comment.save()
+        response = api_client.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["comments"][0]["comment"] == "Updated comment"
+
     def test_user_cannot_access_another_user_s_workout(
         self, api_client, user_created, workout_created
     ):
@@ -400,3 +707,61 @@ class TestDeleteWorkoutView(ParentWorkoutView):
         )
 
         assert response.status_code == 401
+
+
+class TestWorkoutStatsView:
+    url = reverse("workouts-stats")
+
+    def test_user_gets_the_stats_of_their_workouts(
+        self,
+        api_client,
+        user_created,
+        create_workout_with,
+        create_exercise_plan_with,
+        create_comment_with,
+    ):
+        workout = create_workout_with(user=user_created, type=Workout.RECURRENT)
+        create_workout_with(user=user_created)
+        create_exercise_plan_with(workout=workout)
+        create_comment_with(workout=workout)
+        create_workout_with()
+
+        api_client.force_authenticate(user=user_created)
+        response = api_client.get(self.url)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data.pop("updated_at")
+        assert data == {
+            "workouts": 2,
+            "active_workouts": 1,
+            "completed_workouts": 0,
+            "pending_workouts": 1,
+            "exercise_plans": 1,
+            "comments": 1,
+        }
+
+    def test_stats_follow_the_changes_of_the_workouts(
+        self, api_client, user_created, create_workout_with
+    ):
+        api_client.force_authenticate(user=user_created)
+        first_response = api_client.get(self.url)
+
+        create_workout_with(user=user_created)
+        response = api_client.get(self.url, HTTP_IF_NONE_MATCH=first_response["ETag"])
+
+        assert response.status_code == 200
+        assert response.json()["workouts"] == 1
+
+    def test_stats_not_modified(self, api_client, user_created):
+        api_client.force_authenticate(user=user_created)
+        first_response = api_client.get(self.url)
+
+        response = api_client.get(self.url, HTTP_IF_NONE_MATCH=first_response["ETag"])
+
+        assert response.status_code == 304
+
+    def test_unauthenticated_user_cannot_get_stats(self, api_client):
+        response = api_client.get(self.url)
+
+        assert response.status_code == 401
@@ -10,6 +10,8 @@ from workouts.views import (
     comment_views,
     scheduled_date_views,
     recurring_alert_views,
+    calendar_views,
+    analytics_views,
 )
 
 router = SimpleRouter()
@@ -20,6 +22,8 @@ router.register(
     basename="exercise-categories",
 )
 router.register("workouts", workout_views.WorkoutViews, basename="workouts")
+router.register("calendar", calendar_views.CalendarViews, basename="calendar")
+router.register("analytics", analytics_views.AnalyticsViews, basename="analytics")
 
 # Workout nested routes
 exercise_plan_routers = nested_routes.NestedSimpleRouter(
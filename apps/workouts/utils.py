@@ -0,0 +1,7 @@
+from itertools import islice
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
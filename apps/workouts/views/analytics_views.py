@@ -0,0 +1,39 @@
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from drf_spectacular.utils import extend_schema, extend_schema_view
+
+from workouts.analytics import get_volume_by_week
+from workouts.serializers import VolumeQuerySerializer, VolumeSerializer
+
+
+@extend_schema_view(
+    volume=extend_schema(
+        tags=["analytics"],
+        parameters=[VolumeQuerySerializer],
+        responses=VolumeSerializer(many=True),
+    ),
+)
+class AnalyticsViews(viewsets.GenericViewSet):
+    serializer_class = VolumeSerializer
+    pagination_class = None
+
+    @action(methods=["GET"], detail=False)
+    def volume(self, request, *args, **kwargs):
+        """
+        Training volume, sets × reps × weight, of the user's exercise plans
+        per week, exercise and category, newest week first. Weights are
+        converted to `unit`, and plans missing sets, reps or weight, or
+        with an unknown unit, are left out. `from` and `to` bound the
+        creation of the plans.
+        """
+        query_serializer = VolumeQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        volume = get_volume_by_week(
+            request.user, params["unit"], params.get("from"), params.get("to")
+        )
+        serializer = self.get_serializer(volume, many=True)
+        return Response(serializer.data)
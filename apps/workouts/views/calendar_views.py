@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from drf_spectacular.utils import extend_schema, extend_schema_view
+
+from workouts.occurrences import iter_user_occurrences
+from workouts.serializers import CalendarOccurrenceSerializer, CalendarRangeSerializer
+from workouts.utils import chunked
+
+
+def stream_json_array(items, batch_size=500):
+    encoder = JSONEncoder(separators=(",", ":"))
+
+    yield "["
+    for index, batch in enumerate(chunked(items, batch_size)):
+        if index:
+            yield ","
+        yield ",".join(encoder.encode(item) for item in batch)
+    yield "]"
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=["calendar"],
+        parameters=[CalendarRangeSerializer],
+        responses=CalendarOccurrenceSerializer(many=True),
+    ),
+)
+class CalendarViews(viewsets.GenericViewSet):
+    serializer_class = CalendarOccurrenceSerializer
+    pagination_class = None
+
+    def list(self, request, *args, **kwargs):
+        range_serializer = CalendarRangeSerializer(data=request.query_params)
+        range_serializer.is_valid(raise_exception=True)
+        start = range_serializer.validated_data["from"]
+        end = range_serializer.validated_data["to"]
+
+        occurrences = iter_user_occurrences(request.user, start, end)
+        if end - start > timedelta(days=settings.CALENDAR_STREAMING_DAYS):
+            return StreamingHttpResponse(
+                stream_json_array(occurrences), content_type="application/json"
+            )
+
+        return Response(list(occurrences))
@@ -1,10 +1,11 @@
-from django.shortcuts import get_object_or_404
 from rest_framework import viewsets
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from workouts.models import WorkoutComment, Workout
+from workout_tracker.instrumentation import SerializerTimingMixin
+from workouts.models import WorkoutComment
 from workouts.serializers import CommentSerializer
+from workouts.views.mixins import CursorPaginationMixin, NestedWorkoutMixin
 
 
 @extend_schema_view(
@@ -15,27 +16,20 @@ from workouts.serializers import CommentSerializer
     partial_update=extend_schema(tags=["workout comments"]),
     destroy=extend_schema(tags=["workout comments"]),
 )
-class CommentViews(viewsets.ModelViewSet):
+class CommentViews(
+    NestedWorkoutMixin,
+    CursorPaginationMixin,
+    SerializerTimingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = CommentSerializer
+    ordering = ("-created_at",)
 
     def get_queryset(self):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
+        queryset = self.filter_by_workout(WorkoutComment.objects.all())
+        return queryset.order_by(*self.ordering)
 
-        return WorkoutComment.objects.filter(workout=workout).order_by("-created_at")
-
-    def get_serializer_context(self):
-        context = {
-            "request": self.request,
-            "format": self.format_kwarg,
-            "view": self,
-        }
-
-        if self.request.method == "POST":
-            workout = get_object_or_404(
-                Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-            )
-            context["workout"] = workout
-
-        return context
+    def list(self, request, *args, **kwargs):
+        # An empty page must still tell apart a workout that is not theirs.
+        self.get_workout()
+        return super().list(request, *args, **kwargs)
@@ -1,32 +1,115 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models.functions import Lower
+from django.http import Http404
 from rest_framework import viewsets, mixins
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
+from workout_tracker.instrumentation import SerializerTimingMixin
 from workouts import models, serializers
+from workouts.cache import catalog_cache
+from workouts.views.mixins import (
+    ConditionalResponseMixin,
+    SparseFieldsetsMixin,
+    sparse_fieldset_parameters,
+)
 
 
 @extend_schema_view(
     list=extend_schema(tags=["exercise categories"]),
     exercises=extend_schema(tags=["exercise categories"]),
+    cache_stats=extend_schema(tags=["exercise categories"]),
 )
-class ExerciseCategoryViews(viewsets.GenericViewSet, mixins.ListModelMixin):
+class ExerciseCategoryViews(
+    ConditionalResponseMixin,
+    SparseFieldsetsMixin,
+    SerializerTimingMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
     queryset = models.ExerciseCategory.objects.all().order_by(Lower("name"))
     serializer_class = serializers.ExerciseCategorySerializer
 
-    @extend_schema(responses={200: serializers.ExerciseSerializer(many=True)})
+    def get_categories_data(self):
+        serializer = self.get_serializer(self.get_queryset(), many=True)
+        return serializer.data
+
+    def get_category_ids(self):
+        return {str(pk) for pk in self.get_queryset().values_list("pk", flat=True)}
+
+    def get_category_pk(self):
+        """
+        Return the pk of the requested category, raising a 404 when it does
+        not exist. The check reads the cached ids, and runs before the
+        conditional response so `If-None-Match: *` can't hide a 404.
+        """
+        try:
+            pk = str(self.get_queryset().model._meta.pk.to_python(self.kwargs["pk"]))
+        except DjangoValidationError:
+            raise Http404
+
+        if pk not in catalog_cache.get_or_set("categories:ids", self.get_category_ids):
+            raise Http404
+
+        return pk
+
+    def get_exercises_data(self, category_pk):
+        exercises = (
+            models.Exercise.objects.filter(category_id=category_pk)
+            .select_related("category")
+            .order_by(Lower("name"))
+        )
+        serializer = serializers.ExerciseSerializer(exercises, many=True)
+        return serializer.data
+
+    def list(self, request, *args, **kwargs):
+        etag = self.get_etag(catalog_cache.get_version())
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        categories = catalog_cache.get_or_set("categories", self.get_categories_data)
+
+        page = self.paginate_queryset(categories)
+        if page is not None:
+            response = self.get_paginated_response(page)
+        else:
+            response = Response(categories)
+
+        response["ETag"] = etag
+        return response
+
+    @extend_schema(
+        parameters=sparse_fieldset_parameters,
+        responses={200: serializers.ExerciseSerializer(many=True)},
+    )
     @action(methods=["GET"], detail=True)
     def exercises(self, request, *args, **kwargs):
-        category = self.get_object()
-        exercises = category.exercises.all().order_by(Lower("name"))
-        exercise_serializer = serializers.ExerciseSerializer
+        category_pk = self.get_category_pk()
 
+        etag = self.get_etag(catalog_cache.get_version())
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        exercises = catalog_cache.get_or_set(
+            f"categories:{category_pk}:exercises",
+            lambda: self.get_exercises_data(category_pk),
+        )
+
+        # The cache holds every field, so the fieldset is applied afterwards.
         page = self.paginate_queryset(exercises)
         if page is not None:
-            serializer = exercise_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            response = self.get_paginated_response(self.trim_fields(page))
+        else:
+            response = Response(self.trim_fields(exercises))
+
+        response["ETag"] = etag
+        return response
 
-        serializer = exercise_serializer(exercises, many=True)
-        return Response(serializer.data)
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    @action(methods=["GET"], detail=False, permission_classes=[IsAdminUser])
+    def cache_stats(self, request, *args, **kwargs):
+        return Response(catalog_cache.stats())
@@ -1,17 +1,25 @@
 from rest_framework import viewsets
 from django.db.models.functions import Lower
-from django.shortcuts import get_object_or_404
 
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
+from workout_tracker.instrumentation import SerializerTimingMixin
 from workouts import swagger_serializers
-from workouts.models import ExercisePlan, Workout
+from workouts.models import ExercisePlan
 from workouts.serializers import ExercisePlanSerializer
+from workouts.views.mixins import (
+    BulkModelMixin,
+    CursorPaginationMixin,
+    NestedWorkoutMixin,
+    SparseFieldsetsMixin,
+    sparse_fieldset_parameters,
+)
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["workout exercise plans"],
+        parameters=sparse_fieldset_parameters,
         responses={200: swagger_serializers.ExercisePlanResponseSerializer},
     ),
     create=extend_schema(
@@ -20,6 +28,7 @@ from workouts.serializers import ExercisePlanSerializer
     ),
     retrieve=extend_schema(
         tags=["workout exercise plans"],
+        parameters=sparse_fieldset_parameters,
         responses={200: swagger_serializers.ExercisePlanResponseSerializer},
     ),
     update=extend_schema(
@@ -31,30 +40,27 @@ from workouts.serializers import ExercisePlanSerializer
         responses={200: swagger_serializers.ExercisePlanResponseSerializer},
     ),
     destroy=extend_schema(tags=["workout exercise plans"]),
+    bulk=extend_schema(tags=["workout exercise plans"]),
 )
-class ExercisePlanViews(viewsets.ModelViewSet):
+class ExercisePlanViews(
+    BulkModelMixin,
+    NestedWorkoutMixin,
+    CursorPaginationMixin,
+    SparseFieldsetsMixin,
+    SerializerTimingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = ExercisePlanSerializer
+    ordering = (Lower("name"), "-created_at")
 
     def get_queryset(self):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-
-        return ExercisePlan.objects.filter(workout=workout).order_by(
-            Lower("name"), "-created_at"
-        )
-
-    def get_serializer_context(self):
-        context = {
-            "request": self.request,
-            "format": self.format_kwarg,
-            "view": self,
-        }
+        queryset = self.filter_by_workout(ExercisePlan.objects.all())
+        if self.is_field_requested("exercise"):
+            queryset = queryset.select_related("exercise__category")
 
-        if self.request.method == "POST":
-            workout = get_object_or_404(
-                Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-            )
-            context["workout"] = workout
+        return queryset.order_by(*self.ordering)
 
-        return context
+    def list(self, request, *args, **kwargs):
+        # An empty page must still tell apart a workout that is not theirs.
+        self.get_workout()
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,276 @@
+import hashlib
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.http import Http404
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import permissions, serializers, status
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+
+from workout_tracker.pagination import CursorPagination
+from workouts.models import Workout
+
+
+class ConditionalResponseMixin:
+    """
+    Helpers to answer `If-None-Match` requests with a 304 response before
+    the serializer runs.
+    """
+
+    def get_etag(self, *parts):
+        key = repr((self.request.get_full_path(), *parts)).encode()
+        return quote_etag(hashlib.md5(key, usedforsecurity=False).hexdigest())
+
+    def is_not_modified(self, etag):
+        if_none_match = self.request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        etags = [item.removeprefix("W/") for item in parse_etags(if_none_match)]
+        return "*" in etags or etag in etags
+
+    def not_modified_response(self, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+class CursorPaginationMixin:
+    """
+    Lets clients opt into keyset pagination with `?pagination=cursor`.
+
+    Cursor pages skip the `COUNT(*)` and `OFFSET` scan of page number
+    pagination and are ordered by `cursor_ordering`, which must be backed by
+    an index to keep deep pages as cheap as the first one.
+    """
+
+    cursor_ordering = ("-created_at", "-id")
+    cursor_query_param = "cursor"
+    pagination_mode_query_param = "pagination"
+
+    def use_cursor_pagination(self):
+        if getattr(self, "request", None) is None:
+            return False
+
+        query_params = self.request.query_params
+        return (
+            self.cursor_query_param in query_params
+            or query_params.get(self.pagination_mode_query_param) == "cursor"
+        )
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.use_cursor_pagination():
+            self._paginator = CursorPagination(ordering=self.cursor_ordering)
+
+        return super().paginator
+
+
+sparse_fieldset_parameters = [
+    OpenApiParameter(
+        "fields",
+        OpenApiTypes.STR,
+        description="Comma separated fields to include, all of them by default.",
+    ),
+    OpenApiParameter(
+        "omit", OpenApiTypes.STR, description="Comma separated fields to leave out."
+    ),
+]
+
+
+class SparseFieldsetsMixin:
+    """
+    Lets clients of the read endpoints pick the serialized fields with
+    `?fields=` or leave some out with `?omit=`, both comma separated.
+
+    Views can check `is_field_requested()` to skip the joins and
+    annotations backing fields that are not returned.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def get_query_param_list(self, name):
+        value = self.request.query_params.get(name, "")
+        return frozenset(item.strip() for item in value.split(",") if item.strip())
+
+    def get_sparse_fieldset(self):
+        """Return `(fields, omit)`, where `fields` is None to keep them all."""
+        request = getattr(self, "request", None)
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return None, frozenset()
+
+        fields = self.get_query_param_list(self.fields_query_param) or None
+        return fields, self.get_query_param_list(self.omit_query_param)
+
+    def is_field_requested(self, name):
+        fields, omit = self.get_sparse_fieldset()
+        return (fields is None or name in fields) and name not in omit
+
+    def trim_fields(self, items):
+        """Apply the sparse fieldset to already serialized `items`."""
+        fields, omit = self.get_sparse_fieldset()
+        if fields is None and not omit:
+            return items
+
+        return [
+            {
+                name: value
+                for name, value in item.items()
+                if self.is_field_requested(name)
+            }
+            for item in items
+        ]
+
+    def get_serializer_context(self):
+        fields, omit = self.get_sparse_fieldset()
+        return {**super().get_serializer_context(), "fields": fields, "omit": omit}
+
+
+class NestedWorkoutMixin:
+    # Views nested under `/workouts/<workout_pk>/` resolve the parent workout
+    # at most once per request with `get_workout()`. Routes that only touch
+    # the children check the ownership through a `workout__user` join instead.
+
+    workout_url_kwarg = "workout_pk"
+
+    def get_workout_queryset(self):
+        return Workout.objects.filter(user=self.request.user)
+
+    def get_workout(self):
+        if not hasattr(self, "_workout"):
+            self._workout = get_object_or_404(
+                self.get_workout_queryset(), pk=self.kwargs[self.workout_url_kwarg]
+            )
+
+        return self._workout
+
+    def get_workout_for_write(self):
+        """
+        Return the parent workout of a create or bulk write. Views override
+        it to prepare the workout for the written items first.
+        """
+        return self.get_workout()
+
+    def create(self, request, *args, **kwargs):
+        self.get_workout_for_write()
+        return super().create(request, *args, **kwargs)
+
+    def filter_by_workout(self, queryset):
+        if hasattr(self, "_workout"):
+            return queryset.filter(workout=self._workout)
+
+        try:
+            workout_pk = Workout._meta.pk.to_python(self.kwargs[self.workout_url_kwarg])
+        except DjangoValidationError:
+            raise Http404
+
+        return queryset.filter(workout_id=workout_pk, workout__user=self.request.user)
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            # Only a miss pays for the workout lookup, to report which one is
+            # missing.
+            self.get_workout()
+            raise
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        if self.request.method == "POST":
+            context["workout"] = self.get_workout()
+
+        return context
+
+
+class BulkModelMixin:
+    # Used along with `NestedWorkoutMixin`. The route is documented on the
+    # action, so the schema does not reuse a class docstring as the
+    # description of every other operation.
+
+    def get_bulk_serializer(self, *args, **kwargs):
+        return self.get_serializer(
+            *args,
+            many=True,
+            allow_empty=False,
+            max_length=settings.BULK_MAX_ITEMS,
+            **kwargs,
+        )
+
+    def get_bulk_instances(self, items):
+        pk_field = self.get_queryset().model._meta.pk
+        ids = set()
+        for item in items:
+            try:
+                ids.add(pk_field.to_python(item.get("id")))
+            except (AttributeError, DjangoValidationError):
+                pass
+
+        return {
+            str(pk): instance
+            for pk, instance in self.get_queryset().in_bulk(ids).items()
+        }
+
+    def get_bulk_response_data(self, instances):
+        # Reload the items with the joins of the list route, keeping their order.
+        reloaded = self.get_queryset().in_bulk([instance.pk for instance in instances])
+        serializer = self.get_serializer(
+            [reloaded[instance.pk] for instance in instances], many=True
+        )
+        return serializer.data
+
+    @action(detail=False, methods=["post", "patch", "delete"])
+    def bulk(self, request, *args, **kwargs):
+        """
+        `POST` creates a list of items, `PATCH` partially updates a list of
+        items, each carrying its `id`, and `DELETE` removes a list of ids.
+
+        Items are validated in one pass and written in one transaction. Any
+        invalid item rejects the whole request with a list of per-item errors.
+        """
+        if request.method == "DELETE":
+            return self.bulk_destroy(request)
+
+        # Invalid items raise inside the transaction, rolling back any change
+        # made to the workout.
+        with transaction.atomic():
+            workout = self.get_workout_for_write()
+
+            if request.method == "PATCH":
+                items = request.data if isinstance(request.data, list) else []
+                serializer = self.get_bulk_serializer(
+                    self.get_bulk_instances(items), data=request.data, partial=True
+                )
+                response_status = status.HTTP_200_OK
+            else:
+                serializer = self.get_bulk_serializer(data=request.data)
+                response_status = status.HTTP_201_CREATED
+
+            serializer.is_valid(raise_exception=True)
+            instances = serializer.save(workout=workout)
+
+        return Response(self.get_bulk_response_data(instances), status=response_status)
+
+    def bulk_destroy(self, request):
+        ids_field = serializers.ListField(
+            child=serializers.UUIDField(),
+            allow_empty=False,
+            max_length=settings.BULK_MAX_ITEMS,
+        )
+        ids = [str(pk) for pk in ids_field.run_validation(request.data)]
+
+        instances = self.get_bulk_instances([{"id": pk} for pk in ids])
+        errors = {
+            index: ["Not found."] for index, pk in enumerate(ids) if pk not in instances
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        self.get_queryset().filter(pk__in=ids).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
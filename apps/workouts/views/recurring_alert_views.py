@@ -1,11 +1,16 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from workouts.models import RecurringWorkoutAlert, Workout
+from workout_tracker.instrumentation import SerializerTimingMixin
+from workouts.models import RecurringWorkoutAlert
 from workouts.serializers import RecurringAlertSerializer
+from workouts.views.mixins import (
+    BulkModelMixin,
+    CursorPaginationMixin,
+    NestedWorkoutMixin,
+)
 
 
 @extend_schema_view(
@@ -15,49 +20,38 @@ from workouts.serializers import RecurringAlertSerializer
     update=extend_schema(tags=["recurring workout alerts"]),
     partial_update=extend_schema(tags=["recurring workout alerts"]),
     destroy=extend_schema(tags=["recurring workout alerts"]),
+    bulk=extend_schema(tags=["recurring workout alerts"]),
 )
-class RecurringAlertViews(viewsets.ModelViewSet):
+class RecurringAlertViews(
+    BulkModelMixin,
+    NestedWorkoutMixin,
+    CursorPaginationMixin,
+    SerializerTimingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = RecurringAlertSerializer
+    cursor_ordering = ("time", "id")
+    ordering = ("time",)
 
     def get_queryset(self):
-        workout = self.kwargs.get("workout") or get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-
-        return RecurringWorkoutAlert.objects.filter(workout=workout).order_by("time")
-
-    def get_serializer_context(self):
-        context = {
-            "request": self.request,
-            "format": self.format_kwarg,
-            "view": self,
-        }
-
-        if self.request.method == "POST":
-            context["workout"] = self.kwargs["workout"]
-
-        return context
+        queryset = self.filter_by_workout(RecurringWorkoutAlert.objects.all())
+        return queryset.order_by(*self.ordering)
 
     def list(self, request, *args, **kwargs):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-        self.kwargs["workout"] = workout
+        workout = self.get_workout()
 
         if not workout.is_recurrent():
             return Response(
                 {"detail": "The workout is not recurrent."},
                 status=status.HTTP_412_PRECONDITION_FAILED,
             )
+
         return super().list(request, *args, **kwargs)
 
-    def create(self, request, *args, **kwargs):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-        self.kwargs["workout"] = workout
+    def get_workout_for_write(self):
+        workout = self.get_workout()
 
         if not workout.is_recurrent():
             workout.switch_to_recurrent()
 
-        return super().create(request, *args, **kwargs)
+        return workout
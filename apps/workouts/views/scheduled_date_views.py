@@ -1,11 +1,16 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from workouts.models import ScheduledWorkoutDate, Workout
+from workout_tracker.instrumentation import SerializerTimingMixin
+from workouts.models import ScheduledWorkoutDate
 from workouts.serializers import ScheduledDateSerializer
+from workouts.views.mixins import (
+    BulkModelMixin,
+    CursorPaginationMixin,
+    NestedWorkoutMixin,
+)
 
 
 @extend_schema_view(
@@ -15,30 +20,25 @@ from workouts.serializers import ScheduledDateSerializer
     update=extend_schema(tags=["scheduled workout dates"]),
     partial_update=extend_schema(tags=["scheduled workout dates"]),
     destroy=extend_schema(tags=["scheduled workout dates"]),
+    bulk=extend_schema(tags=["scheduled workout dates"]),
 )
-class ScheduledDateViews(viewsets.ModelViewSet):
+class ScheduledDateViews(
+    BulkModelMixin,
+    NestedWorkoutMixin,
+    CursorPaginationMixin,
+    SerializerTimingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = ScheduledDateSerializer
+    cursor_ordering = ("datetime", "id")
+    ordering = ("datetime",)
 
     def get_queryset(self):
-        workout = self.kwargs.get("workout") or get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-
-        return ScheduledWorkoutDate.objects.filter(workout=workout).order_by("datetime")
-
-    def get_serializer_context(self):
-        context = {"request": self.request, "format": self.format_kwarg, "view": self}
-
-        if self.request.method == "POST":
-            context["workout"] = self.kwargs["workout"]
-
-        return context
+        queryset = self.filter_by_workout(ScheduledWorkoutDate.objects.all())
+        return queryset.order_by(*self.ordering)
 
     def list(self, request, *args, **kwargs):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-        self.kwargs["workout"] = workout
+        workout = self.get_workout()
 
         if not workout.is_scheduled():
             return Response(
@@ -48,13 +48,10 @@ class ScheduledDateViews(viewsets.ModelViewSet):
 
         return super().list(request, *args, **kwargs)
 
-    def create(self, request, *args, **kwargs):
-        workout = get_object_or_404(
-            Workout, pk=self.kwargs["workout_pk"], user=self.request.user
-        )
-        self.kwargs["workout"] = workout
+    def get_workout_for_write(self):
+        workout = self.get_workout()
 
         if not workout.is_scheduled():
             workout.switch_to_scheduled()
 
-        return super().create(request, *args, **kwargs)
+        return workout
@@ -1,13 +1,195 @@
+from django.db.models import Count, Exists, OuterRef, Prefetch
+from django.utils import timezone
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+
+from workout_tracker.instrumentation import SerializerTimingMixin
 from workouts import models, serializers
+from workouts.stats import get_workout_stats
+from workouts.views.comment_views import CommentViews
+from workouts.views.exercise_plan_views import ExercisePlanViews
+from workouts.views.mixins import (
+    ConditionalResponseMixin,
+    CursorPaginationMixin,
+    SparseFieldsetsMixin,
+    sparse_fieldset_parameters,
+)
+from workouts.views.recurring_alert_views import RecurringAlertViews
+from workouts.views.scheduled_date_views import ScheduledDateViews
+
+expand_parameter = OpenApiParameter(
+    "expand",
+    OpenApiTypes.STR,
+    description="Comma separated nested collections to include: exercise_plans, "
+    "scheduled_dates, recurring_alerts, comments.",
+)
 
 
-class WorkoutViews(viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(parameters=[expand_parameter, *sparse_fieldset_parameters]),
+    retrieve=extend_schema(parameters=[expand_parameter, *sparse_fieldset_parameters]),
+)
+class WorkoutViews(
+    ConditionalResponseMixin,
+    CursorPaginationMixin,
+    SparseFieldsetsMixin,
+    SerializerTimingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = serializers.WorkoutSerializer
+    expand_query_param = "expand"
 
     def get_queryset(self):
         authenticated_user = self.request.user
-        return models.Workout.objects.filter(user=authenticated_user).order_by(
-            "-created_at"
+
+        # Only annotate what the requested fields read.
+        annotations = {}
+        if self.is_field_requested("status"):
+            pending_dates = models.ScheduledWorkoutDate.objects.filter(
+                workout=OuterRef("pk"), datetime__gt=timezone.now()
+            )
+            annotations["has_pending_dates"] = Exists(pending_dates)
+        if self.is_field_requested("exercises"):
+            annotations["exercise_count"] = Count("exercise_plans")
+
+        expand_querysets = self.get_expand_querysets()
+        return (
+            models.Workout.objects.filter(user=authenticated_user)
+            .annotate(**annotations)
+            .prefetch_related(
+                *[
+                    Prefetch(name, queryset=expand_querysets[name])
+                    for name in self.get_expand()
+                ]
+            )
+            .order_by("-created_at")
+        )
+
+    def get_expand_querysets(self):
+        """Querysets of the expandable collections, sorted as their own routes."""
+        return {
+            "exercise_plans": models.ExercisePlan.objects.select_related(
+                "exercise__category"
+            ).order_by(*ExercisePlanViews.ordering),
+            "scheduled_dates": models.ScheduledWorkoutDate.objects.order_by(
+                *ScheduledDateViews.ordering
+            ),
+            "recurring_alerts": models.RecurringWorkoutAlert.objects.order_by(
+                *RecurringAlertViews.ordering
+            ),
+            "comments": models.WorkoutComment.objects.order_by(*CommentViews.ordering),
+        }
+
+    def get_expand(self):
+        if not hasattr(self, "_expand"):
+            names = [
+                name.strip()
+                for name in self.request.query_params.get(
+                    self.expand_query_param, ""
+                ).split(",")
+                if name.strip()
+            ]
+
+            unknown_names = set(names) - set(self.get_expand_querysets())
+            if unknown_names:
+                raise ValidationError(
+                    {
+                        self.expand_query_param: "Unknown collections: "
+                        f"{', '.join(sorted(unknown_names))}."
+                    }
+                )
+
+            # Collections left out by `?fields=` or `?omit=` aren't loaded.
+            self._expand = tuple(
+                name for name in dict.fromkeys(names) if self.is_field_requested(name)
+            )
+
+        return self._expand
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "expand": self.get_expand()}
+
+    def get_workout_version(self, workout):
+        return (
+            str(workout.id),
+            workout.updated_at.isoformat(),
+            getattr(workout, "has_pending_dates", None),
+            getattr(workout, "exercise_count", None),
+        )
+
+    def get_expanded_version(self, serializer):
+        # Nested collections carry no version of their own, so expanded
+        # responses are serialized before the ETag is known.
+        if not self.get_expand():
+            return None
+
+        return serializer.data
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            workouts = page
+            # Cursor pages are plain lists without a total count.
+            page_paginator = getattr(self.paginator.page, "paginator", None)
+            pagination_version = (
+                page_paginator.count if page_paginator else None,
+                self.paginator.get_next_link(),
+                self.paginator.get_previous_link(),
+            )
+        else:
+            workouts = list(queryset)
+            pagination_version = len(workouts)
+
+        serializer = self.get_serializer(workouts, many=True)
+        etag = self.get_etag(
+            pagination_version,
+            [self.get_workout_version(workout) for workout in workouts],
+            self.get_expanded_version(serializer),
         )
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        if page is not None:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        serializer = self.get_serializer(instance)
+        etag = self.get_etag(
+            self.get_workout_version(instance), self.get_expanded_version(serializer)
+        )
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        return Response(serializer.data, headers={"ETag": etag})
+
+    @extend_schema(responses={200: serializers.UserWorkoutStatsSerializer})
+    @action(
+        methods=["GET"],
+        detail=False,
+        serializer_class=serializers.UserWorkoutStatsSerializer,
+    )
+    def stats(self, request, *args, **kwargs):
+        """
+        Summary of the workouts of the authenticated user, with how many are
+        active, completed and pending, and their exercise plans and comments.
+        """
+        serializer = self.get_serializer(get_workout_stats(request.user.pk))
+        etag = self.get_etag(serializer.data)
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        return Response(serializer.data, headers={"ETag": etag})
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class RequestMetrics:
+    """
+    SQL queries and durations of a single request.
+
+    Instances are installed as an execute wrapper on every database
+    connection, so each query run while handling the request is counted.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.durations = {"db": 0.0, "serializer": 0.0}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.durations["db"] += time.perf_counter() - start
+
+    @contextmanager
+    def timing(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def timed(self, name, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.timing(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def get_server_timing(self, total):
+        entries = [
+            f'db;dur={self.durations["db"] * 1000:.2f};desc="{self.queries} queries"'
+        ]
+        entries += [
+            f"{name};dur={duration * 1000:.2f}"
+            for name, duration in self.durations.items()
+            if name != "db"
+        ]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+class EndpointMetrics:
+    """Process-local aggregates of the requests handled by each endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, metrics, total):
+        with self._lock:
+            stats = self._endpoints.setdefault(
+                endpoint,
+                {"requests": 0, "queries": 0, "max_queries": 0, "durations": {}},
+            )
+            stats["requests"] += 1
+            stats["queries"] += metrics.queries
+            stats["max_queries"] = max(stats["max_queries"], metrics.queries)
+
+            for name, duration in {**metrics.durations, "total": total}.items():
+                stats["durations"][name] = stats["durations"].get(name, 0.0) + duration
+
+    def stats(self):
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stats["requests"],
+                    "avg_queries": stats["queries"] / stats["requests"],
+                    "max_queries": stats["max_queries"],
+                    "query_budget": get_query_budget(endpoint),
+                    **{
+                        f"avg_{name}_ms": duration * 1000 / stats["requests"]
+                        for name, duration in stats["durations"].items()
+                    },
+                }
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+endpoint_metrics = EndpointMetrics()
+
+
+def get_endpoint(request):
+    """Name requests by method and URL name, e.g. `GET workouts-list`."""
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None or not resolver_match.view_name:
+        return None
+
+    return f"{request.method} {resolver_match.view_name}"
+
+
+def get_query_budget(endpoint):
+    return getattr(settings, "QUERY_BUDGETS", {}).get(endpoint)
+
+
+def check_query_budget(endpoint, queries):
+    budget = get_query_budget(endpoint)
+    if budget is None or queries <= budget:
+        return
+
+    message = f"{endpoint} ran {queries} queries, over its budget of {budget}."
+    if getattr(settings, "QUERY_BUDGETS_STRICT", False):
+        raise QueryBudgetExceeded(message)
+
+    logger.warning(message)
+
+
+class InstrumentationMiddleware:
+    """
+    Counts the SQL queries and times each request, answering with a
+    `Server-Timing` header and feeding `endpoint_metrics`.
+
+    Queries run while a streaming response is consumed happen after the
+    middleware returns and are not counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = request.metrics = RequestMetrics()
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            response = self.get_response(request)
+
+        total = time.perf_counter() - start
+
+        endpoint = get_endpoint(request)
+        if endpoint is None:
+            return response
+
+        response["Server-Timing"] = metrics.get_server_timing(total)
+        endpoint_metrics.record(endpoint, metrics, total)
+        check_query_budget(endpoint, metrics.queries)
+
+        return response
+
+
+class SerializerTimingMixin:
+    # Adds the time spent validating and representing data with the view
+    # serializer to the request metrics, as the `serializer` timing. A
+    # comment, as the schema would show a view docstring on every operation.
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+
+        metrics = getattr(self.request, "metrics", None)
+        if metrics is not None:
+            for name in ("run_validation", "to_representation"):
+                method = getattr(serializer, name)
+                setattr(serializer, name, metrics.timed("serializer", method))
+
+        return serializer
+
+
+class MetricsView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(tags=["metrics"], responses={200: OpenApiTypes.OBJECT})
+    def get(self, request, *args, **kwargs):
+        return Response(endpoint_metrics.stats())
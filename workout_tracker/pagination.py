@@ -3,3 +3,11 @@ from rest_framework import pagination
 
 class PageNumberPagination(pagination.PageNumberPagination):
     page_size_query_param = "page_size"
+
+
+class CursorPagination(pagination.CursorPagination):
+    page_size_query_param = "page_size"
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = ordering
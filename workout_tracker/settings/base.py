@@ -78,6 +78,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
+    "workout_tracker.instrumentation.InstrumentationMiddleware",
 ]
 
 ROOT_URLCONF = "workout_tracker.urls"
@@ -116,6 +117,18 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+CATALOG_CACHE_ALIAS = "default"
+CATALOG_CACHE_TIMEOUT = env.int("CATALOG_CACHE_TIMEOUT", default=60 * 60)
+CATALOG_CACHE_MAXSIZE = env.int("CATALOG_CACHE_MAXSIZE", default=256)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -188,6 +201,37 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Maximum number of items accepted by each request to a bulk endpoint
+BULK_MAX_ITEMS = env.int("BULK_MAX_ITEMS", default=500)
+
+# Maximum number of SQL queries of each endpoint, named by method and URL
+# name. Requests over budget are logged, or raise when QUERY_BUDGETS_STRICT
+# is set, as the test suite does. Budgets count the authentication query.
+QUERY_BUDGETS = {
+    "GET workouts-list": 7,
+    "GET workouts-detail": 6,
+    "GET workouts-stats": 4,
+    "GET exercise-categories-list": 2,
+    "GET exercise-categories-exercises": 3,
+    "GET exercise-plans-list": 4,
+    "GET exercise-plans-detail": 3,
+    "POST exercise-plans-bulk": 8,
+    "PATCH exercise-plans-bulk": 7,
+    "GET comments-list": 4,
+    "GET comments-detail": 3,
+    "GET scheduled-dates-list": 4,
+    "GET scheduled-dates-detail": 3,
+    "POST scheduled-dates-bulk": 17,
+    "PATCH scheduled-dates-bulk": 11,
+    "GET recurring-alerts-list": 4,
+    "GET recurring-alerts-detail": 3,
+    "POST recurring-alerts-bulk": 12,
+    "PATCH recurring-alerts-bulk": 8,
+    "GET calendar-list": 7,
+    "GET analytics-volume": 2,
+}
+QUERY_BUDGETS_STRICT = env.bool("QUERY_BUDGETS_STRICT", default=False)
+
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
@@ -256,6 +300,28 @@ CELERY_BROKER_CONNECTION_RETRY = True
 CELERY_BROKER_CONNECTION_MAX_RETRIES = 5
 CELERY_BROKER_CONNECTION_RETRY_INTERVAL = 2.0
 
+# Notifications
+# Number of alerts or dates handled by each notification subtask
+NOTIFICATION_BATCH_SIZE = env.int("NOTIFICATION_BATCH_SIZE", default=500)
+NOTIFICATION_BACKEND = env.str(
+    "NOTIFICATION_BACKEND", default="workouts.notifications.EmailBackend"
+)
+NOTIFICATION_WEBHOOK_URL = env.str("NOTIFICATION_WEBHOOK_URL", default="")
+NOTIFICATION_WEBHOOK_TIMEOUT = env.float("NOTIFICATION_WEBHOOK_TIMEOUT", default=5.0)
+# Retries, with exponential backoff, of a batch whose delivery failed
+NOTIFICATION_MAX_RETRIES = env.int("NOTIFICATION_MAX_RETRIES", default=5)
+# Minutes missed by the notification tasks (e.g. worker downtime) that are
+# still delivered on the next run
+NOTIFICATION_CATCH_UP_MINUTES = env.int("NOTIFICATION_CATCH_UP_MINUTES", default=15)
+NOTIFICATION_DISPATCH_RETENTION_DAYS = env.int(
+    "NOTIFICATION_DISPATCH_RETENTION_DAYS", default=7
+)
+# Days ahead for which workout occurrences are materialized
+WORKOUT_OCCURRENCE_HORIZON_DAYS = env.int("WORKOUT_OCCURRENCE_HORIZON_DAYS", default=14)
+# Calendar ranges wider than CALENDAR_STREAMING_DAYS are streamed
+CALENDAR_MAX_RANGE_DAYS = env.int("CALENDAR_MAX_RANGE_DAYS", default=366)
+CALENDAR_STREAMING_DAYS = env.int("CALENDAR_STREAMING_DAYS", default=31)
+
 
 # DRF SPECTACULAR
 SPECTACULAR_SETTINGS = {
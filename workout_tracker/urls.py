@@ -6,6 +6,8 @@ from drf_spectacular.views import (
     SpectacularRedocView,
 )
 
+from workout_tracker.instrumentation import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
@@ -19,6 +21,7 @@ urlpatterns = [
         SpectacularRedocView.as_view(url_name="schema"),
         name="redoc",
     ),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
     path("api/auth/", include("users.urls")),
     path("api/", include("workouts.urls")),
     path("", include("rest_framework.urls")),